@@ -13,7 +13,7 @@ import base64
 import io
 
 import numpy as np
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, JpegImagePlugin
 import imagehash
 
 try:  # ``opencv`` is an optional dependency
@@ -51,6 +51,24 @@ def normalize_card_image(image: Image.Image, size: Tuple[int, int] = (256, 256))
     return np.array(image)
 
 
+# JPEG scans are decoded at no less than this size before normalisation;
+# twice the normalised size keeps the LANCZOS downscale well sampled
+DRAFT_SIZE: Tuple[int, int] = (512, 512)
+
+
+def draft_for_fingerprint(image: Image.Image) -> None:
+    """Let the decoder of a freshly opened ``image`` skip unneeded pixels.
+
+    JPEG files are decoded at the smallest 1/2, 1/4 or 1/8 scale that stays
+    above :data:`DRAFT_SIZE`; other formats and already loaded images are left
+    unchanged.  Call it only on images opened for fingerprinting, as the
+    full resolution is no longer available afterwards.
+    """
+
+    if isinstance(image, JpegImagePlugin.JpegImageFile):
+        image.draft(None, DRAFT_SIZE)
+
+
 # ---------------------------------------------------------------------------
 # hashing utilities
 # ---------------------------------------------------------------------------
@@ -188,6 +206,7 @@ def match_orb(des1: np.ndarray, des2: np.ndarray, ratio: float = 0.75) -> int:
 
 __all__ = [
     "normalize_card_image",
+    "draft_for_fingerprint",
     "compute_fingerprint",
     "pack_ndarray",
     "unpack_ndarray",
@@ -29,7 +29,9 @@ Hamming distances of the global and tiled pHashes as well as the dHash.  When
 ORB descriptors are present the amount of good matches is subtracted from the
 distance so that descriptors with more matches rank higher.  This provides
 reasonably stable results without having to rely on any external libraries or
-extensions in SQLite itself.
+extensions in SQLite itself.  Decoded fingerprints are kept in memory after the
+first query, and the hash distances to all of them are computed in one
+vectorised step.
 """
 
 from __future__ import annotations
@@ -45,6 +47,7 @@ from PIL import Image
 
 from fingerprint import (
     compute_fingerprint,
+    draft_for_fingerprint,
     hamming_distance,
     match_orb,
     pack_ndarray,
@@ -73,6 +76,18 @@ class Candidate:
     distance: int
 
 
+def _hash_bits(fp: Mapping[str, np.ndarray]) -> np.ndarray:
+    """Return the pHash, dHash and tile pHashes of ``fp`` as one bit vector."""
+
+    return np.concatenate(
+        [
+            np.asarray(fp["phash"], dtype=bool).ravel(),
+            np.asarray(fp["dhash"], dtype=bool).ravel(),
+            np.asarray(fp["tile_phash"], dtype=bool).ravel(),
+        ]
+    )
+
+
 # ---------------------------------------------------------------------------
 # main database wrapper
 # ---------------------------------------------------------------------------
@@ -87,6 +102,16 @@ class HashDB:
         self.conn = sqlite3.connect(self.path, check_same_thread=False)
         # rows as dict-like objects
         self.conn.row_factory = sqlite3.Row
+        # decoded fingerprints of all stored rows, loaded on the first query
+        # and extended by inserts so lookups no longer re-read the table;
+        # rows committed by other connections are picked up when SQLite's
+        # ``data_version`` changes
+        self._index: Optional[List[Tuple[Mapping[str, np.ndarray], np.ndarray, Mapping[str, str]]]] = None
+        self._index_version: Optional[int] = None
+        self._index_max_id = 0
+        # bit vector length -> (index positions, stacked hash bits) for the
+        # vectorised distance step; extended on insert like ``_index``
+        self._bit_matrices: dict[int, Tuple[List[int], np.ndarray]] = {}
         self._ensure_schema()
 
     # ------------------------------------------------------------------
@@ -144,6 +169,7 @@ class HashDB:
                 return compute_fingerprint(source)
         # otherwise treat the argument as a filesystem path
         with Image.open(source) as img:
+            draft_for_fingerprint(img)
             try:
                 return compute_fingerprint(img, use_orb=True)
             except TypeError:
@@ -163,6 +189,7 @@ class HashDB:
         meta_dict = dict(meta or {})
         meta_dict.update(kwargs)
         with Image.open(image_path) as img:
+            draft_for_fingerprint(img)
             try:
                 fp = compute_fingerprint(img, use_orb=True)
             except TypeError:
@@ -198,7 +225,17 @@ class HashDB:
                     (phash, dhash, tile_phash, orb, json.dumps(meta_dict, ensure_ascii=False)),
                 )
                 self.conn.commit()
-                return int(cur.lastrowid)
+                row_id = int(cur.lastrowid)
+                if self._index is not None:
+                    stored = {
+                        "phash": unpack_ndarray(phash),
+                        "dhash": unpack_ndarray(dhash),
+                        "tile_phash": unpack_ndarray(tile_phash),
+                        "orb": unpack_ndarray(orb),
+                    }
+                    meta_row = json.loads(json.dumps(meta_dict, ensure_ascii=False))
+                    self._append_to_index(row_id, stored, meta_row)
+                return row_id
             except sqlite3.IntegrityError:
                 # another process might have inserted the same fingerprint concurrently
                 cur.execute(
@@ -250,31 +287,117 @@ class HashDB:
         """
 
         fp_query = self._prepare_fp(source)
-
-        with self._lock:
-            cur = self.conn.cursor()
-            cur.execute("SELECT phash, dhash, tile_phash, orb, meta FROM cards")
-            rows = cur.fetchall()
+        index, matrices = self._load_index()
+
+        # the hash part of the distance is computed for all rows at once; the
+        # ORB matches can lower a row's score by at most the number of query
+        # descriptors, so rows whose hash distance exceeds ``max_distance``
+        # by more than that are skipped without running the matcher
+        query_bits = _hash_bits(fp_query)
+        hash_dists: List[Optional[int]] = [None] * len(index)
+        same_shape, matrix = matrices.get(query_bits.size, ([], None))
+        if same_shape:
+            counts = np.count_nonzero(matrix != query_bits, axis=1)
+            for i, count in zip(same_shape, counts):
+                hash_dists[i] = int(count)
+        query_orb = fp_query.get("orb", np.empty((0, 32), dtype=np.uint8))
+        max_orb = len(query_orb)
 
         results: List[Candidate] = []
-        for row in rows:
-            fp_row = {
-                "phash": unpack_ndarray(row["phash"]),
-                "dhash": unpack_ndarray(row["dhash"]),
-                "tile_phash": unpack_ndarray(row["tile_phash"]),
-                "orb": unpack_ndarray(row["orb"]) if row["orb"] else np.empty((0, 32), dtype=np.uint8),
-            }
-            dist = self._distance(fp_query, fp_row)
+        for (fp_row, _bits, meta), hash_dist in zip(index, hash_dists):
+            if hash_dist is None:
+                dist = self._distance(fp_query, fp_row)
+            else:
+                if max_distance is not None and hash_dist - max_orb > max_distance:
+                    continue
+                dist = max(0, hash_dist - match_orb(query_orb, fp_row["orb"]))
             if max_distance is not None and dist > max_distance:
                 continue
-            meta = json.loads(row["meta"] or "{}")
-            results.append(Candidate(meta=meta, distance=dist))
+            results.append(Candidate(meta=dict(meta), distance=dist))
             if max_distance is not None and len(results) >= limit:
                 break
 
         results.sort(key=lambda c: c.distance)
         return results[:limit]
 
+    def _load_index(
+        self,
+    ) -> Tuple[
+        List[Tuple[Mapping[str, np.ndarray], np.ndarray, Mapping[str, str]]],
+        dict[int, Tuple[List[int], np.ndarray]],
+    ]:
+        """Return the decoded fingerprints of all stored cards.
+
+        The second item maps a hash bit length to the positions of the rows
+        with that length and their stacked bits.  Both are snapshots that
+        later inserts do not modify.
+        """
+
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("PRAGMA data_version")
+            version = cur.fetchone()[0]
+            if self._index is None:
+                self._reload_index(cur)
+            elif version != self._index_version:
+                # another connection committed; pick up its new rows and fall
+                # back to a full reload if rows were removed or reordered
+                cur.execute(
+                    "SELECT id, phash, dhash, tile_phash, orb, meta FROM cards WHERE id > ? ORDER BY id",
+                    (self._index_max_id,),
+                )
+                for row in cur.fetchall():
+                    self._append_to_index(int(row["id"]), *self._decode_row(row))
+                cur.execute("SELECT count(*) FROM cards")
+                if cur.fetchone()[0] != len(self._index):
+                    self._reload_index(cur)
+            self._index_version = version
+            return list(self._index), dict(self._bit_matrices)
+
+    @staticmethod
+    def _decode_row(row) -> Tuple[Mapping[str, np.ndarray], Mapping[str, str]]:
+        fp_row = {
+            "phash": unpack_ndarray(row["phash"]),
+            "dhash": unpack_ndarray(row["dhash"]),
+            "tile_phash": unpack_ndarray(row["tile_phash"]),
+            "orb": unpack_ndarray(row["orb"]) if row["orb"] else np.empty((0, 32), dtype=np.uint8),
+        }
+        return fp_row, json.loads(row["meta"] or "{}")
+
+    def _reload_index(self, cur) -> None:
+        """Decode every stored row into ``_index``; the lock must be held."""
+
+        cur.execute("SELECT id, phash, dhash, tile_phash, orb, meta FROM cards ORDER BY id")
+        self._index = []
+        self._index_max_id = 0
+        self._bit_matrices = {}
+        rows: dict[int, List[int]] = {}
+        bits_by_size: dict[int, List[np.ndarray]] = {}
+        for row in cur.fetchall():
+            fp_row, meta = self._decode_row(row)
+            bits = _hash_bits(fp_row)
+            rows.setdefault(bits.size, []).append(len(self._index))
+            bits_by_size.setdefault(bits.size, []).append(bits)
+            self._index.append((fp_row, bits, meta))
+            self._index_max_id = max(self._index_max_id, int(row["id"]))
+        for size, positions in rows.items():
+            self._bit_matrices[size] = (positions, np.stack(bits_by_size[size]))
+
+    def _append_to_index(
+        self, row_id: int, fp_row: Mapping[str, np.ndarray], meta: Mapping[str, str]
+    ) -> None:
+        """Add a stored row to ``_index``; the lock must be held."""
+
+        bits = _hash_bits(fp_row)
+        positions, matrix = self._bit_matrices.get(bits.size, ([], None))
+        # new objects, so snapshots handed out by ``_load_index`` stay intact
+        self._bit_matrices[bits.size] = (
+            positions + [len(self._index)],
+            bits[None, :] if matrix is None else np.vstack([matrix, bits]),
+        )
+        self._index.append((fp_row, bits, meta))
+        self._index_max_id = max(self._index_max_id, row_id)
+
     def best_match(self, source, max_distance: Optional[int] = None) -> Optional[Candidate]:
         """Return the single best match for ``source`` or ``None``.
 
@@ -23,6 +23,15 @@ COLLECTION_EXPORT_CSV = os.getenv("COLLECTION_EXPORT_CSV") or os.getenv(
 WAREHOUSE_CSV_MTIME: Optional[float] = None
 _inventory_stats_cache: Optional[Tuple[int, float, int, float]] = None
 _inventory_stats_path: Optional[str] = None
+_inventory_stats_size: Optional[int] = None
+
+# warehouse code -> row index for ``get_row_by_code`` and the normalised
+# ``(name, number, set)`` -> ``[(variant, row), ...]`` index for
+# ``find_duplicates``; both are keyed on ``(path, mtime, size)`` so they are
+# rebuilt only when the file changes
+_code_index: Optional[dict[str, dict[str, str]]] = None
+_dup_index: Optional[dict[tuple[str, str, str], list[tuple[str, dict[str, str]]]]] = None
+_code_index_key: Optional[tuple] = None
 
 # column order for exported collection CSV files
 COLLECTION_FIELDNAMES = [
@@ -160,34 +169,17 @@ def find_duplicates(
         List of matching rows including warehouse codes.
     """
 
-    matches = []
     number = _sanitize_number(str(number))
-    name_norm = normalize(name)
-    set_norm = normalize(set_name)
+    key = (normalize(name), number, normalize(set_name))
     variant_norm = normalize(variant) if variant else None
 
-    if not os.path.exists(WAREHOUSE_CSV):
-        return matches
-
-    try:
-        with open(WAREHOUSE_CSV, encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter=";")
-            for row in reader:
-                row_number = _sanitize_number(str(row.get("number", "")))
-                row_name = normalize(row.get("name") or "")
-                row_set = normalize(row.get("set") or "")
-                row_variant = normalize(row.get("variant") or "common") or "common"
-                if (
-                    row_name == name_norm
-                    and row_number == number
-                    and row_set == set_norm
-                    and (variant_norm is None or row_variant == variant_norm)
-                ):
-                    matches.append(row)
-    except OSError:
-        pass
-
-    return matches
+    if _load_code_index(WAREHOUSE_CSV) is None:
+        return []
+    return [
+        dict(row)
+        for row_variant, row in (_dup_index or {}).get(key, ())
+        if variant_norm is None or row_variant == variant_norm
+    ]
 
 
 def get_row_by_code(code: str, path: str = WAREHOUSE_CSV) -> Optional[dict[str, str]]:
@@ -210,16 +202,66 @@ def get_row_by_code(code: str, path: str = WAREHOUSE_CSV) -> Optional[dict[str,
     code = (code or "").strip()
     if not code:
         return None
+    index = _load_code_index(path)
+    if index is None:
+        return None
+    row = index.get(code)
+    return dict(row) if row is not None else None
+
+
+def _load_code_index(path: str) -> Optional[dict[str, dict[str, str]]]:
+    """Return a cached ``warehouse_code`` -> row mapping for ``path``.
+
+    The duplicate index used by :func:`find_duplicates` is built in the same
+    pass and stored in ``_dup_index``.
+    """
+
+    global _code_index, _dup_index, _code_index_key
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (path, st.st_mtime, st.st_size)
+    if _code_index is not None and _code_index_key == key:
+        return _code_index
+
+    index: dict[str, dict[str, str]] = {}
+    dups: dict[tuple[str, str, str], list[tuple[str, dict[str, str]]]] = {}
     try:
         with open(path, encoding="utf-8") as f:
             reader = csv.DictReader(f, delimiter=";")
             for row in reader:
-                codes = [c.strip() for c in str(row.get("warehouse_code") or "").split(";") if c.strip()]
-                if code in codes:
-                    return row
+                dup_key = (
+                    normalize(row.get("name") or ""),
+                    _sanitize_number(str(row.get("number", ""))),
+                    normalize(row.get("set") or ""),
+                )
+                row_variant = normalize(row.get("variant") or "common") or "common"
+                dups.setdefault(dup_key, []).append((row_variant, row))
+                for c in str(row.get("warehouse_code") or "").split(";"):
+                    c = c.strip()
+                    if c:
+                        # keep the first row for codes listed more than once
+                        index.setdefault(c, row)
     except OSError:
         return None
-    return None
+    _code_index = index
+    _dup_index = dups
+    _code_index_key = key
+    return index
+
+
+def _invalidate_code_index() -> None:
+    """Drop the cached code and duplicate indexes after rewriting the warehouse CSV.
+
+    Toggling ``sold`` keeps the file size, so a rewrite within the mtime
+    resolution would otherwise go unnoticed.
+    """
+
+    global _code_index, _dup_index, _code_index_key
+    _code_index = None
+    _dup_index = None
+    _code_index_key = None
 
 
 def mark_codes_as_sold(codes: Iterable[str], path: Optional[str] = None) -> int:
@@ -245,24 +287,34 @@ def mark_codes_as_sold(codes: Iterable[str], path: Optional[str] = None) -> int:
     if path is None:
         path = WAREHOUSE_CSV
 
+    # plain lists indexed by column position; no per-row dict is built on
+    # read or re-mapped on write
     try:
         with open(path, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, delimiter=";")
-            fieldnames = reader.fieldnames or WAREHOUSE_FIELDNAMES
-            rows = list(reader)
+            reader = csv.reader(f, delimiter=";")
+            header = next(reader, None) or list(WAREHOUSE_FIELDNAMES)
+            rows = [raw for raw in reader if raw]
     except OSError:
         return 0
 
+    if "sold" not in header:
+        header = header + ["sold"]
+    width = len(header)
+    code_idx = header.index("warehouse_code") if "warehouse_code" in header else -1
+    sold_idx = header.index("sold")
+
     updated = 0
-    for row in rows:
+    for raw in rows:
+        if len(raw) < width:
+            raw += [""] * (width - len(raw))
+        if code_idx < 0:
+            continue
         row_codes = {
-            code.strip()
-            for code in str(row.get("warehouse_code") or "").split(";")
-            if code.strip()
+            code.strip() for code in raw[code_idx].split(";") if code.strip()
         }
         if row_codes and row_codes.intersection(normalized):
-            if str(row.get("sold") or "").strip().lower() not in {"1", "true", "yes"}:
-                row["sold"] = "1"
+            if raw[sold_idx].strip().lower() not in {"1", "true", "yes"}:
+                raw[sold_idx] = "1"
                 updated += 1
 
     if not updated:
@@ -270,11 +322,12 @@ def mark_codes_as_sold(codes: Iterable[str], path: Optional[str] = None) -> int:
 
     try:
         with open(path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=";")
-            writer.writeheader()
+            writer = csv.writer(f, delimiter=";")
+            writer.writerow(header)
             writer.writerows(rows)
     except OSError:
         return 0
+    _invalidate_code_index()
 
     try:
         get_inventory_stats(path, force=True)
@@ -283,6 +336,80 @@ def mark_codes_as_sold(codes: Iterable[str], path: Optional[str] = None) -> int:
     return updated
 
 
+def set_sold_flag(
+    code: str, sold: Optional[bool] = None, path: Optional[str] = None
+) -> Optional[str]:
+    """Set the ``sold`` column of the row whose ``warehouse_code`` is ``code``.
+
+    Rows are streamed into a temporary file that replaces ``path`` once
+    written.  Only the rows up to the target are parsed and re-encoded; the
+    remainder of the file is copied verbatim.  A file without a ``sold``
+    column is rewritten in full once to add it.
+
+    Parameters
+    ----------
+    code:
+        Warehouse code of the row to update.
+    sold:
+        New state of the flag; ``None`` toggles the current value.
+    path:
+        Optional path to the warehouse CSV. Defaults to :data:`WAREHOUSE_CSV`.
+
+    Returns
+    -------
+    Optional[str]
+        The value written to the ``sold`` column or ``None`` when the file
+        or the row does not exist.
+    """
+
+    if path is None:
+        path = WAREHOUSE_CSV
+    tmp_path = f"{path}.tmp"
+    value: Optional[str] = None
+    try:
+        with open(path, encoding="utf-8", newline="") as src, open(
+            tmp_path, "w", encoding="utf-8", newline=""
+        ) as dst:
+            reader = csv.reader(src, delimiter=";")
+            writer = csv.writer(dst, delimiter=";")
+            header = next(reader, [])
+            add_column = "sold" not in header
+            if add_column:
+                header = header + ["sold"]
+            writer.writerow(header)
+            code_idx = header.index("warehouse_code") if "warehouse_code" in header else -1
+            sold_idx = header.index("sold")
+            for raw in reader:
+                if value is None and 0 <= code_idx < len(raw) and raw[code_idx] == code:
+                    raw += [""] * (len(header) - len(raw))
+                    current = raw[sold_idx].lower() in {"1", "true", "yes"}
+                    if sold is None:
+                        sold = not current
+                    value = raw[sold_idx] = "1" if sold else ""
+                    writer.writerow(raw)
+                    if not add_column:
+                        # remaining rows are unchanged; copy them as-is
+                        dst.write(src.read())
+                        break
+                    continue
+                if add_column:
+                    raw += [""] * (len(header) - len(raw))
+                writer.writerow(raw)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return None
+
+    if value is None:
+        os.remove(tmp_path)
+        return None
+    os.replace(tmp_path, path)
+    _invalidate_code_index()
+    return value
+
+
 def get_inventory_stats(path: str = WAREHOUSE_CSV, force: bool = False):
     """Return statistics for both unsold and sold items in the warehouse CSV.
 
@@ -305,24 +432,29 @@ def get_inventory_stats(path: str = WAREHOUSE_CSV, force: bool = False):
     total_sold = 0.0
 
     global WAREHOUSE_CSV_MTIME, _inventory_stats_cache, _inventory_stats_path
+    global _inventory_stats_size
 
-    # Determine current modification time if the file exists
+    # One ``stat`` gives both cache keys; the size also catches rewrites
+    # that land within the filesystem's mtime resolution.
     try:
-        current_mtime = os.path.getmtime(path)
+        st = os.stat(path)
     except OSError:
-        current_mtime = None
+        st = None
+    current_mtime = st.st_mtime if st is not None else None
+    current_size = st.st_size if st is not None else None
 
     cache_valid = (
         not force
         and _inventory_stats_cache is not None
         and _inventory_stats_path == path
         and WAREHOUSE_CSV_MTIME == current_mtime
+        and _inventory_stats_size == current_size
     )
 
     if cache_valid:
         return _inventory_stats_cache
 
-    if not os.path.exists(path):
+    if st is None:
         _inventory_stats_cache = (
             count_unsold,
             total_unsold,
@@ -331,6 +463,7 @@ def get_inventory_stats(path: str = WAREHOUSE_CSV, force: bool = False):
         )
         _inventory_stats_path = path
         WAREHOUSE_CSV_MTIME = current_mtime
+        _inventory_stats_size = current_size
         return _inventory_stats_cache
 
     with open(path, encoding="utf-8") as f:
@@ -358,6 +491,7 @@ def get_inventory_stats(path: str = WAREHOUSE_CSV, force: bool = False):
     )
     _inventory_stats_path = path
     WAREHOUSE_CSV_MTIME = current_mtime
+    _inventory_stats_size = current_size
     return _inventory_stats_cache
 
 
@@ -6,6 +6,8 @@ from collections import defaultdict
 from datetime import date, timedelta
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 try:  # pragma: no cover - allow running as a script
     from . import csv_utils
 except Exception:  # pragma: no cover
@@ -35,6 +37,23 @@ def _load_rows(path: str) -> List[dict]:
         return list(reader)
 
 
+def _daily_counts(
+    ordinals: List[int], sold: List[bool], start_ordinal: int, ndays: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return per-day ``added`` and ``sold`` counts for ``ndays`` days.
+
+    ``ordinals`` holds :meth:`date.toordinal` values which must all fall
+    inside the window starting at ``start_ordinal``.  Both counts are
+    accumulated with :func:`numpy.bincount` in a single pass.
+    """
+    offsets = np.asarray(ordinals, dtype=np.int64) - start_ordinal
+    added = np.bincount(offsets, minlength=ndays)
+    sold_counts = np.bincount(
+        offsets, weights=np.asarray(sold, dtype=np.int64), minlength=ndays
+    ).astype(np.int64)
+    return added, sold_counts
+
+
 def get_statistics(start: date, end: date, path: str | None = None) -> Dict:
     """Return aggregated warehouse statistics between ``start`` and ``end``.
 
@@ -67,7 +86,8 @@ def get_statistics(start: date, end: date, path: str | None = None) -> Dict:
     sold_count = 0
     unsold_count = 0
 
-    daily: Dict[str, Dict[str, int]] = {}
+    day_ordinals: List[int] = []
+    day_sold: List[bool] = []
     sets_by_count: Dict[str, int] = defaultdict(int)
     sets_by_value: Dict[str, float] = defaultdict(float)
     boxes_by_count: Dict[int, int] = defaultdict(int)
@@ -93,11 +113,8 @@ def get_statistics(start: date, end: date, path: str | None = None) -> Dict:
 
         added = _parse_date(str(row.get("added_at") or ""))
         if added is not None:
-            key = added.isoformat()
-            stats = daily.setdefault(key, {"added": 0, "sold": 0})
-            stats["added"] += 1
-            if sold:
-                stats["sold"] += 1
+            day_ordinals.append(added.toordinal())
+            day_sold.append(sold)
 
         set_name = row.get("set") or ""
         sets_by_count[set_name] += 1
@@ -114,11 +131,18 @@ def get_statistics(start: date, end: date, path: str | None = None) -> Dict:
             boxes_by_count[box] += 1
             boxes_by_value[box] += price
 
-    # ensure every day in the range is present
-    cur = start
-    while cur <= end:
-        daily.setdefault(cur.isoformat(), {"added": 0, "sold": 0})
-        cur += timedelta(days=1)
+    # every day in the range is present, including days without rows
+    ndays = max(0, end.toordinal() - start.toordinal() + 1)
+    added_counts, sold_counts = _daily_counts(
+        day_ordinals, day_sold, start.toordinal(), ndays
+    )
+    daily: Dict[str, Dict[str, int]] = {
+        (start + timedelta(days=i)).isoformat(): {
+            "added": int(added_counts[i]),
+            "sold": int(sold_counts[i]),
+        }
+        for i in range(ndays)
+    }
 
     def _sort_items(d: Dict) -> List[Tuple]:
         return sorted(d.items(), key=lambda x: (-x[1], x[0]))[:5]
@@ -130,7 +154,7 @@ def get_statistics(start: date, end: date, path: str | None = None) -> Dict:
 
     return {
         "cumulative": {"count": cumulative_count, "total_value": cumulative_value},
-        "daily": dict(sorted(daily.items())),
+        "daily": daily,
         "top_sets_by_count": _sort_items(sets_by_count),
         "top_sets_by_value": _sort_items(sets_by_value),
         "top_boxes_by_count": _sort_items(boxes_by_count),
@@ -143,6 +167,27 @@ def get_statistics(start: date, end: date, path: str | None = None) -> Dict:
     }
 
 
+def daily_series(
+    daily: Dict[str, Dict[str, int]],
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Return dates and per-day ``added``/``sold`` counts from ``daily``.
+
+    ``daily`` is the mapping returned under the ``"daily"`` key of
+    :func:`get_statistics`.  The counts are returned as ``int64`` arrays so
+    they can be passed straight to plotting code.
+    """
+    dates = list(daily)
+    values = daily.values()
+    count = len(dates)
+    added = np.fromiter(
+        (v.get("added", 0) for v in values), dtype=np.int64, count=count
+    )
+    sold = np.fromiter(
+        (v.get("sold", 0) for v in values), dtype=np.int64, count=count
+    )
+    return dates, added, sold
+
+
 def export_statistics_csv(data: Dict, path: str) -> None:
     """Write ``data`` returned from :func:`get_statistics` to ``path``."""
     with open(path, "w", newline="", encoding="utf-8") as f:
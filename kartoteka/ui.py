@@ -10,22 +10,37 @@ import json
 import requests
 import base64
 import mimetypes
+import hashlib
 import re
 import asyncio
 import datetime
 import time
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from queue import Empty, SimpleQueue
 from dotenv import load_dotenv, set_key
 from itertools import combinations
+from operator import itemgetter
 import html
 import difflib
 import sys
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional
 from types import SimpleNamespace
 from pydantic import BaseModel
 import pytesseract
 from pathlib import Path
 
+try:  # pragma: no cover - optional dependency
+    from rapidfuzz import fuzz as _fuzz, process as _fuzz_process
+except ModuleNotFoundError:  # pragma: no cover - difflib fallback below
+    _fuzz = _fuzz_process = None
+
+try:  # pragma: no cover - optional dependency
+    import pyvips as _pyvips  # type: ignore
+except (ImportError, OSError):  # pragma: no cover - libvips missing; use PIL
+    _pyvips = None
+
 try:  # pragma: no cover - optional dependency
     import openai  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
@@ -55,23 +70,18 @@ from .pricing import (
 )
 import threading
 from urllib.parse import urlencode, urlparse
+from urllib3.util.retry import Retry
 import io
 import webbrowser
 import logging
 from gettext import gettext as _
-try:  # pragma: no cover - optional dependency
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-except Exception:  # pragma: no cover - optional dependency
-    Figure = None  # type: ignore[assignment]
-    FigureCanvasTkAgg = None  # type: ignore[assignment]
 try:
     from hash_db import HashDB, Candidate
 except ImportError as exc:  # pragma: no cover - optional dependency
     logging.getLogger(__name__).info("HashDB import failed: %s", exc)
     HashDB = None  # type: ignore[assignment]
     Candidate = None  # type: ignore[assignment]
-from fingerprint import compute_fingerprint
+from fingerprint import compute_fingerprint, draft_for_fingerprint
 from tooltip import Tooltip
 from .image_utils import load_rgba_image
 from .storage_config import (
@@ -117,6 +127,18 @@ if USE_OPENAI_STUB:
 
 PRICE_DB_PATH = "card_prices.csv"
 SET_LOGO_DIR = "set_logos"
+SCAN_EXTENSIONS = frozenset({"jpg", "jpeg", "png"})
+SET_LOGO_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "gif"})
+CHEAT_ROW_BATCH = 40  # cheatsheet rows created per event-loop turn
+SET_LOGO_CACHE_SIZE = 256  # decoded set logos kept in memory
+CARD_PREFETCH_AHEAD = 3  # scans decoded ahead of the card being edited
+SET_SYMBOL_WORKERS = 4  # parallel set symbol downloads; matches the HTTP pool
+# scaled set logos are kept here as PNGs so later starts skip the full decode
+THUMB_CACHE_DIR = os.getenv(
+    "THUMB_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "kartoteka", "thumbs"),
+)
+THUMB_HASH_CHUNK = 1024 * 1024  # bytes read at a time when hashing a source image
 HASH_DIFF_THRESHOLD = 20  # hash difference threshold for accepting matches
 HASH_MATCH_THRESHOLD = 5  # maximum allowed fingerprint distance
 HASH_SIZE = (32, 32)
@@ -149,6 +171,209 @@ _IMAGE_CACHE: dict[str, tuple[Optional[bytes], float]] = {}
 # cache for resized thumbnails keyed by source path/URL
 _THUMB_CACHE: dict[str, Image.Image] = {}
 
+# serializes background writes of ``aukcje.csv`` and the bot queue rebuild
+_AUCTION_SAVE_LOCK = threading.Lock()
+
+# shared pool for warehouse thumbnail loading; bounds the number of
+# concurrent decodes/downloads regardless of how many cards are listed
+MAG_IMAGE_WORKERS = 8
+MAG_IMAGE_TICK_MS = 16  # batching interval for applying loaded thumbnails
+CARD_PROGRESS_TICK_MS = 33  # analysis progress is applied at most ~30 times/s
+MAG_SEARCH_DELAY_MS = 150  # idle time after a keystroke before filtering
+MAG_RELAYOUT_DELAY_MS = 80  # window resize events coalesced into one relayout
+SET_FILTER_DELAY_MS = 120  # idle time after a keystroke before filtering sets
+MAG_THUMB_SNAP = 8  # thumbnail size changes below this many pixels are ignored
+MAG_PHOTO_CACHE_SIZE = 256  # Tk photos kept across reloads of the card list
+_MAG_IMAGE_POOL = ThreadPoolExecutor(
+    max_workers=MAG_IMAGE_WORKERS, thread_name_prefix="mag-image"
+)
+
+# fingerprints of card scans keyed by (path, mtime_ns, size); the ORB step is
+# slow enough that the editor and the analysis thread should share results
+FP_CACHE_SIZE = 256
+_FP_CACHE: OrderedDict[tuple, object] = OrderedDict()
+_FP_CACHE_LOCK = threading.Lock()
+
+
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+
+def _http_session():
+    """Return a shared keep-alive session for image downloads."""
+    global _HTTP_SESSION
+    with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=4
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _HTTP_SESSION = session
+        return _HTTP_SESSION
+
+
+_API_SESSION = None
+SETS_API_URL = "https://api.pokemontcg.io/v2/sets"
+
+
+def _api_session():
+    """Return a keep-alive session for the card API.
+
+    Transient gateway errors are retried with exponential backoff (1s, 2s)
+    by urllib3 instead of reconnecting for every attempt.
+    """
+    global _API_SESSION
+    with _HTTP_SESSION_LOCK:
+        if _API_SESSION is None:
+            session = requests.Session()
+            retry = Retry(
+                total=2,
+                backoff_factor=1,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+            )
+            session.mount("https://", requests.adapters.HTTPAdapter(max_retries=retry))
+            _API_SESSION = session
+        return _API_SESSION
+
+
+def _fetch_remote_sets(timeout: float) -> list[dict]:
+    """Return the set list from the card API; raises ``RequestException``."""
+    resp = _api_session().get(SETS_API_URL, timeout=timeout)
+    resp.raise_for_status()
+    return resp.json().get("data", [])
+
+
+@lru_cache(maxsize=32)
+def _fetch_url_bytes(url: str) -> bytes:
+    """Download ``url`` once; failed requests raise and are not cached."""
+    res = _http_session().get(url, timeout=10)
+    res.raise_for_status()
+    return res.content
+
+
+def _download_set_symbol(item: dict) -> None:
+    """Fetch the symbol of set ``item`` into SET_LOGO_DIR; errors are printed."""
+    name = item.get("name")
+    code = item["code"]
+    symbol_url = f"https://images.pokemontcg.io/{code}/symbol.png"
+    session = _http_session()
+    try:
+        res = session.get(symbol_url, timeout=10)
+        if res.status_code == 404:
+            alt = _SV_ALT_RE.sub(r"\1\2", code)
+            if alt != code:
+                alt_url = f"https://images.pokemontcg.io/{alt}/symbol.png"
+                res = session.get(alt_url, timeout=10)
+                if res.status_code == 200:
+                    symbol_url = alt_url
+        if res.status_code == 200:
+            parsed_path = urlparse(symbol_url).path
+            ext = os.path.splitext(parsed_path)[1] or ".png"
+            safe = code.replace("/", "_")
+            path = os.path.join(SET_LOGO_DIR, f"{safe}{ext}")
+            with open(path, "wb") as fh:
+                fh.write(res.content)
+        elif res.status_code == 404:
+            print(f"[WARN] Symbol not found for {name}: {symbol_url}")
+        else:
+            print(
+                f"[ERROR] Failed to download symbol for {name} from {symbol_url}: {res.status_code}"
+            )
+    except requests.RequestException as exc:
+        print(f"[ERROR] {name}: {exc}")
+
+
+def _session_csv_writer(app, new: bool = False) -> csv.DictWriter:
+    """Return a writer appending to ``app.session_csv_path``.
+
+    The file stays open for the whole scanning session so each saved card
+    costs one write instead of an open/write/close cycle.  With ``new`` the
+    file is truncated and the header written first.
+    """
+    path = app.session_csv_path
+    state = getattr(app, "_session_csv", None)
+    if (
+        not new
+        and state is not None
+        and state[0] == path
+        and not state[1].closed
+    ):
+        return state[2]
+    _close_session_csv(app)
+    fh = open(path, "w" if new else "a", encoding="utf-8", newline="")
+    writer = csv.DictWriter(
+        fh, fieldnames=csv_utils.COLLECTION_FIELDNAMES, delimiter=";"
+    )
+    if new:
+        writer.writeheader()
+        fh.flush()
+    app._session_csv = (path, fh, writer)
+    return writer
+
+
+def _close_session_csv(app) -> None:
+    """Close the session CSV kept open by :func:`_session_csv_writer`."""
+    state = getattr(app, "_session_csv", None)
+    app._session_csv = None
+    if state is not None:
+        state[1].close()
+
+
+def _set_buttons_state(app, enabled: bool) -> None:
+    """Enable or disable the editor's save and next buttons."""
+    for btn_name in ("save_button", "next_button"):
+        btn = getattr(app, btn_name, None)
+        if btn is not None:
+            try:
+                btn.configure(state=tk.NORMAL if enabled else tk.DISABLED)
+            except Exception:
+                pass
+
+
+def _widget_exists(widget) -> bool:
+    """Return ``True`` if ``widget`` is set and has not been destroyed."""
+    if widget is None:
+        return False
+    exists = getattr(widget, "winfo_exists", None)
+    if exists is None:
+        return True
+    try:
+        return bool(exists())
+    except tk.TclError:
+        return False
+
+
+def _root_bg(app) -> str:
+    """Return the root background colour of ``app``, read from Tk only once."""
+    bg = getattr(app, "_bg", None)
+    if bg is None:
+        bg = app._bg = app.root.cget("background")
+    return bg
+
+
+def _unbind_configure(binding) -> None:
+    """Remove a ``(widget, funcid)`` ``<Configure>`` binding if one is set."""
+    if not binding:
+        return
+    widget, funcid = binding
+    unbind = getattr(widget, "unbind", None)
+    if callable(unbind):
+        try:
+            unbind("<Configure>", funcid)
+        except tk.TclError:
+            pass  # widget already destroyed
+
+
+def _cancel_image_jobs(jobs) -> None:
+    """Cancel queued thumbnail jobs that have not started yet."""
+    for job in jobs:
+        cancel = getattr(job, "cancel", None)
+        if callable(cancel):
+            cancel()
+
 
 def draw_box_usage(canvas: "tk.Canvas", box_num: int, occupancy: dict[int, int]) -> float:
     """Draw per-column occupancy of a storage box on ``canvas``.
@@ -219,6 +444,129 @@ def draw_box_usage(canvas: "tk.Canvas", box_num: int, occupancy: dict[int, int])
     return occupied_percent
 
 
+# Fixed margins for the daily additions chart.  ``tight_layout`` re-measures
+# every artist on each redraw, while the chart layout never changes.
+DAILY_CHART_MARGINS = {"left": 0.1, "right": 0.98, "top": 0.88, "bottom": 0.3}
+
+
+@lru_cache(maxsize=1)
+def _get_matplotlib():
+    """Return ``(Figure, FigureCanvasTkAgg)`` or ``(None, None)``.
+
+    matplotlib is optional and expensive to import, so it is only loaded the
+    first time a chart is actually drawn.  Figures are created directly and
+    rendered by ``FigureCanvasTkAgg``, which always rasterizes with Agg, so
+    the global pyplot backend is never consulted.
+    """
+    try:  # pragma: no cover - optional dependency
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    except Exception:  # pragma: no cover - optional dependency
+        return None, None
+    return Figure, FigureCanvasTkAgg
+
+
+def draw_bar_chart(
+    canvas: "tk.Canvas",
+    labels: list[str],
+    values: Iterable[float],
+    color: str,
+    title: str = "",
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+) -> None:
+    """Draw a simple bar chart of ``values`` on ``canvas``.
+
+    All existing canvas items are removed first, so the function can be
+    called again to redraw the chart with new data.
+
+    Parameters
+    ----------
+    canvas:
+        Target canvas.
+    labels:
+        Text shown under each bar; thinned out when there are many bars.
+    values:
+        Bar heights, scaled so the largest value fills the plot area.
+    color:
+        Fill color of the bars.
+    title:
+        Optional caption drawn above the plot.
+    width, height:
+        Chart size in pixels.  Defaults to :data:`STATS_CHART_WIDTH` and
+        :data:`STATS_CHART_HEIGHT`.
+    """
+
+    width = STATS_CHART_WIDTH if width is None else width
+    height = STATS_CHART_HEIGHT if height is None else height
+    canvas.delete("all")
+    if title:
+        canvas.create_text(
+            width / 2, 4, text=title, fill=CHART_TEXT_COLOR, anchor="n"
+        )
+    values = [float(v) for v in values]
+    count = len(values)
+    if not count:
+        return
+    pad_top, pad_bottom, pad_side = 40, 70, 10
+    base = height - pad_bottom
+    plot_h = base - pad_top
+    max_v = max(values) or 1.0
+    slot = (width - 2 * pad_side) / count
+    bar_w = max(1.0, slot * 0.8)
+    label_step = -(-count // CHART_MAX_LABELS)
+    for i, value in enumerate(values):
+        x0 = pad_side + i * slot + (slot - bar_w) / 2
+        x1 = x0 + bar_w
+        top = base - value / max_v * plot_h
+        canvas.create_rectangle(x0, top, x1, base, fill=color, outline="")
+        if value and count <= CHART_MAX_LABELS:
+            canvas.create_text(
+                (x0 + x1) / 2,
+                top - 2,
+                text=f"{value:g}",
+                fill=CHART_TEXT_COLOR,
+                anchor="s",
+                font=("Segoe UI", 8),
+            )
+        if i % label_step == 0 and i < len(labels):
+            canvas.create_text(
+                (x0 + x1) / 2,
+                base + 4,
+                text=labels[i],
+                fill=CHART_TEXT_COLOR,
+                anchor="ne",
+                angle=45,
+                font=("Segoe UI", 8),
+            )
+
+
+def _decode_scaled(path: str, size: tuple[int, int]) -> Optional[Image.Image]:
+    """Decode the local image at ``path`` as RGBA, scaled down to fit ``size``.
+
+    :meth:`PIL.Image.Image.thumbnail` runs before the decode, so JPEG scans
+    are read at a reduced scale via ``draft`` and the full-resolution image
+    is never held in memory.
+    """
+    try:
+        with Image.open(path) as img:
+            img.thumbnail(size)
+            return img.convert("RGBA")
+    except (OSError, UnidentifiedImageError) as exc:
+        logger.warning("Failed to open image %s: %s", path, exc)
+        return None
+
+
+@lru_cache(maxsize=32)
+def _load_card_preview(path: str, mtime_ns: int) -> Optional[Image.Image]:
+    """Return the scan at ``path`` scaled for the card details window.
+
+    Memoised on ``(path, mtime_ns)`` so reopening a card skips the decode
+    while an edited file is read again.  Only the 300 px preview is kept.
+    """
+    return _decode_scaled(path, (300, 300))
+
+
 def _load_image(path: str) -> Optional[Image.Image]:
     """Load image from local path or URL with caching.
 
@@ -296,6 +644,171 @@ def _get_thumbnail(path: str, size: tuple[int, int]) -> Optional[Image.Image]:
     return img
 
 
+@lru_cache(maxsize=512)
+def _load_mag_thumbnail(path: str, width: int) -> Image.Image:
+    """Return the image at ``path`` scaled to ``width`` for the magazyn grid.
+
+    Results are memoised per ``(path, width)`` so cards sharing artwork are
+    downloaded and decoded once.  Failures raise :class:`OSError` instead of
+    returning ``None`` so that they are not cached and can be retried.
+    """
+    if os.path.exists(path):
+        # decode straight at thumbnail scale; ``height`` only bounds the fit
+        img = _decode_scaled(path, (width, 1 << 16)) if width > 0 else _load_image(path)
+    else:
+        img = _load_image(path)
+    if img is None:
+        raise OSError(f"Failed to load image {path}")
+    return _resize_to_width(img, width)
+
+
+# PIL modes for the uchar band layouts libvips hands back
+_VIPS_MODES = {1: "L", 2: "LA", 3: "RGB", 4: "RGBA"}
+
+
+def _scaled_image(path: str, size: tuple[int, int]) -> Optional[Image.Image]:
+    """Load ``path`` as RGBA scaled down to fit within ``size``.
+
+    With libvips installed the image is shrunk while it is decoded, which is
+    much cheaper for large scans than a full PIL decode followed by
+    ``thumbnail``; otherwise PIL is used.  Neither applies EXIF orientation,
+    so coordinates computed from ``Image.open(path).size`` stay valid.
+    """
+    if _pyvips is not None:
+        try:
+            thumb = _pyvips.Image.thumbnail(
+                path, size[0], height=size[1], size="down", no_rotate=True
+            )
+            if thumb.format != "uchar":
+                thumb = thumb.cast("uchar", shift=True)  # 16-bit scans
+            mode = _VIPS_MODES.get(thumb.bands)
+            if mode is not None and thumb.interpretation != "cmyk":
+                img = Image.frombytes(
+                    mode, (thumb.width, thumb.height), thumb.write_to_memory()
+                )
+                return img.convert("RGBA")
+        except _pyvips.Error as exc:
+            logger.debug("libvips could not scale %s: %s", path, exc)
+    img = load_rgba_image(path)
+    if img is not None:
+        img.thumbnail(size)
+    return img
+
+
+def _cached_thumbnail(path: str, size: tuple[int, int]) -> Optional[Image.Image]:
+    """Return the image at ``path`` scaled to fit ``size``.
+
+    Thumbnails are stored in :data:`THUMB_CACHE_DIR` under the SHA-1 of the
+    file's contents and ``size``, so a hit costs hashing the source and
+    opening a small PNG instead of decoding it.  Failing to write the cache
+    is not an error.
+    """
+    digest = hashlib.sha1()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(THUMB_HASH_CHUNK), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    digest.update(f":{size[0]}x{size[1]}".encode())
+    cached = os.path.join(THUMB_CACHE_DIR, f"{digest.hexdigest()}.png")
+    if os.path.exists(cached):
+        img = load_rgba_image(cached)
+        if img is not None:
+            return img
+
+    img = _scaled_image(path, size)
+    if img is None:
+        return None
+    tmp_path = f"{cached}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
+        img.save(tmp_path, "PNG")
+        os.replace(tmp_path, cached)
+    except OSError as exc:
+        logger.debug("Could not cache thumbnail of %s: %s", path, exc)
+    return img
+
+
+def _cached_fingerprint(path: str):
+    """Return the fingerprint of the scan at ``path``, computing it once.
+
+    Results are reused while the file keeps its modification time and size.
+    Raises the same errors as opening the image and fingerprinting it.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        key = None  # let Image.open report the problem; nothing to cache
+    else:
+        key = (path, st.st_mtime_ns, st.st_size)
+        with _FP_CACHE_LOCK:
+            if key in _FP_CACHE:
+                _FP_CACHE.move_to_end(key)
+                return _FP_CACHE[key]
+    with Image.open(path) as img:
+        draft_for_fingerprint(img)
+        try:
+            fp = compute_fingerprint(img, use_orb=True)
+        except TypeError:
+            fp = compute_fingerprint(img)
+    if key is None:
+        return fp
+    with _FP_CACHE_LOCK:
+        _FP_CACHE[key] = fp
+        while len(_FP_CACHE) > FP_CACHE_SIZE:
+            _FP_CACHE.popitem(last=False)
+    return fp
+
+
+def _decode_card_scan(path: str) -> Optional[Image.Image]:
+    """Decode the scan at ``path`` scaled for the card editor preview."""
+    return _scaled_image(path, (400, 560))
+
+
+_ENTRY_DEFAULTS = {"język": "ENG", "stan": "NM"}
+
+
+def _entry_resetter(key: str, entry) -> Optional[Callable[[], None]]:
+    """Return a callable clearing editor ``entry`` for the next card.
+
+    The widget type is inspected once here instead of on every card shown.
+    ``None`` is returned for values that are not reset between cards.
+    """
+    entry_types = tuple(
+        t
+        for t in (getattr(tk, "Entry", None), getattr(ctk, "CTkEntry", None))
+        if isinstance(t, type)
+    )
+    if entry_types and isinstance(entry, entry_types):
+        return lambda: entry.delete(0, tk.END)
+    if isinstance(tk.StringVar, type) and isinstance(entry, tk.StringVar):
+        default = _ENTRY_DEFAULTS.get(key, "")
+        return lambda: entry.set(default)
+    bool_var_cls = getattr(tk, "BooleanVar", None)
+    if isinstance(bool_var_cls, type) and isinstance(entry, bool_var_cls):
+        return lambda: entry.set(False)
+    return None
+
+
+def _mag_search_blob(row: dict) -> str:
+    """Return the normalised text searched for a magazyn card ``row``.
+
+    The blob is computed once and stored on the row as ``_search_blob`` so
+    filtering on every keystroke does not re-run :func:`normalize`.
+    """
+    blob = row.get("_search_blob")
+    if blob is None:
+        price = str(row.get("price") or "").replace(",", ".")
+        blob = " ".join(
+            normalize(str(row.get(field) or ""))
+            for field in ("name", "number", "set", "warehouse_code", "variant")
+        )
+        blob = f"{blob} {normalize(price)}"
+        row["_search_blob"] = blob
+    return blob
+
+
 def _create_image(img: Image.Image):
     """Return a CTkImage if available, otherwise a PhotoImage."""
     if hasattr(ctk, "CTkImage"):
@@ -415,6 +928,10 @@ MAX_CARD_THUMB_SIZE = 160
 MAG_CARD_GAP = 3  # spacing between card frames in magazine view
 GRID_COLUMNS = STANDARD_BOX_COLUMNS  # number of columns per storage box
 WAREHOUSE_GRID_COLUMNS = 5  # number of columns in the warehouse grid
+STATS_CHART_WIDTH = 420  # size of each bar chart in the statistics view
+STATS_CHART_HEIGHT = 300
+CHART_MAX_LABELS = 14  # x-axis labels drawn before they are thinned out
+CHART_TEXT_COLOR = "#BBBBBB"
 # BOX_COLUMN_CAPACITY, BOX_COUNT, SPECIAL_BOX_NUMBER and SPECIAL_BOX_CAPACITY
 # are imported from :mod:`kartoteka.storage_config`.
 BOX_CAPACITY = STANDARD_BOX_CAPACITY  # slots in a standard box
@@ -427,6 +944,49 @@ def _occupancy_color(value: float) -> str:
     if value < 0.8:
         return "#ffeb3b"  # yellow
     return "#f44336"  # red
+
+
+def _box_label_font():
+    """Return one font object for all box preview labels.
+
+    Sharing a single ``CTkFont`` spares every label its own font parsing;
+    without ``CTkFont`` (older customtkinter) the plain tuple is used.
+    """
+    if hasattr(ctk, "CTkFont"):
+        return ctk.CTkFont(family="Segoe UI", size=24, weight="bold")
+    return ("Segoe UI", 24, "bold")
+
+
+# matches any digit; used to detect a trailing card number in ``name`` columns
+_DIGIT_RE = re.compile(r"\d")
+
+# ``YYYY-MM-DD`` dates as written to the ``added_at`` column
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# finds every ``K<box>R<column>P<position>`` code in a ``;``-separated
+# ``warehouse_code`` field; codes may be padded with whitespace
+_WAREHOUSE_CODE_RE = re.compile(r"(?:^|;)\s*K(\d+)R(\d)P(\d+)")
+
+# a single ``K<box>R<column>P<position>`` location code
+_LOCATION_CODE_RE = re.compile(r"K(\d+)R(\d+)P(\d+)")
+
+# separators between the ``name|number|set|era`` parts of a scan filename
+_KEYSPLIT_RE = re.compile(r"[|_-]")
+
+# a ``number/total`` card number such as ``25/102``
+_NUMBER_TOTAL_RE = re.compile(r"(\d+)\s*/\s*(\d+)")
+
+# Scarlet & Violet codes padded to two digits (``sv02``) whose symbols are
+# published under the unpadded code (``sv2``)
+_SV_ALT_RE = re.compile(r"(^sv)0(\d$)")
+
+
+# search box input repeats while typing (backspace and retype), so the
+# normalised query is memoised; ``normalize`` is a pure function
+_normalize_cached = lru_cache(maxsize=256)(normalize)
+
+
+@lru_cache(maxsize=512)
 def norm_header(name: str) -> str:
     """Return a normalized column name."""
     if name is None:
@@ -434,9 +994,11 @@ def norm_header(name: str) -> str:
     return name.strip().lower()
 
 
-def sanitize_number(value: str) -> str:
+def sanitize_number(value) -> str:
     """Remove leading zeros from a number string.
 
+    Non-string values are converted with ``str`` first.
+
     Returns
     -------
     str
@@ -444,11 +1006,44 @@ def sanitize_number(value: str) -> str:
         empty.
     """
 
+    if not isinstance(value, str):
+        value = str(value)
     return value.lstrip("0") or "0"
 
 
 
 
+# (language, era) -> (name_list, code_map, abbr_map, search_map) used by the
+# set entry's filtering and autocompletion; rebuilt after ``reload_sets``
+_SET_SEARCH_INDEX: dict[tuple[str, str], tuple] = {}
+# (id(mapping), include_values) -> (mapping, lowercase-keyed copy) for the
+# set-name lookups, so their keys are lowered once instead of per call
+_LOWERED_SET_MAPS: dict[tuple[int, bool], tuple[dict, dict]] = {}
+# set code or name -> era for ``get_set_era``; rebuilt after ``reload_sets``
+_SET_ERA_CACHE: dict[str, str] = {}
+_SET_SUFFIX_RE = re.compile(r"[-_\s]+[a-z]{1,3}$", re.IGNORECASE)
+
+
+def _lowered_keys(mapping: dict, include_values: bool = False) -> dict:
+    """Return ``mapping`` keyed by interned lowercase keys.
+
+    The first key wins when two differ only by case, matching a linear scan
+    over ``mapping``.  With ``include_values`` the lowercased values are
+    added as keys as well, each mapping to the original value.
+    """
+    key = (id(mapping), include_values)
+    cached = _LOWERED_SET_MAPS.get(key)
+    if cached is not None and cached[0] is mapping:
+        return cached[1]
+    lowered: dict = {}
+    for k, v in mapping.items():
+        lowered.setdefault(sys.intern(k.lower()), v)
+        if include_values and v:
+            lowered.setdefault(sys.intern(v.lower()), v)
+    _LOWERED_SET_MAPS[key] = (mapping, lowered)
+    return lowered
+
+
 # Wczytanie danych setów
 def reload_sets():
     """Load set definitions from the JSON files."""
@@ -468,6 +1063,9 @@ def reload_sets():
     tcg_sets_name_to_abbr = globals().get("tcg_sets_name_to_abbr", {})
     tcg_sets_jp_name_to_abbr = globals().get("tcg_sets_jp_name_to_abbr", {})
     SET_TO_ERA = {}
+    _SET_SEARCH_INDEX.clear()
+    _LOWERED_SET_MAPS.clear()
+    _SET_ERA_CACHE.clear()
 
     try:
         with open("tcg_sets.json", encoding="utf-8") as f:
@@ -554,6 +1152,64 @@ def reload_sets():
                 SET_TO_ERA[item["abbr"].lower()] = era
 
 
+def _set_search_index(lang: str, era: str) -> tuple:
+    """Return ``(name_list, code_map, abbr_map, search_map)`` for the sets of
+    ``lang`` (``"JP"`` or English), limited to ``era`` when it is known.
+
+    ``search_map`` maps lowercased names, codes and abbreviations to set
+    names.  The tuple is built once per language and era instead of on
+    every keystroke in the set entry.
+    """
+    lang = "JP" if lang == "JP" else "ENG"
+    if lang == "JP":
+        sets_by_era = tcg_sets_jp_by_era
+    else:
+        sets_by_era = tcg_sets_eng_by_era
+    if not (era and era in sets_by_era):
+        era = ""
+    key = (lang, era)
+    index = _SET_SEARCH_INDEX.get(key)
+    if index is not None:
+        return index
+
+    if era:
+        name_list = [item["name"] for item in sets_by_era[era]]
+        code_map = {item["code"]: item["name"] for item in sets_by_era[era]}
+        abbr_map = {
+            item["abbr"]: item["name"] for item in sets_by_era[era] if "abbr" in item
+        }
+    elif lang == "JP":
+        name_list = tcg_sets_jp
+        code_map = tcg_sets_jp_code_map
+        abbr_map = tcg_sets_jp_abbr_name_map
+    else:
+        name_list = tcg_sets_eng
+        code_map = tcg_sets_eng_code_map
+        abbr_map = tcg_sets_eng_abbr_name_map
+
+    search_map = {sys.intern(n.lower()): n for n in name_list}
+    search_map.update({sys.intern(c.lower()): n for c, n in code_map.items()})
+    search_map.update({sys.intern(a.lower()): n for a, n in abbr_map.items()})
+    index = _SET_SEARCH_INDEX[key] = (name_list, code_map, abbr_map, search_map)
+    return index
+
+
+def _close_set_keys(typed: str, keys, limit: int) -> list[str]:
+    """Return up to ``limit`` of ``keys`` similar to ``typed``, best first.
+
+    Uses RapidFuzz when installed and :func:`difflib.get_close_matches`
+    otherwise; both keep matches scoring at least 60% similarity.
+    """
+    if _fuzz_process is None:
+        return difflib.get_close_matches(typed, keys, n=limit, cutoff=0.6)
+    return [
+        key
+        for key, _score, _idx in _fuzz_process.extract(
+            typed, list(keys), scorer=_fuzz.ratio, score_cutoff=60, limit=limit
+        )
+    ]
+
+
 reload_sets()
 
 # Allowed eras and set codes used for logo operations
@@ -602,7 +1258,7 @@ def get_set_code(name: str) -> str:
         return ""
     search = name.strip()
     # remove trailing language or other short alphabetic suffixes like "EN", "JP"
-    search = re.sub(r"[-_\s]+[a-z]{1,3}$", "", search, flags=re.IGNORECASE)
+    search = _SET_SUFFIX_RE.sub("", search)
     search = search.strip().lower()
     for mapping in (
         tcg_sets_eng_map,
@@ -610,9 +1266,9 @@ def get_set_code(name: str) -> str:
         tcg_sets_eng_abbr_map,
         tcg_sets_jp_abbr_map,
     ):
-        for key, code in mapping.items():
-            if key.lower() == search:
-                return code
+        code = _lowered_keys(mapping).get(search)
+        if code is not None:
+            return code
     return name
 
 
@@ -627,9 +1283,9 @@ def get_set_name(code: str) -> str:
         tcg_sets_eng_abbr_name_map,
         tcg_sets_jp_abbr_name_map,
     ):
-        for key, name in mapping.items():
-            if key.lower() == search:
-                return name
+        name = _lowered_keys(mapping).get(search)
+        if name is not None:
+            return name
     logger.warning(
         "Nie znaleziono nazwy dla setu '%s'. Weryfikacja ręczna wymagana.",
         code,
@@ -658,9 +1314,9 @@ def get_set_abbr(name: str) -> str:
     search = re.sub(r"[-_\s]+[a-z]{1,2}$", "", search, flags=re.IGNORECASE)
     lowered = search.lower()
     for mapping in (tcg_sets_name_to_abbr, tcg_sets_jp_name_to_abbr):
-        for key, abbr in mapping.items():
-            if key.lower() == lowered or (abbr and abbr.lower() == lowered):
-                return abbr or ""
+        abbr = _lowered_keys(mapping, include_values=True).get(lowered)
+        if abbr is not None:
+            return abbr or ""
     return ""
 
 
@@ -668,10 +1324,11 @@ def get_set_era(code_or_name: str) -> str:
     """Return the era name for a given set code or display name."""
     if not code_or_name:
         return ""
-    search = code_or_name.strip()
-    search = re.sub(r"[-_\s]+[a-z]{1,3}$", "", search, flags=re.IGNORECASE)
-    search = search.strip().lower()
-    return SET_TO_ERA.get(search, "")
+    era = _SET_ERA_CACHE.get(code_or_name)
+    if era is None:
+        search = _SET_SUFFIX_RE.sub("", code_or_name.strip())
+        era = _SET_ERA_CACHE[code_or_name] = SET_TO_ERA.get(search.strip().lower(), "")
+    return era
 
 def lookup_sets_from_api(name: str, number: str, total: Optional[str] = None):
     """Return possible set codes and names for the given card info.
@@ -704,9 +1361,9 @@ def lookup_sets_from_api(name: str, number: str, total: Optional[str] = None):
                     merged.append(item)
                     seen.add(item)
             return merged
-    number = sanitize_number(str(number))
+    number = sanitize_number(number)
     if total is not None:
-        total = sanitize_number(str(total))
+        total = sanitize_number(total)
 
     name_api = normalize(name, keep_spaces=True)
     params = {"name": name_api, "number": number}
@@ -1673,6 +2330,7 @@ class CardEditorApp:
         self.root.title("KARTOTEKA")
         # improve default font for all widgets
         self.root.configure(bg=BG_COLOR, fg_color=BG_COLOR)
+        self._bg = None
         self.root.option_add("*Font", ("Segoe UI", 20))
         self.root.option_add("*Foreground", TEXT_COLOR)
         self.index = 0
@@ -1698,6 +2356,8 @@ class CardEditorApp:
         self.auto_lookup = AUTO_HASH_LOOKUP
         self.current_fingerprint = None
         self.selected_candidate_meta = None
+        self._card_progress_q: SimpleQueue = SimpleQueue()
+        self._card_progress_scheduled = False
         self.price_db = self.load_price_db()
         self.folder_name = ""
         self.folder_path = ""
@@ -1719,7 +2379,8 @@ class CardEditorApp:
         self._mag_csv_mtime: Optional[float] = None
         self.log_widget = None
         self.cheat_frame = None
-        self.set_logos = {}
+        self.set_logos: OrderedDict[str, object] = OrderedDict()
+        self._set_logo_paths: dict[str, str] = {}
         self.loading_frame = None
         self.loading_label = None
         self.price_pool_total = 0.0
@@ -1911,6 +2572,7 @@ class CardEditorApp:
         self.inventory_sold_count_label.pack(anchor="center", pady=(0, 5))
 
         daily = dict(sorted(csv_utils.get_daily_additions().items()))
+        Figure, FigureCanvasTkAgg = _get_matplotlib() if daily else (None, None)
         if Figure and FigureCanvasTkAgg and daily:
             fig = Figure(figsize=(6, 3), facecolor=BG_COLOR)
             ax = fig.add_subplot(111)
@@ -1935,7 +2597,7 @@ class CardEditorApp:
             ax.tick_params(axis="y", colors="#BBBBBB")
             for spine in ax.spines.values():
                 spine.set_color("#BBBBBB")
-            fig.tight_layout()
+            fig.subplots_adjust(**DAILY_CHART_MARGINS)
             canvas = FigureCanvasTkAgg(fig, master=info_frame)
             canvas.draw()
             widget = canvas.get_tk_widget()
@@ -2216,18 +2878,26 @@ class CardEditorApp:
         unsold_total_text = f"💰 Łączna wartość: {unsold_total:.2f} PLN"
         sold_count_text = f"Sprzedane karty: {sold_count}"
         sold_total_text = f"Wartość sprzedanych: {sold_total:.2f} PLN"
+        # labels already showing the same text are not reconfigured
+        shown = getattr(self, "_inventory_label_text", None)
+        if shown is None:
+            shown = self._inventory_label_text = {}
         for attr, widget in widgets:
             if "sold" in attr:
                 text = sold_count_text if "count" in attr else sold_total_text
             else:
                 text = unsold_count_text if "count" in attr else unsold_total_text
+            if shown.get(attr) == (widget, text):
+                continue
             try:
                 widget.configure(text=text)
             except tk.TclError:
-                pass
+                continue
+            shown[attr] = (widget, text)
 
         # Refresh the daily additions chart to reflect newly added cards
         daily = dict(sorted(csv_utils.get_daily_additions().items()))
+        Figure, FigureCanvasTkAgg = _get_matplotlib() if daily else (None, None)
         if Figure and FigureCanvasTkAgg and daily:
             try:
                 if getattr(self, "daily_additions_chart", None):
@@ -2255,7 +2925,6 @@ class CardEditorApp:
                     ax.tick_params(axis="y", colors="#BBBBBB")
                     for spine in ax.spines.values():
                         spine.set_color("#BBBBBB")
-                    fig.tight_layout()
                     self.daily_additions_chart.draw()
                 elif hasattr(self, "inventory_count_label"):
                     parent = getattr(self.inventory_count_label, "master", None)
@@ -2285,7 +2954,7 @@ class CardEditorApp:
                         ax.tick_params(axis="y", colors="#BBBBBB")
                         for spine in ax.spines.values():
                             spine.set_color("#BBBBBB")
-                        fig.tight_layout()
+                        fig.subplots_adjust(**DAILY_CHART_MARGINS)
                         canvas = FigureCanvasTkAgg(fig, master=parent)
                         canvas.draw()
                         widget = canvas.get_tk_widget()
@@ -2365,7 +3034,7 @@ class CardEditorApp:
         # prefill inputs with the next free location
         try:
             next_code = self.next_free_location()
-            match = re.match(r"K(\d+)R(\d+)P(\d+)", next_code)
+            match = _LOCATION_CODE_RE.match(next_code)
             if match:
                 self.start_box_var.set(str(int(match.group(1))))
                 self.start_col_var.set(str(int(match.group(2))))
@@ -2373,7 +3042,7 @@ class CardEditorApp:
         except Exception:
             pass
 
-        form = tk.Frame(frame, bg=self.root.cget("background"))
+        form = tk.Frame(frame, bg=_root_bg(self))
         form.pack(pady=5)
         for idx, label in enumerate(["Karton", "Kolumna", "Pozycja"]):
             ctk.CTkLabel(form, text=label).grid(row=0, column=idx, padx=5, pady=2)
@@ -2387,7 +3056,7 @@ class CardEditorApp:
             row=1, column=2, padx=5
         )
 
-        folder_frame = tk.Frame(frame, bg=self.root.cget("background"))
+        folder_frame = tk.Frame(frame, bg=_root_bg(self))
         folder_frame.pack(pady=5)
         ctk.CTkLabel(folder_frame, text="Folder").grid(row=0, column=0, padx=5, pady=2)
         ctk.CTkEntry(folder_frame, textvariable=self.scan_folder_var, width=300).grid(
@@ -2421,6 +3090,11 @@ class CardEditorApp:
         if folder:
             self.scan_folder_var.set(folder)
 
+    def _refresh_bg(self):
+        """Re-read the root background after the colour theme changes."""
+        self._bg = None
+        return _root_bg(self)
+
     def create_button(self, master=None, **kwargs):
         if master is None:
             master = self.root
@@ -2473,15 +3147,12 @@ class CardEditorApp:
             logger.exception("Failed to start bot")
             messagebox.showerror("Błąd", str(e))
 
+        bg = _root_bg(self)
         self.root.minsize(1200, 800)
-        self.auction_frame = tk.Frame(
-            self.root, bg=self.root.cget("background")
-        )
+        self.auction_frame = tk.Frame(self.root, bg=bg)
         self.auction_frame.pack(expand=True, fill="both", padx=10, pady=10)
 
-        container = tk.Frame(
-            self.auction_frame, bg=self.root.cget("background")
-        )
+        container = tk.Frame(self.auction_frame, bg=bg)
         container.pack(expand=True, fill="both")
 
         refresh_tree = self._build_auction_widgets(container)
@@ -2526,9 +3197,8 @@ class CardEditorApp:
         end_var = tk.StringVar(value=datetime.date.today().isoformat())
 
         self.root.minsize(1200, 800)
-        self.statistics_frame = tk.Frame(
-            self.root, bg=self.root.cget("background")
-        )
+        bg = _root_bg(self)
+        self.statistics_frame = tk.Frame(self.root, bg=bg)
         self.statistics_frame.pack(expand=True, fill="both", padx=10, pady=10)
 
         filter_frame = ctk.CTkFrame(self.statistics_frame, fg_color=BG_COLOR)
@@ -2577,8 +3247,20 @@ class CardEditorApp:
         )
         self.stats_max_order_label.pack(anchor="w")
 
-        chart_frame = tk.Frame(self.statistics_frame, bg=self.root.cget("background"))
+        chart_frame = tk.Frame(self.statistics_frame, bg=bg)
         chart_frame.pack(expand=True, fill="both", pady=5)
+        added_canvas, sold_canvas = (
+            tk.Canvas(
+                chart_frame,
+                width=STATS_CHART_WIDTH,
+                height=STATS_CHART_HEIGHT,
+                bg=BG_COLOR,
+                highlightthickness=0,
+            )
+            for _ in range(2)
+        )
+        added_canvas.pack(side="left", expand=True, padx=5)
+        sold_canvas.pack(side="left", expand=True, padx=5)
 
         def _update():
             try:
@@ -2606,43 +3288,9 @@ class CardEditorApp:
                 text=f"Największe zamówienie: {max_order}"
             )
 
-            if Figure and FigureCanvasTkAgg and daily:
-                dates = list(daily.keys())
-                added_vals = [v.get("added", 0) for v in daily.values()]
-                sold_vals = [v.get("sold", 0) for v in daily.values()]
-                fig = Figure(figsize=(8, 4), facecolor=BG_COLOR)
-                ax1 = fig.add_subplot(121)
-                ax1.set_facecolor(BG_COLOR)
-                ax1.bar(range(len(dates)), added_vals, color="#4a90e2")
-                ax1.set_title("Dodane", color="#BBBBBB")
-                ax1.set_xticks(range(len(dates)))
-                ax1.set_xticklabels(
-                    dates, rotation=45, ha="right", color="#BBBBBB", fontsize=8
-                )
-                ax1.tick_params(axis="y", colors="#BBBBBB")
-                for spine in ax1.spines.values():
-                    spine.set_color("#BBBBBB")
-                ax2 = fig.add_subplot(122)
-                ax2.set_facecolor(BG_COLOR)
-                ax2.bar(range(len(dates)), sold_vals, color="#e74c3c")
-                ax2.set_title("Sprzedane", color="#BBBBBB")
-                ax2.set_xticks(range(len(dates)))
-                ax2.set_xticklabels(
-                    dates, rotation=45, ha="right", color="#BBBBBB", fontsize=8
-                )
-                ax2.tick_params(axis="y", colors="#BBBBBB")
-                for spine in ax2.spines.values():
-                    spine.set_color("#BBBBBB")
-                fig.tight_layout()
-                if getattr(self, "statistics_chart", None):
-                    self.statistics_chart.get_tk_widget().destroy()
-                canvas = FigureCanvasTkAgg(fig, master=chart_frame)
-                canvas.draw()
-                canvas.get_tk_widget().pack(expand=True, fill="both")
-                self.statistics_chart = canvas
-            elif getattr(self, "statistics_chart", None):
-                self.statistics_chart.get_tk_widget().destroy()
-                self.statistics_chart = None
+            dates, added_vals, sold_vals = stats_utils.daily_series(daily)
+            draw_bar_chart(added_canvas, dates, added_vals, "#4a90e2", "Dodane")
+            draw_bar_chart(sold_canvas, dates, sold_vals, "#e74c3c", "Sprzedane")
 
         ctk.CTkButton(
             filter_frame,
@@ -2660,35 +3308,36 @@ class CardEditorApp:
 
     def _build_auction_widgets(self, container):
         """Create auction editor widgets and return a refresh callback."""
-        left_panel = tk.Frame(container, bg=self.root.cget("background"))
+        bg = _root_bg(self)
+        left_panel = tk.Frame(container, bg=bg)
         left_panel.pack(side="right", fill="y", padx=10, pady=10)
 
         self.auction_image_label = ctk.CTkLabel(left_panel, text="")
         self.auction_image_label.pack(pady=5)
         self.auction_photo = None
 
-        tk.Label(left_panel, text="Cena:", bg=self.root.cget("background"), fg="white").pack(anchor="w")
+        tk.Label(left_panel, text="Cena:", bg=bg, fg="white").pack(anchor="w")
         self.current_price_var = tk.StringVar()
-        tk.Label(left_panel, textvariable=self.current_price_var, bg=self.root.cget("background"), fg="white").pack(anchor="w")
+        tk.Label(left_panel, textvariable=self.current_price_var, bg=bg, fg="white").pack(anchor="w")
 
-        tk.Label(left_panel, text="Prowadzi:", bg=self.root.cget("background"), fg="white").pack(anchor="w")
+        tk.Label(left_panel, text="Prowadzi:", bg=bg, fg="white").pack(anchor="w")
         self.leader_var = tk.StringVar()
-        tk.Label(left_panel, textvariable=self.leader_var, bg=self.root.cget("background"), fg="white").pack(anchor="w")
+        tk.Label(left_panel, textvariable=self.leader_var, bg=bg, fg="white").pack(anchor="w")
 
-        tk.Label(left_panel, text="Pozostały czas:", bg=self.root.cget("background"), fg="white").pack(anchor="w")
+        tk.Label(left_panel, text="Pozostały czas:", bg=bg, fg="white").pack(anchor="w")
         self.remaining_time_var = tk.StringVar()
-        tk.Label(left_panel, textvariable=self.remaining_time_var, bg=self.root.cget("background"), fg="white").pack(anchor="w")
+        tk.Label(left_panel, textvariable=self.remaining_time_var, bg=bg, fg="white").pack(anchor="w")
 
-        win = tk.Frame(container, bg=self.root.cget("background"))
+        win = tk.Frame(container, bg=bg)
         win.pack(side="left", fill="both", expand=True, padx=10, pady=10)
 
-        form = tk.Frame(win, bg=self.root.cget("background"))
+        form = tk.Frame(win, bg=bg)
         form.pack(pady=5)
 
         labels = ["Nazwa karty", "Numer", "Cena start", "Kwota przebicia", "Czas [s]"]
         vars = []
         for i, lbl in enumerate(labels):
-            tk.Label(form, text=lbl, bg=self.root.cget("background"), fg="white").grid(row=0, column=i, padx=2)
+            tk.Label(form, text=lbl, bg=bg, fg="white").grid(row=0, column=i, padx=2)
             var = tk.StringVar()
             ctk.CTkEntry(form, textvariable=var, width=100).grid(row=1, column=i, padx=2)
             vars.append(var)
@@ -2729,65 +3378,63 @@ class CardEditorApp:
         tk.Label(
             win,
             textvariable=self.info_var,
-            bg=self.root.cget("background"),
+            bg=bg,
             fg="white",
         ).pack(pady=2)
 
-        status_frame = tk.Frame(win, bg=self.root.cget("background"))
+        status_frame = tk.Frame(win, bg=bg)
         status_frame.pack(pady=2)
 
         tk.Label(
             status_frame,
             text="Aktualna cena:",
-            bg=self.root.cget("background"),
+            bg=bg,
             fg=CURRENT_PRICE_COLOR,
         ).grid(row=0, column=0, padx=2, sticky="e")
         tk.Label(
             status_frame,
             textvariable=self.current_price_var,
-            bg=self.root.cget("background"),
+            bg=bg,
             fg=CURRENT_PRICE_COLOR,
         ).grid(row=0, column=1, padx=2, sticky="w")
 
         tk.Label(
             status_frame,
             text="Pozostały czas:",
-            bg=self.root.cget("background"),
+            bg=bg,
             fg="white",
         ).grid(row=0, column=2, padx=2, sticky="e")
         tk.Label(
             status_frame,
             textvariable=self.remaining_time_var,
-            bg=self.root.cget("background"),
+            bg=bg,
             fg="white",
         ).grid(row=0, column=3, padx=2, sticky="w")
 
         tk.Label(
             status_frame,
             text="Prowadzi:",
-            bg=self.root.cget("background"),
+            bg=bg,
             fg="white",
         ).grid(row=0, column=4, padx=2, sticky="e")
         tk.Label(
             status_frame,
             textvariable=self.leader_var,
-            bg=self.root.cget("background"),
+            bg=bg,
             fg="white",
         ).grid(row=0, column=5, padx=2, sticky="w")
 
-        def refresh_tree():
-            for r in tree.get_children():
-                tree.delete(r)
-            for row in self.auction_queue:
-                tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        row.get("name") or row.get("nazwa_karty"),
-                        row.get("price") or row.get("cena_początkowa"),
-                        row.get("warehouse_code", ""),
-                    ),
-                )
+        # rows currently shown in ``tree``; used to skip redundant rebuilds
+        shown_rows: list[tuple] = []
+
+        def format_row(row):
+            return (
+                row.get("name") or row.get("nazwa_karty"),
+                row.get("price") or row.get("cena_początkowa"),
+                row.get("warehouse_code", ""),
+            )
+
+        def update_info():
             if self.auction_queue:
                 nxt = self.auction_queue[0]
                 nazwa = nxt.get('name') or nxt.get('nazwa_karty')
@@ -2798,10 +3445,25 @@ class CardEditorApp:
                     self.info_var.set(f"Następna karta: {nazwa}")
             else:
                 self.info_var.set("Brak kart w kolejce")
+
+        def ensure_selection():
             if not tree.selection():
                 items = tree.get_children()
                 if items:
                     tree.selection_set(items[0])
+
+        def refresh_tree():
+            new_rows = [format_row(row) for row in self.auction_queue]
+            children = tree.get_children()
+            if new_rows != shown_rows or len(children) != len(new_rows):
+                # a single ``delete`` call avoids one Tcl round-trip per row
+                if children:
+                    tree.delete(*children)
+                for values in new_rows:
+                    tree.insert("", "end", values=values)
+                shown_rows[:] = new_rows
+            update_info()
+            ensure_selection()
             show_selected()
 
         def find_scan(name: str, num: str) -> Optional[str]:
@@ -2814,19 +3476,21 @@ class CardEditorApp:
                 num,
             ]
             exts = [".jpg", ".png", ".jpeg"]
+            # file names in priority order plus a set for C-level matching
+            wanted = [cand + ext for cand in candidates for ext in exts]
+            wanted_set = set(wanted)
             base_dir = SCANS_DIR
             for root_dir, _d, files in os.walk(base_dir):
                 lower = {f.lower(): f for f in files}
-                for cand in candidates:
-                    for ext in exts:
-                        fname = cand + ext
-                        if fname in lower:
-                            return os.path.join(root_dir, lower[fname])
+                common = wanted_set.intersection(lower)
+                if common:
+                    fname = next(f for f in wanted if f in common)
+                    return os.path.join(root_dir, lower[fname])
             return None
 
-        def load_image(path: Optional[str]):
-            if not path:
-                return
+        def _fetch_image(path: str) -> None:
+            # runs on the image pool: download, decode and scale off the Tk
+            # thread, then hand the finished image back to the event loop
             try:
                 if urlparse(path).scheme in ("http", "https"):
                     resp = requests.get(path, timeout=5)
@@ -2840,13 +3504,37 @@ class CardEditorApp:
                 if img is None:
                     return
                 img.thumbnail((200, 280))
-                photo = _create_image(img)
-                self.auction_photo = photo
-                self.auction_image_label.configure(image=photo)
             except (requests.RequestException, OSError, UnidentifiedImageError) as exc:
                 logger.warning("Failed to load auction image %s: %s", path, exc)
+                return
+            tree.after(0, lambda: _apply_image(path, img))
+
+        def _apply_image(path: str, img: Image.Image) -> None:
+            # ignore results for a row that is no longer selected
+            if pending["image"] != path or not tree.winfo_exists():
+                return
+            photo = _create_image(img)
+            self.auction_photo = photo
+            self.auction_image_label.configure(image=photo)
+
+        def load_image(path: Optional[str]):
+            if not path:
+                return
+            pending["image"] = path
+            _MAG_IMAGE_POOL.submit(_fetch_image, path)
+
+        # pending ``after`` ids used to coalesce bursts of selection events
+        # and queue edits into a single image load / tree rebuild, plus the
+        # path of the preview image currently being fetched
+        pending = {"select": None, "refresh": None, "image": None}
 
         def show_selected(event=None):
+            if pending["select"] is not None:
+                tree.after_cancel(pending["select"])
+            pending["select"] = tree.after(80, _do_show_selected)
+
+        def _do_show_selected():
+            pending["select"] = None
             sel = tree.selection()
             if not sel:
                 return
@@ -2858,6 +3546,20 @@ class CardEditorApp:
                 )
                 load_image(path)
 
+        def _do_refresh():
+            pending["refresh"] = None
+            refresh_tree()
+
+        def schedule_refresh():
+            if pending["refresh"] is None:
+                pending["refresh"] = tree.after_idle(_do_refresh)
+
+        def flush_refresh():
+            # single-row edits below assume ``tree`` mirrors the queue
+            if pending["refresh"] is not None:
+                tree.after_cancel(pending["refresh"])
+                _do_refresh()
+
         def add_row():
             name, num, start, step, czas = [v.get().strip() for v in vars]
             if not name or not num:
@@ -2871,19 +3573,29 @@ class CardEditorApp:
                 "kwota_przebicia": step or "1",
                 "czas_trwania": czas or "60",
             }
+            flush_refresh()
+            was_empty = not self.auction_queue
             self.auction_queue.append(row)
+            values = format_row(row)
+            tree.insert("", "end", values=values)
+            shown_rows.append(values)
             for v in vars:
                 v.set("")
-            refresh_tree()
+            if was_empty:
+                update_info()
+                ensure_selection()
 
         def remove_selected():
+            flush_refresh()
             sel = tree.selection()
             for item_id in reversed(sel):
                 idx = tree.index(item_id)
                 tree.delete(item_id)
                 if 0 <= idx < len(self.auction_queue):
                     self.auction_queue.pop(idx)
-            refresh_tree()
+                    del shown_rows[idx]
+            update_info()
+            ensure_selection()
 
         def import_selected():
             rows = []
@@ -2908,9 +3620,9 @@ class CardEditorApp:
                     messagebox.showerror("Błąd", str(exc))
                     return
             self.auction_queue.extend(rows)
-            refresh_tree()
+            schedule_refresh()
 
-        def save_queue():
+        def save_queue_worker(rows):
             fieldnames = [
                 "nazwa_karty",
                 "numer_karty",
@@ -2919,30 +3631,57 @@ class CardEditorApp:
                 "kwota_przebicia",
                 "czas_trwania",
             ]
-            with open("aukcje.csv", "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for row in self.auction_queue:
-                    writer.writerow(row)
-            try:
-                import bot
-
-                bot.aukcje_kolejka.clear()
-                for r in self.auction_queue:
-                    aukcja = bot.Aukcja(
-                        r.get("nazwa_karty"),
-                        r.get("numer_karty"),
-                        r.get("opis"),
-                        r.get("cena_początkowa"),
-                        r.get("kwota_przebicia"),
-                        r.get("czas_trwania"),
+            with _AUCTION_SAVE_LOCK:
+                try:
+                    with open(
+                        "aukcje.csv",
+                        "w",
+                        newline="",
+                        encoding="utf-8",
+                        buffering=1 << 16,
+                    ) as f:
+                        # imported inventory rows carry extra columns such as
+                        # ``price`` or ``images 1`` which are not saved
+                        writer = csv.DictWriter(
+                            f, fieldnames=fieldnames, extrasaction="ignore"
+                        )
+                        writer.writeheader()
+                        writer.writerows(rows)
+                except OSError as exc:
+                    logger.exception("Failed to save auction queue")
+                    self.root.after(
+                        0, lambda exc=exc: messagebox.showerror("Błąd", str(exc))
                     )
-                    bot.aukcje_kolejka.append(aukcja)
-            except Exception:
-                logger.exception("Failed to update bot auction queue")
-            messagebox.showinfo("Aukcje", "Kolejka zapisana do aukcje.csv")
+                    return
+                try:
+                    import bot
+
+                    bot.aukcje_kolejka[:] = [
+                        bot.Aukcja(
+                            r.get("nazwa_karty"),
+                            r.get("numer_karty"),
+                            r.get("opis"),
+                            r.get("cena_początkowa"),
+                            r.get("kwota_przebicia"),
+                            r.get("czas_trwania"),
+                        )
+                        for r in rows
+                    ]
+                except Exception:
+                    logger.exception("Failed to update bot auction queue")
+            self.root.after(
+                0,
+                lambda: messagebox.showinfo("Aukcje", "Kolejka zapisana do aukcje.csv"),
+            )
+
+        def save_queue():
+            # snapshot on the UI thread; the worker must not touch Tk state
+            rows = list(self.auction_queue)
+            threading.Thread(
+                target=save_queue_worker, args=(rows,), daemon=True
+            ).start()
 
-        btn_frame = tk.Frame(win, bg=self.root.cget("background"))
+        btn_frame = tk.Frame(win, bg=bg)
         btn_frame.pack(pady=5)
         self.create_button(
             btn_frame,
@@ -2970,7 +3709,7 @@ class CardEditorApp:
         ).pack(side="left", padx=5)
 
 
-        control_frame = tk.Frame(win, bg=self.root.cget("background"))
+        control_frame = tk.Frame(win, bg=bg)
         control_frame.pack(pady=5)
 
         def start_auction():
@@ -2994,7 +3733,7 @@ class CardEditorApp:
         def reload_queue():
             try:
                 self._load_auction_queue()
-                refresh_tree()
+                schedule_refresh()
             except (OSError, csv.Error, UnicodeDecodeError, ValueError) as exc:
                 logger.exception("Failed to reload auction queue")
                 messagebox.showerror("Błąd", str(exc))
@@ -3062,20 +3801,43 @@ class CardEditorApp:
                 dialect = csv.Sniffer().sniff(sample, delimiters=";,")
             except csv.Error:
                 dialect = csv.excel
-            reader = csv.DictReader(f, dialect=dialect)
-            rows = [
-                {norm_header(k): v for k, v in r.items() if k is not None}
-                for r in reader
-            ]
+            reader = csv.reader(f, dialect=dialect)
+            headers = [norm_header(h) for h in next(reader, [])]
+            width = len(headers)
+            # resolve the filter column once so rejected rows never
+            # allocate a dict
+            wanted = {str(c) for c in codes} if codes else None
+            code_idx = (
+                width - 1 - headers[::-1].index("product_code")
+                if "product_code" in headers
+                else None
+            )
+            rows = []
+            for raw in reader:
+                if not raw:
+                    continue
+                if wanted is not None:
+                    if code_idx is None:
+                        code = ""
+                    elif code_idx < len(raw):
+                        code = raw[code_idx]
+                    else:
+                        code = None
+                    if str(code) not in wanted:
+                        continue
+                row = dict(zip(headers, raw))
+                # mirror ``csv.DictReader`` which pads short rows with None
+                for h in headers[len(raw):]:
+                    row[h] = None
+                rows.append(row)
 
-        headers = [norm_header(h) for h in (reader.fieldnames or [])]
         if "nazwa_karty" not in headers:
             if "name" in headers:
                 for row in rows:
                     if "nazwa_karty" not in row:
                         name_val = str(row.get("name", "")).strip()
                         parts = name_val.rsplit(" ", 1)
-                        if len(parts) == 2 and re.search(r"\d", parts[1]):
+                        if len(parts) == 2 and _DIGIT_RE.search(parts[1]):
                             row["nazwa_karty"], row["numer_karty"] = parts
                         else:
                             row["nazwa_karty"] = name_val
@@ -3090,9 +3852,6 @@ class CardEditorApp:
             row.setdefault("product_code", "")
             if "image" in row and "images 1" not in row:
                 row["images 1"] = row.pop("image")
-        if codes:
-            wanted = {str(c) for c in codes}
-            rows = [r for r in rows if str(r.get("product_code")) in wanted]
         return rows
 
     def lookup_inventory_entry(self, key):
@@ -3105,8 +3864,9 @@ class CardEditorApp:
         try:
             with open(csv_utils.WAREHOUSE_CSV, newline="", encoding="utf-8") as f:
                 reader = csv.DictReader(f, delimiter=";")
+                remap = {h: norm_header(h) for h in reader.fieldnames or []}
                 for raw in reader:
-                    row = {norm_header(k): v for k, v in raw.items() if k is not None}
+                    row = {remap[k]: v for k, v in raw.items() if k is not None}
                     row_name = (row.get("nazwa") or row.get("nazwa_karty") or row.get("name") or "").strip()
                     row_number = (
                         row.get("numer")
@@ -3212,6 +3972,7 @@ class CardEditorApp:
             ).convert("RGBA")
             self._box100_photo = ImageTk.PhotoImage(img)
 
+        box_font = _box_label_font()
         for i, box_num in enumerate(self.mag_box_order):
             frame = ctk.CTkFrame(container, fg_color=BG_COLOR)
             lbl = ctk.CTkLabel(
@@ -3219,7 +3980,7 @@ class CardEditorApp:
                 text=f"K{box_num}",
                 fg_color=BG_COLOR,
                 text_color=TEXT_COLOR,
-                font=("Segoe UI", 24, "bold"),
+                font=box_font,
             )
             lbl.pack()
             self.mag_labels.append(lbl)
@@ -3253,7 +4014,7 @@ class CardEditorApp:
                 width=40,
                 fg_color=BG_COLOR,
                 text_color=_occupancy_color(0),
-                font=("Segoe UI", 24, "bold"),
+                font=box_font,
             )
             pct_label.pack(pady=(5, 0))
             self.home_percent_labels[box_num] = pct_label
@@ -3274,6 +4035,7 @@ class CardEditorApp:
         self.mag_progressbars = {}
         self.mag_percent_labels = {}
         self.mag_labels = []
+        box_font = _box_label_font()
         for i, box_num in enumerate(self.mag_box_order):
             frame = ctk.CTkFrame(container, fg_color=BG_COLOR)
             lbl = ctk.CTkLabel(
@@ -3281,7 +4043,7 @@ class CardEditorApp:
                 text=f"K{box_num}",
                 fg_color=BG_COLOR,
                 text_color=TEXT_COLOR,
-                font=("Segoe UI", 24, "bold"),
+                font=box_font,
             )
             lbl.pack(anchor="w")
             self.mag_labels.append(lbl)
@@ -3304,7 +4066,7 @@ class CardEditorApp:
                     width=40,
                     fg_color=BG_COLOR,
                     text_color=_occupancy_color(0),
-                    font=("Segoe UI", 24, "bold"),
+                    font=box_font,
                 )
                 pct_label.pack(side="left", padx=(5, 0))
                 self.mag_progressbars[(box_num, col)] = bar
@@ -3325,10 +4087,33 @@ class CardEditorApp:
     def reload_mag_cards(self) -> None:
         """(Re)load warehouse card data from CSV and prepare image placeholders."""
         csv_path = getattr(csv_utils, "WAREHOUSE_CSV", "magazyn.csv")
+        try:
+            mtime: Optional[float] = os.path.getmtime(csv_path)
+        except OSError:
+            mtime = None
+        jobs = getattr(self, "_image_threads", [])
+        if (
+            mtime is not None
+            and mtime == getattr(self, "_mag_csv_mtime", None)
+            and getattr(self, "mag_card_rows", None)
+            and not any(job.cancelled() for job in jobs)
+        ):
+            # CSV unchanged and every thumbnail loaded or still loading:
+            # keep the parsed rows and photos, only drop stale widgets.
+            labels = self.mag_card_image_labels
+            for i in range(len(labels)):
+                labels[i] = None
+            self.mag_card_frames = []
+            self._mag_prev_thumb = 0
+            return
+
         thumb_size = CARD_THUMB_SIZE
         placeholder_img = Image.new("RGB", (thumb_size, thumb_size), "#111111")
         self.mag_placeholder_photo = _create_image(placeholder_img)
 
+        # drop thumbnail jobs queued for the previous card list
+        _cancel_image_jobs(getattr(self, "_image_threads", []))
+
         # reset containers
         self.mag_card_rows = []
         self.mag_card_images = []
@@ -3337,173 +4122,215 @@ class CardEditorApp:
         self._image_threads = []
         self._mag_column_occ: dict[tuple[int, int], int] = {}
 
+        self._mag_request_thumbnails = None
+
         if not os.path.exists(csv_path):
             self._mag_prev_thumb = 0
             self._mag_csv_mtime = None
             self._mag_column_occ = {}
             return
 
+        # Finished thumbnails are queued by the workers and applied in
+        # batches: one ``after`` tick per MAG_IMAGE_TICK_MS configures every
+        # ready label and relayouts once, instead of two Tk callbacks and a
+        # relayout per image.
+        ready: SimpleQueue = SimpleQueue()
+        tick = {"scheduled": False}
+        images = self.mag_card_images
+        labels = self.mag_card_image_labels
+        # card indices per image path; one photo per path is shared by every
+        # card using that artwork and kept across reloads, so rewriting the
+        # CSV does not recreate the Tk images of unchanged cards
+        waiting: dict[str, list[int]] = {}
+        photos = getattr(self, "_mag_photo_cache", None)
+        if photos is None:
+            photos = self._mag_photo_cache = OrderedDict()
+
+        def _remember_photo(path: str, photo) -> None:
+            photos[path] = photo
+            photos.move_to_end(path)
+            while len(photos) > MAG_PHOTO_CACHE_SIZE:
+                photos.popitem(last=False)
+
+        def _drain_image_updates() -> None:
+            tick["scheduled"] = False
+            updated = False
+            while True:
+                try:
+                    i, path, img = ready.get_nowait()
+                except Empty:
+                    break
+                photo = photos.get(path)
+                if photo is None:
+                    photo = _create_image(img)
+                    _remember_photo(path, photo)
+                images[i] = photo
+                lbl = labels[i]
+                exists_fn = getattr(lbl, "winfo_exists", None)
+                if not lbl or (exists_fn and not exists_fn()):
+                    continue
+                if hasattr(lbl, "configure"):
+                    try:
+                        lbl.configure(image=photo)
+                    except tk.TclError:
+                        continue
+                else:  # simple dummy widgets in tests
+                    lbl.image = photo
+                updated = True
+            if updated:
+                # real artwork may differ in height from the placeholder
+                self._mag_bbox_dirty = True
+                relayout = getattr(self, "_relayout_mag_cards", None)
+                if callable(relayout):
+                    relayout()
+
+        def _post_image(i: int, path: str, img: Image.Image) -> None:
+            ready.put((i, path, img))
+            if tick["scheduled"]:
+                return
+            after = getattr(self.root, "after", None)
+            if callable(after):
+                tick["scheduled"] = True
+                after(MAG_IMAGE_TICK_MS, _drain_image_updates)
+            else:
+                _drain_image_updates()
+
         with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter=";")
+            # ``csv.reader`` streams the file through the C parser; each row
+            # dict is then built with a single ``dict(zip(...))`` instead of
+            # going through ``csv.DictReader``'s per-row Python machinery.
+            reader = csv.reader(f, delimiter=";")
+            header = next(reader, [])
             groups: dict[tuple[str, ...], list[dict]] = defaultdict(list)
-            column_occ: dict[tuple[int, int], int] = {}
-            for row in reader:
+            column_occ: Counter[tuple[int, int]] = Counter()
+            for raw in reader:
+                if not raw:
+                    continue
+                row = dict(zip(header, raw))
+                for h in header[len(raw):]:
+                    row[h] = None
                 if not row.get("name"):
                     logger.warning("Skipping row with missing name: %s", row)
                     continue
+                sold = str(row.get("sold") or "")
                 key = (
                     row.get("name"),
                     row.get("number"),
                     row.get("set"),
                     row.get("variant") or "common",
-                    str(row.get("sold") or ""),
+                    sold,
                 )
                 groups[key].append(row)
 
-                if str(row.get("sold") or "").lower() in {"1", "true", "yes"}:
+                if sold.lower() in {"1", "true", "yes"}:
                     continue
-                codes = str(row.get("warehouse_code") or "").split(";")
-                for code in codes:
-                    code = code.strip()
-                    if not code:
-                        continue
-                    m = re.match(r"K(\d+)R(\d)P(\d+)", code)
-                    if not m:
-                        continue
-                    box = int(m.group(1))
-                    col = int(m.group(2))
-                    column_occ[(box, col)] = column_occ.get((box, col), 0) + 1
-            self._mag_column_occ = column_occ
+                column_occ.update(
+                    (int(m.group(1)), int(m.group(2)))
+                    for m in _WAREHOUSE_CODE_RE.finditer(
+                        row.get("warehouse_code") or ""
+                    )
+                )
+            self._mag_column_occ = dict(column_occ)
 
             for rows in groups.values():
                 combined = dict(rows[0])
-                added_dates: list[datetime.date] = []
+                # ISO dates order lexicographically, so the newest one is the
+                # string maximum; no need to parse them into ``date`` objects
+                added_dates: list[str] = []
                 for r in rows:
                     value = (r.get("added_at") or "").strip()
                     if not value:
                         continue
-                    try:
-                        added_dates.append(datetime.date.fromisoformat(value))
-                    except ValueError:
+                    if _ISO_DATE_RE.fullmatch(value):
+                        added_dates.append(value)
+                    else:
                         logger.warning("Skipping invalid added_at: %s", value)
                 if added_dates:
-                    combined["added_at"] = max(added_dates).isoformat()
+                    combined["added_at"] = max(added_dates)
                 combined["image"] = next(
                     (r.get("image") for r in rows if r.get("image")),
                     "",
                 )
                 combined["variant"] = combined.get("variant") or "common"
-                codes = [
-                    r.get("warehouse_code", "") for r in rows if r.get("warehouse_code")
-                ]
-                combined["warehouse_code"] = ";".join(dict.fromkeys(codes))
+                if len(rows) == 1:
+                    # most cards are single copies; nothing to merge
+                    combined["warehouse_code"] = combined.get("warehouse_code") or ""
+                else:
+                    # duplicated CSV lines may repeat a code, so keep the
+                    # order-preserving dedupe for merged groups
+                    codes = [
+                        r.get("warehouse_code", "")
+                        for r in rows
+                        if r.get("warehouse_code")
+                    ]
+                    combined["warehouse_code"] = ";".join(dict.fromkeys(codes))
                 combined["_count"] = len(rows)
-                idx = len(self.mag_card_rows)
+                _mag_search_blob(combined)
+                # sort keys parsed once here rather than on every list update
+                try:
+                    price_key = float(
+                        str(combined.get("price") or "0").replace(",", ".")
+                    )
+                except ValueError:
+                    price_key = 0.0
+                combined["_price_key"] = price_key
+                combined["_qty_key"] = len(rows)
+                combined["_added_key"] = combined.get("added_at") or ""
+                combined["_name_key"] = combined.get("name") or ""
+                combined["_is_sold"] = (
+                    str(combined.get("sold") or "").lower() in {"1", "true", "yes"}
+                )
+                idx = combined["_index"] = len(self.mag_card_rows)
                 self.mag_card_rows.append(combined)
                 self.mag_card_images.append(self.mag_placeholder_photo)
                 self.mag_card_image_labels.append(None)
 
                 img_path = combined.get("image") or ""
-                if urlparse(img_path).scheme in ("http", "https"):
-                    def _worker(i=idx, url=img_path):
-                        img = _load_image(url)
-                        if img is None:
-                            return
-
-                        def _update(img=img) -> None:
-                            img_resized = _resize_to_width(img, thumb_size)
-                            photo = _create_image(img_resized)
-                            self.mag_card_images[i] = photo
-                            lbl = self.mag_card_image_labels[i]
-                            exists_fn = getattr(lbl, "winfo_exists", None)
-                            if not lbl or (exists_fn and not exists_fn()):
-                                return
-                            if hasattr(lbl, "configure"):
-                                try:
-                                    lbl.configure(image=photo)
-                                except tk.TclError:
-                                    return
-                            else:  # simple dummy widgets in tests
-                                lbl.image = photo
-                            relayout = getattr(self, "_relayout_mag_cards", None)
-                            if callable(relayout):
-                                after2 = getattr(self.root, "after", None)
-                                if callable(after2):
-                                    after2(0, relayout)
-                                else:
-                                    relayout()
-
-                        after = getattr(self.root, "after", None)
-                        if callable(after):
-                            after(0, _update)
-                        else:
-                            _update()
-
-                    th = threading.Thread(target=_worker, daemon=True)
-                    th.start()
-                    self._image_threads.append(th)
-                else:
-                    def _worker(i=idx, path=img_path):
-                        img = _load_image(path)
-                        if img is None:
-                            return
-
-                        def _update(img=img) -> None:
-                            img_resized = _resize_to_width(img, thumb_size)
-                            photo = _create_image(img_resized)
-                            self.mag_card_images[i] = photo
-                            lbl = self.mag_card_image_labels[i]
-                            exists_fn = getattr(lbl, "winfo_exists", None)
-                            if not lbl or (exists_fn and not exists_fn()):
-                                return
-                            if hasattr(lbl, "configure"):
-                                try:
-                                    lbl.configure(image=photo)
-                                except tk.TclError:
-                                    return
-                            else:  # simple dummy widgets in tests
-                                lbl.image = photo
-                            relayout = getattr(self, "_relayout_mag_cards", None)
-                            if callable(relayout):
-                                after2 = getattr(self.root, "after", None)
-                                if callable(after2):
-                                    after2(0, relayout)
-                                else:
-                                    relayout()
+                if img_path:
+                    photo = photos.get(img_path)
+                    if photo is not None:
+                        photos.move_to_end(img_path)
+                        self.mag_card_images[idx] = photo
+                    else:
+                        waiting.setdefault(img_path, []).append(idx)
+
+        card_rows = self.mag_card_rows
+        jobs = self._image_threads
+
+        def _request_thumbnails(indices: Iterable[int]) -> None:
+            """Start loading the thumbnails of the given card indices.
+
+            Only cards that are shown are loaded; artwork of cards on other
+            pages stays pending until the user pages to them.  One job runs
+            per distinct image and cards sharing artwork wait on it together.
+            """
+            for idx in indices:
+                path = card_rows[idx].get("image") or ""
+                targets = waiting.pop(path, None)
+                if targets is None:
+                    continue
 
-                        after = getattr(self.root, "after", None)
-                        if callable(after):
-                            after(0, _update)
-                        else:
-                            _update()
+                def _worker(path=path, targets=targets):
+                    try:
+                        img = _load_mag_thumbnail(path, thumb_size)
+                    except OSError:
+                        return
+                    for i in targets:
+                        _post_image(i, path, img)
 
-                    th = threading.Thread(target=_worker, daemon=True)
-                    th.start()
-                    self._image_threads.append(th)
+                jobs.append(_MAG_IMAGE_POOL.submit(_worker))
 
+        self._mag_request_thumbnails = _request_thumbnails
         self._mag_prev_thumb = 0
-        try:
-            self._mag_csv_mtime = os.path.getmtime(csv_path)
-        except OSError:
-            self._mag_csv_mtime = None
+        self._mag_csv_mtime = mtime
 
     def show_magazyn_view(self):
         """Display storage occupancy inside the main window."""
         # Unbind previous resize handlers if they exist before rebuilding the
         # magazine view. This prevents ``_relayout_mag_cards`` from being
         # triggered after the associated widgets are destroyed.
-        if getattr(self, "_mag_bind_id", None) or getattr(self, "_root_mag_bind_id", None):
-            mag_frame = getattr(self, "mag_list_frame", None)
-            if mag_frame is not None:
-                unbind = getattr(mag_frame, "unbind", None)
-                if callable(unbind) and getattr(self, "_mag_bind_id", None):
-                    unbind("<Configure>", self._mag_bind_id)
-            if getattr(self, "_root_mag_bind_id", None):
-                root_unbind = getattr(self.root, "unbind", None)
-                if callable(root_unbind):
-                    root_unbind("<Configure>", self._root_mag_bind_id)
-            self._mag_bind_id = None
-            self._root_mag_bind_id = None
+        _unbind_configure(getattr(self, "_mag_configure_binding", None))
+        self._mag_configure_binding = None
 
         self.root.title("Podgląd magazynu")
         current_root = self.root
@@ -3607,6 +4434,81 @@ class CardEditorApp:
         list_frame.pack(expand=True, fill="both", padx=10, pady=10)
         # store reference for resize handling
         self.mag_list_frame = list_frame
+        self._mag_card_pool: list[dict] = []
+        # (columns, count) of the leading pool frames currently gridded
+        self._mag_gridded = (0, 0)
+
+        if hasattr(ctk, "CTkFont"):
+            sold_font = ctk.CTkFont(size=20, overstrike=True)
+            normal_font = ctk.CTkFont()
+        else:
+            sold_font = ("TkDefaultFont", 20, "overstrike")
+            normal_font = None
+
+        def _new_card_entry() -> dict:
+            """Create the widgets of one pooled magazyn card."""
+            frame = ctk.CTkFrame(list_frame, fg_color=BG_COLOR)
+            col_conf = getattr(frame, "grid_columnconfigure", None)
+            if callable(col_conf):
+                col_conf(0, weight=1)
+            img_label = ctk.CTkLabel(frame, image=self.mag_placeholder_photo, text="")
+            grid = getattr(img_label, "grid", None)
+            if callable(grid):
+                grid(row=0, column=0, sticky="n")
+            label = ctk.CTkLabel(
+                frame,
+                text="",
+                text_color=TEXT_COLOR,
+                width=CARD_THUMB_SIZE,
+                wraplength=CARD_THUMB_SIZE,
+                justify="center",
+            )
+            grid = getattr(label, "grid", None)
+            if callable(grid):
+                grid(row=1, column=0, sticky="new")
+            entry = {
+                "frame": frame,
+                "image": img_label,
+                "label": label,
+                "badge": None,
+                "sold": False,
+                "row": None,
+                "photo": None,
+                "text": None,
+                "thumb_size": CARD_THUMB_SIZE,
+            }
+
+            # bound once per pooled card; the handler follows whichever row
+            # the entry currently shows instead of rebinding on every page
+            def _open_details(_event=None):
+                if entry["row"] is not None:
+                    self.show_card_details(entry["row"])
+
+            for widget in (img_label, label):
+                widget.bind("<Button-1>", _open_details)
+                widget.bind("<Double-Button-1>", _open_details)
+            return entry
+
+        # customtkinter widgets always provide ``configure`` and the place
+        # geometry manager; only lightweight test doubles lack them.  Probe
+        # the widget classes once here rather than every widget per update.
+        if hasattr(ctk.CTkLabel, "configure"):
+            def _configure(widget, **kwargs) -> None:
+                widget.configure(**kwargs)
+        else:
+            def _configure(widget, **kwargs) -> None:
+                for key, value in kwargs.items():
+                    setattr(widget, key, value)
+        badge_place = hasattr(ctk.CTkLabel, "place")
+        frame_grid_remove = hasattr(ctk.CTkFrame, "grid_remove")
+
+        def _forget(widget, *methods: str) -> None:
+            """Hide ``widget`` with the first geometry ``methods`` it supports."""
+            for name in methods:
+                fn = getattr(widget, name, None)
+                if callable(fn):
+                    fn()
+                    return
 
         # Populate warehouse card data from CSV
         try:
@@ -3614,6 +4516,21 @@ class CardEditorApp:
         except Exception:  # pragma: no cover - defensive
             logger.exception("Failed to reload warehouse cards")
 
+        def _mag_list_width() -> int:
+            """Return the width available for the card grid."""
+            width = 0
+            canvas = getattr(self.mag_list_frame, "_parent_canvas", None)
+            if canvas is not None:
+                width_fn = getattr(canvas, "winfo_width", None)
+                if callable(width_fn):
+                    width = width_fn()
+            if width <= 1:
+                width_fn = getattr(self.magazyn_frame, "winfo_width", lambda: 0)
+                width = width_fn()
+            if width <= 1:
+                width = MAX_CARD_THUMB_SIZE * 2 + MAG_CARD_GAP * 4
+            return width
+
         def _relayout_mag_cards(event=None):
             """Recompute thumbnail size and update scroll region on resize."""
             if getattr(self, "_mag_layout_running", False):
@@ -3624,25 +4541,23 @@ class CardEditorApp:
                 if not self.mag_list_frame or not exists_fn():
                     return
                 global CARD_THUMB_SIZE
-                width = 0
-                canvas = getattr(self.mag_list_frame, "_parent_canvas", None)
-                if canvas is not None:
-                    width_fn = getattr(canvas, "winfo_width", None)
-                    if callable(width_fn):
-                        width = width_fn()
-                if width <= 1:
-                    width_fn = getattr(self.magazyn_frame, "winfo_width", lambda: 0)
-                    width = width_fn()
-                if width <= 1:
-                    width = MAX_CARD_THUMB_SIZE * 2 + MAG_CARD_GAP * 4
+                width = _mag_list_width()
                 max_thumb = MAX_CARD_THUMB_SIZE
                 cols = max(1, width // (max_thumb + MAG_CARD_GAP * 2))
                 thumb = max(
                     32,
                     min((width - MAG_CARD_GAP * 2 * cols) // cols, max_thumb),
                 )
-                if thumb != self._mag_prev_thumb:
+                prev_thumb = self._mag_prev_thumb
+                if prev_thumb and abs(thumb - prev_thumb) < MAG_THUMB_SNAP:
+                    # e.g. a scrollbar appearing; not worth rescaling every card
+                    thumb = prev_thumb
+                if thumb != prev_thumb:
                     self._mag_prev_thumb = thumb
+                    self._mag_bbox_dirty = True
+                    if thumb != CARD_THUMB_SIZE:
+                        # cached thumbnails were scaled for the old size
+                        _load_mag_thumbnail.cache_clear()
                     CARD_THUMB_SIZE = thumb
                     placeholder = Image.new("RGB", (thumb, thumb), "#111111")
                     old_placeholder = getattr(self, "mag_placeholder_photo", None)
@@ -3682,31 +4597,36 @@ class CardEditorApp:
                         weight = 1 if i < cols else 0
                         col_conf(i, weight=weight)
                     self._mag_prev_cols = cols
-                for i, frame in enumerate(self.mag_card_frames):
-                    if frame is None:
-                        continue
-                    exists_fn = getattr(frame, "winfo_exists", None)
+                if cols != getattr(self, "_mag_layout_cols", None):
+                    self._mag_layout_cols = cols
+                    self._mag_bbox_dirty = True
+                # Pooled frames keep their grid slot between updates, so with
+                # an unchanged column count only frames shown since the last
+                # pass need gridding.  A frame that was destroyed meanwhile
+                # just raises ``TclError``.
+                frames = self.mag_card_frames
+                gridded_cols, gridded = self._mag_gridded
+                start = gridded if gridded_cols == cols else 0
+                for i in range(start, len(frames)):
+                    r, c = divmod(i, cols)
                     try:
-                        exists = True if exists_fn is None else bool(exists_fn())
-                    except Exception:
-                        exists = False
-                    if not exists:
-                        continue
-                    r = i // cols
-                    c = i % cols
-                    grid = getattr(frame, "grid", None)
-                    if callable(grid):
-                        grid(
+                        frames[i].grid(
                             row=r,
                             column=c,
                             padx=MAG_CARD_GAP,
                             pady=MAG_CARD_GAP,
                             sticky="nsew",
                         )
+                    except tk.TclError:
+                        continue
+                self._mag_gridded = (cols, len(frames))
 
+                # measuring ``bbox("all")`` walks every card; only do it when
+                # the cards, their size or the column count changed
                 canvas = getattr(self.mag_list_frame, "_parent_canvas", None)
-                if canvas is not None:
+                if canvas is not None and getattr(self, "_mag_bbox_dirty", True):
                     def _update_scroll_region():
+                        self._mag_bbox_dirty = False
                         yview_fn = getattr(canvas, "yview", None)
                         try:
                             yview = yview_fn() if callable(yview_fn) else None
@@ -3727,78 +4647,103 @@ class CardEditorApp:
                         after_idle(_update_scroll_region)
                     else:
                         _update_scroll_region()
+                self._mag_last_layout_width = width
             finally:
                 self._mag_layout_running = False
 
         # Expose relayout function for worker threads
         self._relayout_mag_cards = _relayout_mag_cards
+        self._mag_relayout_after = None
+
+        def _run_relayout():
+            self._mag_relayout_after = None
+            _relayout_mag_cards()
+
+        def _schedule_relayout(event=None):
+            """Coalesce a burst of ``<Configure>`` events into one relayout."""
+            # moves and height changes also fire <Configure>; the grid only
+            # depends on the width
+            if _mag_list_width() == getattr(self, "_mag_last_layout_width", None):
+                return
+            after = getattr(current_root, "after", None)
+            if not callable(after):
+                _relayout_mag_cards(event)
+                return
+            if self._mag_relayout_after is not None:
+                current_root.after_cancel(self._mag_relayout_after)
+            self._mag_relayout_after = after(MAG_RELAYOUT_DELAY_MS, _run_relayout)
+
+        last_list_state: dict[str, object] = {}
 
         def _update_mag_list(*_):
             query_raw = self.mag_search_var.get().strip()
             sort_key = self.mag_sort_var.get()
             status_filter = self.mag_sold_filter_var.get()
 
-            normalized_query = normalize(query_raw, keep_spaces=True)
-            tokens = [tok for tok in normalized_query.split() if tok]
-            if "sold" in tokens or "unsold" in tokens:
-                status_filter = "all"
-
-            def _matches(row: dict) -> bool:
-                is_sold = str(row.get("sold") or "").lower() in {"1", "true", "yes"}
-                if status_filter == "sold" and not is_sold:
-                    return False
-                if status_filter == "unsold" and is_sold:
-                    return False
-                price_str = str(row.get("price", "")).replace(",", ".")
-                fields = [
-                    normalize(row.get("name", "")),
-                    normalize(str(row.get("number", ""))),
-                    normalize(row.get("set", "")),
-                    normalize(row.get("warehouse_code", "")),
-                    normalize(row.get("variant") or ""),
-                    normalize(price_str),
-                ]
-                for token in tokens:
-                    if token == "sold":
-                        if not is_sold:
-                            return False
-                        continue
-                    if token == "unsold":
-                        if is_sold:
-                            return False
-                        continue
-                    if not any(token in field for field in fields):
-                        return False
-                return True
-
-            indices = [i for i, r in enumerate(self.mag_card_rows) if _matches(r)]
-            if sort_key == "added":
-                indices.sort(
-                    key=lambda i: self.mag_card_rows[i].get("added_at") or "",
-                    reverse=True,
-                )
-            elif sort_key == "name":
-                indices.sort(key=lambda i: self.mag_card_rows[i].get("name", ""))
-            elif sort_key == "price":
-                def _price(i: int) -> float:
-                    val = str(self.mag_card_rows[i].get("price", "0")).replace(",", ".")
-                    try:
-                        return float(val)
-                    except ValueError:
-                        return 0.0
-
-                indices.sort(key=_price)
-            elif sort_key == "quantity":
-                def _quantity(i: int) -> int:
-                    try:
-                        return int(self.mag_card_rows[i].get("_count", 1))
-                    except (TypeError, ValueError):
-                        return 1
+            normalized_query = _normalize_cached(query_raw, True)
+            tokens = normalized_query.split()
+            # "sold"/"unsold" typed in the query override the status menu;
+            # the remaining tokens are matched against the search blob
+            if "sold" in tokens and "unsold" in tokens:
+                status_filter = "none"
+            elif "sold" in tokens:
+                status_filter = "sold"
+            elif "unsold" in tokens:
+                status_filter = "unsold"
+            terms = [tok for tok in tokens if tok not in ("sold", "unsold")]
+
+            # nothing to redo when neither the resolved inputs nor the loaded
+            # rows changed (e.g. a trace firing for an identical value)
+            rows = self.mag_card_rows
+            state = (
+                rows,
+                normalized_query,
+                sort_key,
+                status_filter,
+                getattr(self, "mag_page", 0),
+            )
+            last = last_list_state.get("state")
+            if last is not None and last[0] is rows and last[1:] == state[1:]:
+                return
+            last_list_state["state"] = state
 
-                indices.sort(key=_quantity, reverse=True)
+            if last is not None and last[0] is rows and last[1:4] == state[1:4]:
+                # only the page changed: slice the previous result
+                rows = last_list_state["matches"]
+            else:
+                def _matches(row: dict) -> bool:
+                    if status_filter != "all":
+                        is_sold = row["_is_sold"]
+                        if status_filter == "none" or is_sold != (
+                            status_filter == "sold"
+                        ):
+                            return False
+                    blob = _mag_search_blob(row)
+                    return all(term in blob for term in terms)
+
+                # each sort order is computed once per loaded row list;
+                # filtering the sorted list keeps that order, so keystrokes
+                # only pay for the filter
+                orders = last_list_state.get("orders")
+                if orders is None or orders[0] is not rows:
+                    orders = last_list_state["orders"] = (rows, {})
+                ordered = orders[1].get(sort_key)
+                if ordered is None:
+                    ordered = list(rows)
+                    if sort_key == "added":
+                        ordered.sort(key=itemgetter("_added_key"), reverse=True)
+                    elif sort_key == "name":
+                        ordered.sort(key=itemgetter("_name_key"))
+                    elif sort_key == "price":
+                        ordered.sort(key=itemgetter("_price_key"))
+                    elif sort_key == "quantity":
+                        ordered.sort(key=itemgetter("_qty_key"), reverse=True)
+                    orders[1][sort_key] = ordered
+                rows = [r for r in ordered if _matches(r)]
+                last_list_state["matches"] = rows
 
             page_size = max(1, int(getattr(self, "_mag_page_size", 20) or 20))
-            total_items = len(indices)
+            total_items = len(rows)
             total_pages = max(1, (total_items + page_size - 1) // page_size)
             current_page = getattr(self, "mag_page", 0)
             if current_page >= total_pages:
@@ -3808,8 +4753,11 @@ class CardEditorApp:
             self.mag_page = current_page
             start = current_page * page_size
             end = start + page_size
-            page_indices = indices[start:end]
+            page_indices = [r["_index"] for r in rows[start:end]]
             self._mag_total_pages = total_pages
+            request_thumbnails = getattr(self, "_mag_request_thumbnails", None)
+            if callable(request_thumbnails):
+                request_thumbnails(page_indices)
 
             label = getattr(self, "mag_page_label", None)
             if label is not None:
@@ -3833,100 +4781,94 @@ class CardEditorApp:
                     except Exception:
                         pass
 
-            unbind = getattr(self.mag_list_frame, "unbind", None)
-            if callable(unbind) and getattr(self, "_mag_bind_id", None):
-                unbind("<Configure>", self._mag_bind_id)
-                self._mag_bind_id = None
-            root_unbind = getattr(current_root, "unbind", None)
-            if callable(root_unbind) and getattr(self, "_root_mag_bind_id", None):
-                root_unbind("<Configure>", self._root_mag_bind_id)
-                self._root_mag_bind_id = None
-
-            frames = getattr(self, "mag_card_frames", [])
-            self.mag_card_frames = []
-            for frame in frames:
-                try:
-                    frame.destroy()
-                except Exception:
-                    pass
             labels = getattr(self, "mag_card_image_labels", [])
             for i in range(len(labels)):
                 labels[i] = None
+            self.mag_card_frames = []
             self.mag_card_labels = []
             self.mag_sold_labels = []
             displayed = set(page_indices)
 
-            for idx in page_indices:
+            # Card widgets are pooled: a page change reconfigures the frames
+            # built for earlier pages and hides the surplus instead of
+            # destroying and recreating every widget.
+            pool = self._mag_card_pool
+            while len(pool) < len(page_indices):
+                pool.append(_new_card_entry())
+            if frame_grid_remove:
+                for entry in pool[len(page_indices):]:
+                    entry["frame"].grid_remove()
+            gridded_cols, gridded = self._mag_gridded
+            self._mag_gridded = (gridded_cols, min(gridded, len(page_indices)))
+
+            for entry, idx in zip(pool, page_indices):
                 row = self.mag_card_rows[idx]
                 photo = self.mag_card_images[idx]
-                frame = ctk.CTkFrame(list_frame, fg_color=BG_COLOR)
-                col_conf = getattr(frame, "grid_columnconfigure", None)
-                if callable(col_conf):
-                    col_conf(0, weight=1)
-                is_sold = str(row.get("sold") or "").lower() in {"1", "true", "yes"}
+                is_sold = row["_is_sold"]
                 text = row.get("name", "")
                 color = TEXT_COLOR
-                font = None
                 if is_sold:
                     text = f"[SOLD] {text}"
                     color = SOLD_COLOR
-                    if hasattr(ctk, "CTkFont"):
-                        font = ctk.CTkFont(size=20, overstrike=True)
-                    else:
-                        font = ("TkDefaultFont", 20, "overstrike")
 
-                img_label = ctk.CTkLabel(frame, image=photo, text="")
-                grid = getattr(img_label, "grid", None)
-                if callable(grid):
-                    grid(row=0, column=0, sticky="n")
+                img_label = entry["image"]
+                # cards redrawn with the content they already show (e.g. a
+                # filter change that keeps the same first page) are not
+                # reconfigured at all
+                if entry["photo"] is not photo:
+                    _configure(img_label, image=photo)
+                    entry["photo"] = photo
                 self.mag_card_image_labels[idx] = img_label
 
                 count = int(row.get("_count", 1))
+                badge = entry["badge"]
                 if count > 1:
-                    badge = ctk.CTkLabel(
-                        frame,
-                        text=str(count),
-                        fg_color="#FF0000",
-                        text_color="white",
-                        width=20,
-                        height=20,
-                        corner_radius=10,
-                    )
-                    place = getattr(badge, "place", None)
-                    if callable(place):
-                        place(in_=img_label, relx=1.0, rely=0.0, anchor="ne")
-                        lift = getattr(badge, "lift", None)
-                        if callable(lift):
-                            lift()
+                    if badge is None:
+                        badge = entry["badge"] = ctk.CTkLabel(
+                            entry["frame"],
+                            text=str(count),
+                            fg_color="#FF0000",
+                            text_color="white",
+                            width=20,
+                            height=20,
+                            corner_radius=10,
+                        )
+                    else:
+                        _configure(badge, text=str(count))
+                    if badge_place:
+                        badge.place(in_=img_label, relx=1.0, rely=0.0, anchor="ne")
+                        badge.lift()
                     else:
                         grid_badge = getattr(badge, "grid", None)
                         if callable(grid_badge):
                             grid_badge(row=0, column=0, sticky="ne")
                         else:
                             badge.pack()
+                elif badge is not None:
+                    if badge_place:
+                        badge.place_forget()
+                    else:
+                        _forget(badge, "grid_remove", "pack_forget")
+
+                label = entry["label"]
+                # the thumbnail size changes when the window is resized, so a
+                # pooled label keeping its text may still need a new width
+                if entry["text"] != text or entry["thumb_size"] != CARD_THUMB_SIZE:
+                    label_kwargs = {
+                        "text": text,
+                        "text_color": color,
+                        "width": CARD_THUMB_SIZE,
+                        "wraplength": CARD_THUMB_SIZE,
+                    }
+                    if is_sold != entry["sold"]:
+                        label_kwargs["font"] = sold_font if is_sold else normal_font
+                        entry["sold"] = is_sold
+                    _configure(label, **label_kwargs)
+                    entry["text"] = text
+                    entry["thumb_size"] = CARD_THUMB_SIZE
 
-                label_kwargs = {
-                    "text": text,
-                    "text_color": color,
-                    "width": CARD_THUMB_SIZE,
-                    "wraplength": CARD_THUMB_SIZE,
-                    "justify": "center",
-                }
-                if font is not None:
-                    label_kwargs["font"] = font
-                label = ctk.CTkLabel(frame, **label_kwargs)
-                grid = getattr(label, "grid", None)
-                if callable(grid):
-                    grid(row=1, column=0, sticky="new")
-
-                self.mag_card_frames.append(frame)
-
-                for widget in (img_label, label):
-                    widget.bind("<Button-1>", lambda e, r=row: self.show_card_details(r))
-                    widget.bind(
-                        "<Double-Button-1>",
-                        lambda e, r=row: self.show_card_details(r),
-                    )
+                self.mag_card_frames.append(entry["frame"])
+                entry["row"] = row
 
                 if is_sold:
                     self.mag_sold_labels.append(label)
@@ -3936,40 +4878,62 @@ class CardEditorApp:
             for i in range(len(self.mag_card_image_labels)):
                 if i not in displayed:
                     self.mag_card_image_labels[i] = None
+            # the relayout below re-measures the scroll region for the new cards
+            self._mag_bbox_dirty = True
             canvas = getattr(list_frame, "_parent_canvas", None)
-            if canvas is not None:
-                def _update_scroll_region():
-                    bbox = canvas.bbox("all") or (0, 0, 0, 0)
-                    canvas.configure(scrollregion=bbox)
-
-                canvas_after_idle = getattr(canvas, "after_idle", None)
-                if callable(canvas_after_idle):
-                    canvas_after_idle(_update_scroll_region)
-                else:
-                    _update_scroll_region()
-
             list_after_idle = getattr(list_frame, "after_idle", None)
             if callable(list_after_idle):
                 list_after_idle(_relayout_mag_cards)
             else:
                 _relayout_mag_cards()
 
-            bind = getattr(self.mag_list_frame, "bind", None)
-            if callable(bind):
-                self._mag_bind_id = bind("<Configure>", _relayout_mag_cards)
-            canvas_bind = getattr(canvas, "bind", None)
-            if callable(canvas_bind):
-                self._mag_canvas_bind_id = canvas_bind("<Configure>", _relayout_mag_cards)
-            root_bind = getattr(current_root, "bind", None)
-            if callable(root_bind):
-                self._root_mag_bind_id = root_bind("<Configure>", _relayout_mag_cards)
+            # One resize binding per view.  The grid width is read from the
+            # scroll canvas, so its <Configure> is the only event that
+            # matters; the list frame and root fire for the same resize (the
+            # root once per descendant).  Without a canvas, fall back to the
+            # root and ignore events bubbling up from its children.
+            if getattr(self, "_mag_configure_binding", None) is None:
+                def _root_configure(event=None):
+                    if event is None or event.widget is current_root:
+                        _schedule_relayout(event)
+
+                if callable(getattr(canvas, "bind", None)):
+                    target, handler = canvas, _schedule_relayout
+                else:
+                    target, handler = current_root, _root_configure
+                bind = getattr(target, "bind", None)
+                if callable(bind):
+                    self._mag_configure_binding = (
+                        target,
+                        bind("<Configure>", handler),
+                    )
 
         self._update_mag_list = _update_mag_list
 
+        self._search_after_id = None
+
         def _reset_page_and_update(*_args):
+            pending = self._search_after_id
+            if pending is not None:
+                self._search_after_id = None
+                cancel = getattr(self.root, "after_cancel", None)
+                if callable(cancel):
+                    cancel(pending)
             self.mag_page = 0
             _update_mag_list()
 
+        def _schedule_search(*_args):
+            """Filter once typing pauses instead of on every keystroke."""
+            after = getattr(self.root, "after", None)
+            if not callable(after):
+                _reset_page_and_update()
+                return
+            pending = self._search_after_id
+            if pending is not None:
+                self.root.after_cancel(pending)
+            self._search_after_id = after(MAG_SEARCH_DELAY_MS, _reset_page_and_update)
+
+        self.mag_search_var.trace_add("write", _schedule_search)
         if hasattr(search_entry, "bind"):
             search_entry.bind("<Return>", lambda _e: _reset_page_and_update())
         if hasattr(search_button, "configure"):
@@ -4040,17 +5004,11 @@ class CardEditorApp:
 
         def _close_mag_window():
             """Return to the previous screen and remove magazyn bindings."""
-            mag_frame = getattr(self, "mag_list_frame", None)
-            if mag_frame is not None:
-                unbind = getattr(mag_frame, "unbind", None)
-                if callable(unbind) and getattr(self, "_mag_bind_id", None):
-                    unbind("<Configure>", self._mag_bind_id)
-            if getattr(self, "_root_mag_bind_id", None):
-                root_unbind = getattr(current_root, "unbind", None)
-                if callable(root_unbind):
-                    root_unbind("<Configure>", self._root_mag_bind_id)
-            self._mag_bind_id = None
-            self._root_mag_bind_id = None
+            _unbind_configure(getattr(self, "_mag_configure_binding", None))
+            self._mag_configure_binding = None
+            if self._mag_relayout_after is not None:
+                current_root.after_cancel(self._mag_relayout_after)
+                self._mag_relayout_after = None
             if hasattr(self, "back_to_welcome"):
                 self.back_to_welcome()
 
@@ -4192,23 +5150,47 @@ class CardEditorApp:
             return
 
         col_occ = getattr(self, "_mag_column_occ", {})
-
-        for (box, col), bar in self.mag_progressbars.items():
-            filled = col_occ.get((box, col), 0)
-            columns = storage.BOX_COLUMNS.get(box, 4)
-            total_capacity = storage.BOX_CAPACITY.get(
-                box, columns * storage.BOX_COLUMN_CAPACITY
-            )
-            if columns:
-                col_capacity = total_capacity / columns
-            else:
-                col_capacity = storage.BOX_COLUMN_CAPACITY
-            col_capacity = max(1, min(col_capacity, storage.BOX_COLUMN_CAPACITY))
-            value = filled / col_capacity if col_capacity else 0
-            bar.set(value)
-            lbl = self.mag_percent_labels.get((box, col))
-            if lbl:
-                lbl.configure(text=f"{value * 100:.0f}%", text_color=_occupancy_color(value))
+        # reload_mag_cards swaps in a new occupancy dict and the view builds a
+        # new bar dict, so identical objects mean the bars are up to date
+        drawn = getattr(self, "_mag_bars_drawn", None)
+        if (
+            drawn is None
+            or drawn[0] is not self.mag_progressbars
+            or drawn[1] is not col_occ
+        ):
+            self._mag_bars_drawn = (self.mag_progressbars, col_occ)
+            # per-column capacity only depends on the box; resolve it once
+            # per box rather than once per progress bar
+            box_capacity: dict[int, float] = {}
+            percent_cache = getattr(self, "_mag_percent_cache", None)
+            if percent_cache is None:
+                percent_cache = self._mag_percent_cache = {}
+
+            for (box, col), bar in self.mag_progressbars.items():
+                filled = col_occ.get((box, col), 0)
+                col_capacity = box_capacity.get(box)
+                if col_capacity is None:
+                    columns = storage.BOX_COLUMNS.get(box, 4)
+                    total_capacity = storage.BOX_CAPACITY.get(
+                        box, columns * storage.BOX_COLUMN_CAPACITY
+                    )
+                    if columns:
+                        col_capacity = total_capacity / columns
+                    else:
+                        col_capacity = storage.BOX_COLUMN_CAPACITY
+                    col_capacity = max(
+                        1, min(col_capacity, storage.BOX_COLUMN_CAPACITY)
+                    )
+                    box_capacity[box] = col_capacity
+                value = filled / col_capacity if col_capacity else 0
+                bar.set(value)
+                lbl = self.mag_percent_labels.get((box, col))
+                if lbl:
+                    # only columns whose shown percentage changed are redrawn
+                    shown = (lbl, f"{value * 100:.0f}%", _occupancy_color(value))
+                    if percent_cache.get((box, col)) != shown:
+                        lbl.configure(text=shown[1], text_color=shown[2])
+                        percent_cache[(box, col)] = shown
 
         if hasattr(self, "update_inventory_stats"):
             try:
@@ -4257,18 +5239,61 @@ class CardEditorApp:
         right.pack(side="left", fill="both", expand=True, pady=10)
 
         img_path = row.get("image") or ""
-        img = _load_image(img_path)
-        text = ""
-        if img is None:
-            logger.info("Missing image for %s", img_path)
-            img = Image.new("RGB", (300, 300), "#111111")
-            text = "Brak skanu"
-        img.thumbnail((300, 300))
-        photo = _create_image(img)
-        img_lbl = ctk.CTkLabel(left, image=photo, text=text, compound="center", text_color="white")
-        img_lbl.image = photo  # keep reference
+        placeholder = _create_image(Image.new("RGB", (300, 300), "#111111"))
+        img_lbl = ctk.CTkLabel(
+            left, image=placeholder, text="", compound="center", text_color="white"
+        )
+        img_lbl.image = placeholder  # keep reference
         img_lbl.pack()
 
+        def _show_scan(img: Optional[Image.Image]) -> None:
+            exists_fn = getattr(top, "winfo_exists", None)
+            if exists_fn is not None and not exists_fn():
+                return
+            if img is None:
+                logger.info("Missing image for %s", img_path)
+                kwargs = {"text": "Brak skanu"}
+            else:
+                photo = _create_image(img)
+                img_lbl.image = photo
+                kwargs = {"image": photo}
+            configure = getattr(img_lbl, "configure", None)
+            try:
+                if callable(configure):
+                    configure(**kwargs)
+                else:
+                    for key, value in kwargs.items():
+                        setattr(img_lbl, key, value)
+            except tk.TclError:
+                pass
+
+        def _load_scan() -> Optional[Image.Image]:
+            if not img_path:
+                return None
+            try:
+                mtime_ns = os.stat(img_path).st_mtime_ns
+            except OSError:
+                img = _load_image(img_path)  # remote scan
+                if img is not None:
+                    img.thumbnail((300, 300))
+                return img
+            return _load_card_preview(img_path, mtime_ns)
+
+        # remote scans can take seconds to download; open the window with a
+        # placeholder and let the image pool fetch and scale the scan
+        after = getattr(top, "after", None)
+        if img_path and callable(after):
+            def _worker() -> None:
+                img = _load_scan()
+                try:
+                    after(0, lambda: _show_scan(img))
+                except (RuntimeError, tk.TclError):
+                    pass  # window closed or main loop gone
+
+            _MAG_IMAGE_POOL.submit(_worker)
+        else:
+            _show_scan(_load_scan())
+
         fields = [
             ("name", "Name"),
             ("number", "Number"),
@@ -4285,10 +5310,9 @@ class CardEditorApp:
                 codes = [c.strip() for c in str(val).split(";") if c.strip()]
                 if codes:
                     selected_default = codes[0]
-                    pattern = re.compile(r"K(\d+)R(\d+)P(\d+)")
                     parsed = []
                     for code in codes:
-                        m = pattern.fullmatch(code)
+                        m = _LOCATION_CODE_RE.fullmatch(code)
                         if m:
                             parsed.append((code, m.group(1), m.group(2), m.group(3)))
                         else:  # pragma: no cover - unexpected format
@@ -4402,32 +5426,16 @@ class CardEditorApp:
         """Mark the card as sold, update CSV and refresh views."""
 
         csv_path = getattr(csv_utils, "WAREHOUSE_CSV", "magazyn.csv")
-        try:
-            with open(csv_path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f, delimiter=";")
-                rows = list(reader)
-                fieldnames = reader.fieldnames or []
-        except FileNotFoundError:
+        if not os.path.exists(csv_path):
             return
 
-        if "sold" not in fieldnames:
-            fieldnames.append("sold")
-
         codes = [
             c.strip()
             for c in str(row.get("warehouse_code", "")).split(";")
             if c.strip()
         ]
         target = warehouse_code or (codes[0] if codes else "")
-        for r in rows:
-            if r.get("warehouse_code") == target:
-                r["sold"] = "1"
-                break
-
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=";")
-            writer.writeheader()
-            writer.writerows(rows)
+        csv_utils.set_sold_flag(target, True, csv_path)
 
         if window is not None:
             try:
@@ -4453,29 +5461,14 @@ class CardEditorApp:
         """Toggle the sold flag for a warehouse card and update CSV."""
 
         csv_path = getattr(csv_utils, "WAREHOUSE_CSV", "magazyn.csv")
-        try:
-            with open(csv_path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f, delimiter=";")
-                rows = list(reader)
-                fieldnames = reader.fieldnames or []
-        except FileNotFoundError:
+        if not os.path.exists(csv_path):
             return
 
-        if "sold" not in fieldnames:
-            fieldnames.append("sold")
-
         target = str(row.get("warehouse_code", ""))
-        for r in rows:
-            if r.get("warehouse_code") == target:
-                current = str(r.get("sold") or "").lower() in {"1", "true", "yes"}
-                r["sold"] = "" if current else "1"
-                row["sold"] = r["sold"]
-                break
-
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=";")
-            writer.writeheader()
-            writer.writerows(rows)
+        value = csv_utils.set_sold_flag(target, None, csv_path)
+        if value is not None:
+            row["sold"] = value
+            row["_is_sold"] = bool(value)
 
         if window is not None:
             try:
@@ -4505,12 +5498,11 @@ class CardEditorApp:
         # Set a sensible minimum size and allow resizing
         self.root.minsize(1200, 800)
         self.pricing_frame = tk.Frame(
-            self.root, bg=self.root.cget("background")
+            self.root, bg=_root_bg(self)
         )
         self.pricing_frame.pack(expand=True, fill="both", padx=10, pady=10)
 
-        self.pricing_frame.columnconfigure(0, weight=1)
-        self.pricing_frame.columnconfigure(1, weight=1)
+        self.pricing_frame.columnconfigure((0, 1), weight=1)
         self.pricing_frame.rowconfigure(1, weight=1)
 
         logo_path = os.path.join(os.path.dirname(__file__), "banner22.png")
@@ -4526,21 +5518,20 @@ class CardEditorApp:
                 ).grid(row=0, column=0, columnspan=2, pady=(0, 10))
 
         self.input_frame = tk.Frame(
-            self.pricing_frame, bg=self.root.cget("background")
+            self.pricing_frame, bg=_root_bg(self)
         )
         self.input_frame.grid(row=1, column=0, sticky="nsew")
 
         self.image_frame = tk.Frame(
-            self.pricing_frame, bg=self.root.cget("background")
+            self.pricing_frame, bg=_root_bg(self)
         )
         self.image_frame.grid(row=1, column=1, sticky="nsew")
 
-        self.input_frame.columnconfigure(0, weight=1)
-        self.input_frame.columnconfigure(1, weight=1)
+        self.input_frame.columnconfigure((0, 1), weight=1)
         self.input_frame.rowconfigure(5, weight=1)
 
         tk.Label(
-            self.input_frame, text="Nazwa", bg=self.root.cget("background")
+            self.input_frame, text="Nazwa", bg=_root_bg(self)
         ).grid(row=0, column=0, sticky="e")
         self.price_name_entry = ctk.CTkEntry(
             self.input_frame, width=200, placeholder_text="Nazwa karty"
@@ -4548,7 +5539,7 @@ class CardEditorApp:
         self.price_name_entry.grid(row=0, column=1, sticky="ew")
 
         tk.Label(
-            self.input_frame, text="Numer", bg=self.root.cget("background")
+            self.input_frame, text="Numer", bg=_root_bg(self)
         ).grid(row=1, column=0, sticky="e")
         self.price_number_entry = ctk.CTkEntry(
             self.input_frame, width=200, placeholder_text="Numer"
@@ -4556,7 +5547,7 @@ class CardEditorApp:
         self.price_number_entry.grid(row=1, column=1, sticky="ew")
 
         tk.Label(
-            self.input_frame, text="Set", bg=self.root.cget("background")
+            self.input_frame, text="Set", bg=_root_bg(self)
         ).grid(row=2, column=0, sticky="e")
         self.price_set_entry = ctk.CTkEntry(
             self.input_frame, width=200, placeholder_text="Set"
@@ -4573,11 +5564,10 @@ class CardEditorApp:
         self.price_reverse_var.trace_add("write", lambda *a: self.on_reverse_toggle())
 
         btn_frame = tk.Frame(
-            self.input_frame, bg=self.root.cget("background")
+            self.input_frame, bg=_root_bg(self)
         )
         btn_frame.grid(row=4, column=0, columnspan=2, pady=5, sticky="ew")
-        btn_frame.columnconfigure(0, weight=1)
-        btn_frame.columnconfigure(1, weight=1)
+        btn_frame.columnconfigure((0, 1), weight=1)
 
         self.create_button(
             btn_frame,
@@ -4596,18 +5586,18 @@ class CardEditorApp:
         ).grid(row=0, column=1, padx=5)
 
         self.result_frame = tk.Frame(
-            self.image_frame, bg=self.root.cget("background")
+            self.image_frame, bg=_root_bg(self)
         )
         self.result_frame.pack(expand=True, fill="both", pady=10)
 
         self.pool_frame = tk.Frame(
-            self.pricing_frame, bg=self.root.cget("background")
+            self.pricing_frame, bg=_root_bg(self)
         )
         self.pool_frame.grid(row=2, column=0, columnspan=2, pady=5)
         self.pool_total_label = tk.Label(
             self.pool_frame,
             text="Suma puli: 0.00",
-            bg=self.root.cget("background"),
+            bg=_root_bg(self),
             fg=TEXT_COLOR,
         )
         self.pool_total_label.pack(side="left")
@@ -4638,39 +5628,58 @@ class CardEditorApp:
             return
         self.current_price_info = info
 
-        if info.get("image_url"):
+        # the card image and set logo are downloaded on the image pool; the
+        # labels are packed now so the layout order stays fixed and only
+        # receive their images once the downloads finish
+        token = object()
+        self._pricing_token = token
+        root = self.root
+
+        def _fetch(url, size, attr, label):
             try:
-                res = requests.get(info["image_url"], timeout=10)
-                if res.status_code == 200:
-                    img = load_rgba_image(io.BytesIO(res.content))
-                    if img:
-                        img.thumbnail((240, 340))
-                        self.pricing_photo = _create_image(img)
-                        self.result_image_label = ctk.CTkLabel(
-                            self.result_frame,
-                            image=self.pricing_photo,
-                            text="",
-                        )
-                        self.result_image_label.pack(pady=5)
+                img = load_rgba_image(io.BytesIO(_fetch_url_bytes(url)))
+                if img:
+                    img.thumbnail(size)
             except (requests.RequestException, OSError, UnidentifiedImageError) as e:
-                logger.warning("Loading image failed: %s", e)
+                logger.warning("Loading image %s failed: %s", url, e)
+                img = None
+            root.after(0, lambda: _apply(img, attr, label))
 
-        if info.get("set_logo_url"):
+        def _apply(img, attr, label):
+            if getattr(self, "_pricing_token", None) is not token:
+                return
             try:
-                res = requests.get(info["set_logo_url"], timeout=10)
-                if res.status_code == 200:
-                    img = load_rgba_image(io.BytesIO(res.content))
-                    if img:
-                        img.thumbnail((180, 60))
-                        self.set_logo_photo = _create_image(img)
-                        self.set_logo_label = ctk.CTkLabel(
-                            self.result_frame,
-                            image=self.set_logo_photo,
-                            text="",
-                        )
-                        self.set_logo_label.pack(pady=5)
-            except (requests.RequestException, OSError, UnidentifiedImageError) as e:
-                logger.warning("Loading set logo failed: %s", e)
+                if img is None:
+                    label.destroy()
+                    return
+                photo = _create_image(img)
+                setattr(self, attr, photo)
+                label.configure(image=photo)
+            except tk.TclError:
+                # the result frame was cleared in the meantime
+                pass
+
+        if info.get("image_url"):
+            self.result_image_label = ctk.CTkLabel(self.result_frame, text="")
+            self.result_image_label.pack(pady=5)
+            _MAG_IMAGE_POOL.submit(
+                _fetch,
+                info["image_url"],
+                (240, 340),
+                "pricing_photo",
+                self.result_image_label,
+            )
+
+        if info.get("set_logo_url"):
+            self.set_logo_label = ctk.CTkLabel(self.result_frame, text="")
+            self.set_logo_label.pack(pady=5)
+            _MAG_IMAGE_POOL.submit(
+                _fetch,
+                info["set_logo_url"],
+                (180, 60),
+                "set_logo_photo",
+                self.set_logo_label,
+            )
         self.display_price_info(info, is_reverse)
 
     def display_price_info(self, info, is_reverse):
@@ -4679,32 +5688,18 @@ class CardEditorApp:
             info["price_pln"], is_reverse=is_reverse
         )
         price_80 = round(price_pln * 0.8, 2)
+        texts = [
+            f"Cena EUR: {info['price_eur']}",
+            f"Kurs EUR→PLN: {info['eur_pln_rate']}",
+            f"Cena PLN: {price_pln}",
+            f"80% ceny PLN: {price_80}",
+        ]
         if not getattr(self, "price_labels", None):
-            eur = tk.Label(
-                self.result_frame,
-                text=f"Cena EUR: {info['price_eur']}",
-                fg="blue",
-                bg=self.root.cget("background"),
-            )
-            rate = tk.Label(
-                self.result_frame,
-                text=f"Kurs EUR→PLN: {info['eur_pln_rate']}",
-                fg="gray",
-                bg=self.root.cget("background"),
-            )
-            pln = tk.Label(
-                self.result_frame,
-                text=f"Cena PLN: {price_pln}",
-                fg="green",
-                bg=self.root.cget("background"),
-            )
-            pln80 = tk.Label(
-                self.result_frame,
-                text=f"80% ceny PLN: {price_80}",
-                fg="red",
-                bg=self.root.cget("background"),
-            )
-            for lbl in (eur, rate, pln, pln80):
+            self.price_labels = [
+                tk.Label(self.result_frame, text=text, fg=color, bg=_root_bg(self))
+                for text, color in zip(texts, ("blue", "gray", "green", "red"))
+            ]
+            for lbl in self.price_labels:
                 lbl.pack()
             self.add_pool_button = self.create_button(
                 self.result_frame,
@@ -4713,19 +5708,24 @@ class CardEditorApp:
                 fg_color=SAVE_BUTTON_COLOR,
             )
             self.add_pool_button.pack(pady=5)
-            self.price_labels = [eur, rate, pln, pln80]
         else:
-            eur, rate, pln, pln80 = self.price_labels
-            eur.config(text=f"Cena EUR: {info['price_eur']}")
-            rate.config(text=f"Kurs EUR→PLN: {info['eur_pln_rate']}")
-            pln.config(text=f"Cena PLN: {price_pln}")
-            pln80.config(text=f"80% ceny PLN: {price_80}")
+            # the reverse toggle only changes the PLN lines, so the EUR price
+            # and rate labels are left alone
+            old_texts = getattr(self, "_price_label_texts", [None] * len(texts))
+            for lbl, text, old in zip(self.price_labels, texts, old_texts):
+                if text != old:
+                    lbl.config(text=text)
+        self._price_label_texts = texts
+        self._last_reverse_state = bool(is_reverse)
 
     def on_reverse_toggle(self, *args):
-        if getattr(self, "current_price_info", None):
-            self.display_price_info(
-                self.current_price_info, self.price_reverse_var.get()
-            )
+        if not getattr(self, "current_price_info", None):
+            return
+        is_reverse = bool(self.price_reverse_var.get())
+        # the variable trace also fires for writes that keep the same value
+        if is_reverse == getattr(self, "_last_reverse_state", None):
+            return
+        self.display_price_info(self.current_price_info, is_reverse)
 
     def add_to_price_pool(self):
         if not getattr(self, "current_price_info", None):
@@ -4755,6 +5755,16 @@ class CardEditorApp:
             ):
                 return
         self.in_scan = False
+        pending = getattr(self, "_filter_sets_after_id", None)
+        if pending is not None:
+            # the set dropdown it filters is destroyed with the editor
+            self._filter_sets_after_id = None
+            cancel = getattr(self.root, "after_cancel", None)
+            if callable(cancel):
+                cancel(pending)
+        _close_session_csv(self)
+        _cancel_image_jobs((getattr(self, "_card_prefetch", None) or {}).values())
+        self._card_prefetch = None
         if getattr(self, "pricing_frame", None):
             self.pricing_frame.destroy()
             self.pricing_frame = None
@@ -4767,6 +5777,7 @@ class CardEditorApp:
             labels = getattr(self, "mag_card_image_labels", [])
             for i in range(len(labels)):
                 labels[i] = None
+            _cancel_image_jobs(getattr(self, "_image_threads", []))
         if getattr(self, "location_frame", None):
             self.location_frame.destroy()
             self.location_frame = None
@@ -4782,12 +5793,12 @@ class CardEditorApp:
         # Provide a minimum size and allow the editor to expand
         self.root.minsize(1200, 800)
         self.frame = tk.Frame(
-            self.root, bg=self.root.cget("background")
+            self.root, bg=_root_bg(self)
         )
         self.frame.pack(expand=True, fill="both", padx=10, pady=10)
-        # Allow widgets inside the frame to expand properly
-        for i in range(6):
-            self.frame.columnconfigure(i, weight=1)
+        # Allow widgets inside the frame to expand properly; Tk accepts a
+        # list of indices, so all columns are set in a single grid call
+        self.frame.columnconfigure(tuple(range(6)), weight=1)
         self.frame.rowconfigure(2, weight=1)
 
         logo_path = os.path.join(os.path.dirname(__file__), "banner22.png")
@@ -4811,7 +5822,7 @@ class CardEditorApp:
 
         # Bottom frame for action buttons
         self.button_frame = tk.Frame(
-            self.frame, bg=self.root.cget("background")
+            self.frame, bg=_root_bg(self)
         )
         # Do not stretch the button frame so that buttons remain centered
         self.button_frame.grid(row=15, column=0, columnspan=6, pady=10)
@@ -4878,18 +5889,19 @@ class CardEditorApp:
         )
         ctk.CTkLabel(self.info_frame, text="Informacje o karcie").grid(row=0, column=0, columnspan=8, pady=(0,5))
         start_row = 1
-        for i in range(8):
-            self.info_frame.columnconfigure(i, weight=1)
+        self.info_frame.columnconfigure(tuple(range(8)), weight=1)
 
         self.entries = {}
 
         grid_opts = {"padx": 5, "pady": 2}
+        label_opts = {"bg": FIELD_BG_COLOR, "fg": TEXT_COLOR}
 
-        tk.Label(
-            self.info_frame, text="Język", bg=FIELD_BG_COLOR, fg=TEXT_COLOR
-        ).grid(
-            row=start_row, column=0, sticky="w", **grid_opts
-        )
+        def info_label(text, row):
+            label = tk.Label(self.info_frame, text=text, **label_opts)
+            label.grid(row=row, column=0, sticky="w", **grid_opts)
+            return label
+
+        info_label("Język", start_row)
         self.lang_var = tk.StringVar(value="ENG")
         self.entries["język"] = self.lang_var
         lang_dropdown = ctk.CTkComboBox(
@@ -4898,29 +5910,19 @@ class CardEditorApp:
         lang_dropdown.grid(row=start_row, column=1, sticky="ew", **grid_opts)
         lang_dropdown.bind("<<ComboboxSelected>>", self.update_set_options)
 
-        tk.Label(
-            self.info_frame, text="Nazwa", bg=FIELD_BG_COLOR, fg=TEXT_COLOR
-        ).grid(
-            row=start_row + 1, column=0, sticky="w", **grid_opts
-        )
+        info_label("Nazwa", start_row + 1)
         self.entries["nazwa"] = ctk.CTkEntry(
             self.info_frame, width=200, placeholder_text="Nazwa"
         )
         self.entries["nazwa"].grid(row=start_row + 1, column=1, sticky="ew", **grid_opts)
 
-        tk.Label(
-            self.info_frame, text="Numer", bg=FIELD_BG_COLOR, fg=TEXT_COLOR
-        ).grid(
-            row=start_row + 2, column=0, sticky="w", **grid_opts
-        )
+        info_label("Numer", start_row + 2)
         self.entries["numer"] = ctk.CTkEntry(
             self.info_frame, width=200, placeholder_text="Numer"
         )
         self.entries["numer"].grid(row=start_row + 2, column=1, sticky="ew", **grid_opts)
 
-        tk.Label(
-            self.info_frame, text="Era", bg=FIELD_BG_COLOR, fg=TEXT_COLOR
-        ).grid(row=start_row + 3, column=0, sticky="w", **grid_opts)
+        info_label("Era", start_row + 3)
         self.era_var = tk.StringVar()
         self.era_dropdown = ctk.CTkComboBox(
             self.info_frame,
@@ -4932,25 +5934,17 @@ class CardEditorApp:
         self.era_dropdown.bind("<<ComboboxSelected>>", self.update_set_options)
         self.entries["era"] = self.era_var
 
-        tk.Label(
-            self.info_frame, text="Set", bg=FIELD_BG_COLOR, fg=TEXT_COLOR
-        ).grid(
-            row=start_row + 4, column=0, sticky="w", **grid_opts
-        )
+        info_label("Set", start_row + 4)
         self.set_var = tk.StringVar()
         self.set_dropdown = ctk.CTkComboBox(
             self.info_frame, variable=self.set_var, width=20
         )
         self.set_dropdown.grid(row=start_row + 4, column=1, sticky="ew", **grid_opts)
-        self.set_dropdown.bind("<KeyRelease>", self.filter_sets)
+        self.set_dropdown.bind("<KeyRelease>", self._schedule_filter_sets)
         self.set_dropdown.bind("<Tab>", self.autocomplete_set)
         self.entries["set"] = self.set_var
 
-        tk.Label(
-            self.info_frame, text="Typ", bg=FIELD_BG_COLOR, fg=TEXT_COLOR
-        ).grid(
-            row=start_row + 5, column=0, sticky="w", **grid_opts
-        )
+        info_label("Typ", start_row + 5)
         self.type_vars = {}
         self.type_frame = ctk.CTkFrame(self.info_frame)
         self.type_frame.grid(row=start_row + 5, column=1, columnspan=7, sticky="w", **grid_opts)
@@ -4964,11 +5958,7 @@ class CardEditorApp:
                 variable=var,
             ).pack(side="left", padx=2)
 
-        tk.Label(
-            self.info_frame, text="Stan", bg=FIELD_BG_COLOR, fg=TEXT_COLOR
-        ).grid(
-            row=start_row + 6, column=0, sticky="w", **grid_opts
-        )
+        info_label("Stan", start_row + 6)
         self.stan_var = tk.StringVar(value="NM")
         self.entries["stan"] = self.stan_var
         stan_dropdown = ctk.CTkComboBox(
@@ -4979,27 +5969,23 @@ class CardEditorApp:
         )
         stan_dropdown.grid(row=start_row + 6, column=1, sticky="ew", **grid_opts)
 
-        tk.Label(
-            self.info_frame, text="Cena", bg=FIELD_BG_COLOR, fg=TEXT_COLOR
-        ).grid(
-            row=start_row + 7, column=0, sticky="w", **grid_opts
-        )
+        info_label("Cena", start_row + 7)
         self.entries["cena"] = ctk.CTkEntry(
             self.info_frame, width=200, placeholder_text="Cena"
         )
         self.entries["cena"].grid(row=start_row + 7, column=1, sticky="ew", **grid_opts)
 
-        tk.Label(
-            self.info_frame, text="PSA 10", bg=FIELD_BG_COLOR, fg=TEXT_COLOR
-        ).grid(
-            row=start_row + 8, column=0, sticky="w", **grid_opts
-        )
+        info_label("PSA 10", start_row + 8)
         self.entries["psa10_price"] = ctk.CTkEntry(
             self.info_frame, width=200, placeholder_text="PSA 10"
         )
         self.entries["psa10_price"].grid(
             row=start_row + 8, column=1, sticky="ew", **grid_opts
         )
+        self._entry_resetters = {
+            key: (entry, _entry_resetter(key, entry))
+            for key, entry in self.entries.items()
+        }
 
         self.api_button = self.create_button(
             self.info_frame,
@@ -5053,10 +6039,8 @@ class CardEditorApp:
 
         self.eur_entry.bind("<Return>", self.convert_eur_to_pln)
 
-        for entry in self.entries.values():
-            if isinstance(entry, (tk.Entry, ctk.CTkEntry)):
-                entry.bind("<Return>", lambda e: self.save_and_next())
-
+        # <Return> in any field reaches this binding through the toplevel
+        # bindtag; handlers that must not save (EUR converter) return "break"
         self.root.bind("<Return>", lambda e: self.save_and_next())
         self.update_set_options()
 
@@ -5064,7 +6048,7 @@ class CardEditorApp:
             self.frame,
             height=4,
             state="disabled",
-            bg=self.root.cget("background"),
+            bg=_root_bg(self),
             fg="white",
         )
         self.log_widget.grid(row=16, column=0, columnspan=6, sticky="ew")
@@ -5088,49 +6072,34 @@ class CardEditorApp:
         if getattr(self, "cheat_frame", None) is not None:
             self.create_cheat_frame()
 
+    def _schedule_filter_sets(self, event=None):
+        """Filter the set list once typing pauses instead of on every key."""
+        after = getattr(self.root, "after", None)
+        if not callable(after):
+            self.filter_sets(event)
+            return
+        pending = getattr(self, "_filter_sets_after_id", None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._filter_sets_after_id = after(SET_FILTER_DELAY_MS, self._run_filter_sets)
+
+    def _run_filter_sets(self):
+        self._filter_sets_after_id = None
+        if _widget_exists(getattr(self, "set_dropdown", None)):
+            self.filter_sets()
+
     def filter_sets(self, event=None):
         typed = self.set_var.get().strip().lower()
         lang = self.lang_var.get().strip().upper()
         era = self.era_var.get().strip()
-        if lang == "JP":
-            sets_by_era = tcg_sets_jp_by_era
-            name_list_all = tcg_sets_jp
-            code_map_all = tcg_sets_jp_code_map
-            abbr_map_all = tcg_sets_jp_abbr_name_map
-        else:
-            sets_by_era = tcg_sets_eng_by_era
-            name_list_all = tcg_sets_eng
-            code_map_all = tcg_sets_eng_code_map
-            abbr_map_all = tcg_sets_eng_abbr_name_map
-
-        if era and era in sets_by_era:
-            name_list = [item["name"] for item in sets_by_era[era]]
-            code_map = {item["code"]: item["name"] for item in sets_by_era[era]}
-            abbr_map = {
-                item["abbr"]: item["name"]
-                for item in sets_by_era[era]
-                if "abbr" in item
-            }
-        else:
-            name_list = name_list_all
-            code_map = code_map_all
-            abbr_map = abbr_map_all
-
-        search_map = {n.lower(): n for n in name_list}
-        search_map.update({c.lower(): n for c, n in code_map.items()})
-        search_map.update({a.lower(): n for a, n in abbr_map.items()})
+        name_list, _code_map, _abbr_map, search_map = _set_search_index(lang, era)
 
         if typed:
-            matches = [search_map[k] for k in search_map if typed in k]
+            matches = [n for k, n in search_map.items() if typed in k]
             if not matches:
-                close = difflib.get_close_matches(typed, search_map.keys(), n=10, cutoff=0.6)
+                close = _close_set_keys(typed, search_map, 10)
                 matches = [search_map[k] for k in close]
-            filtered = []
-            seen = set()
-            for name in matches:
-                if name not in seen:
-                    filtered.append(name)
-                    seen.add(name)
+            filtered = list(dict.fromkeys(matches))
         else:
             filtered = name_list
         self.set_dropdown.configure(values=filtered)
@@ -5139,29 +6108,7 @@ class CardEditorApp:
         typed = self.set_var.get().strip().lower()
         lang = self.lang_var.get().strip().upper()
         era = self.era_var.get().strip()
-        if lang == "JP":
-            sets_by_era = tcg_sets_jp_by_era
-            code_map_all = tcg_sets_jp_code_map
-            abbr_map_all = tcg_sets_jp_abbr_name_map
-            name_list_all = tcg_sets_jp
-        else:
-            sets_by_era = tcg_sets_eng_by_era
-            code_map_all = tcg_sets_eng_code_map
-            abbr_map_all = tcg_sets_eng_abbr_name_map
-            name_list_all = tcg_sets_eng
-
-        if era and era in sets_by_era:
-            name_list = [item["name"] for item in sets_by_era[era]]
-            code_map = {item["code"]: item["name"] for item in sets_by_era[era]}
-            abbr_map = {
-                item.get("abbr"): item["name"]
-                for item in sets_by_era[era]
-                if "abbr" in item
-            }
-        else:
-            name_list = name_list_all
-            code_map = code_map_all
-            abbr_map = abbr_map_all
+        _name_list, code_map, abbr_map, search_map = _set_search_index(lang, era)
 
         name = None
         if typed in code_map:
@@ -5169,10 +6116,7 @@ class CardEditorApp:
         elif typed in abbr_map:
             name = abbr_map[typed]
         else:
-            search_map = {n.lower(): n for n in name_list}
-            search_map.update({c.lower(): n for c, n in code_map.items()})
-            search_map.update({a.lower(): n for a, n in abbr_map.items()})
-            close = difflib.get_close_matches(typed, search_map.keys(), n=1, cutoff=0.6)
+            close = _close_set_keys(typed, search_map, 1)
             if close:
                 name = search_map[close[0]]
         if name:
@@ -5193,51 +6137,99 @@ class CardEditorApp:
         return "break"
 
     def create_cheat_frame(self, show_headers: bool = True):
-        """Create or refresh the cheatsheet frame with set logos."""
-        if self.cheat_frame is not None:
-            self.cheat_frame.destroy()
-        self.cheat_frame = ctk.CTkScrollableFrame(
-            self.frame,
-            fg_color=self.root.cget("background"),
-            width=240,
-        )
-        self.cheat_frame.grid(row=2, column=5, rowspan=12, sticky="nsew")
+        """Create or refresh the cheatsheet frame with set logos.
 
+        One frame is kept per language and simply re-gridded when the
+        language changes; it is rebuilt only when the set data, the logos
+        or the parent frame differ from the ones it was built from.
+        """
         lang = self.lang_var.get().strip().upper()
         sets_by_era = (
             tcg_sets_jp_by_era if lang == "JP" else tcg_sets_eng_by_era
         )
+        frames = getattr(self, "_cheat_frames", None)
+        if frames is None:
+            frames = self._cheat_frames = {}
+        key = (show_headers, len(getattr(self, "_set_logo_paths", {})))
+        for other, (frame, parent, data, _key) in list(frames.items()):
+            stale = data is not sets_by_era or _key != key
+            if parent is not self.frame or (other == lang and stale):
+                frame.destroy()
+                del frames[other]
+                if frame is self.cheat_frame:
+                    self.cheat_frame = None
+
+        current = self.cheat_frame
+        cached = frames.get(lang)
+        if current is not None and (cached is None or current is not cached[0]):
+            if any(c[0] is current for c in frames.values()):
+                current.grid_remove()
+            else:
+                current.destroy()
+        if cached is not None:
+            self.cheat_frame = cached[0]
+            self.cheat_frame.grid()
+            return
+        self.cheat_frame = self._build_cheat_frame(sets_by_era, show_headers)
+        frames[lang] = (self.cheat_frame, self.frame, sets_by_era, key)
+
+    def _build_cheat_frame(self, sets_by_era, show_headers: bool):
+        frame = ctk.CTkScrollableFrame(
+            self.frame,
+            fg_color=_root_bg(self),
+            width=240,
+        )
+        frame.grid(row=2, column=5, rowspan=12, sticky="nsew")
 
-        row = 0
+        rows = []
         for era, sets in sets_by_era.items():
             if show_headers:
-                ctk.CTkLabel(
-                    self.cheat_frame,
-                    text=era,
-                    font=("Segoe UI", 12, "bold"),
-                ).grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=4)
-                row += 1
-            for item in sets:
+                rows.append((era, None))
+            rows.extend((None, item) for item in sets)
+        after = getattr(self.root, "after", None)
+
+        def add_rows(start):
+            # rows past the first batch are created from the event loop so
+            # the sheet shows up at once and fills in while the user reads it
+            if not frame.winfo_exists():
+                return
+            end = min(start + CHEAT_ROW_BATCH, len(rows))
+            for row in range(start, end):
+                era, item = rows[row]
+                if item is None:
+                    ctk.CTkLabel(
+                        frame,
+                        text=era,
+                        font=("Segoe UI", 12, "bold"),
+                    ).grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=4)
+                    continue
                 name = item["name"]
                 code = item["code"]
-                img = self.set_logos.get(code)
+                img = self.get_set_logo(code)
                 if img:
                     ctk.CTkLabel(
-                        self.cheat_frame,
+                        frame,
                         image=img,
                         text="",
                     ).grid(row=row, column=0, sticky="w", padx=5, pady=2)
                 else:
                     ctk.CTkLabel(
-                        self.cheat_frame,
+                        frame,
                         text="",
                         width=2,
                     ).grid(row=row, column=0, sticky="w", padx=5, pady=2)
                 ctk.CTkLabel(
-                    self.cheat_frame,
+                    frame,
                     text=f"{name} ({code})",
                 ).grid(row=row, column=1, sticky="w", padx=5, pady=2)
-                row += 1
+            if end < len(rows):
+                if after is None:
+                    add_rows(end)
+                else:
+                    after(1, lambda: add_rows(end))
+
+        add_rows(0)
+        return frame
 
     def toggle_cheatsheet(self):
         """Show or hide the cheatsheet with set logos."""
@@ -5307,11 +6299,7 @@ class CardEditorApp:
             if not csv_path:
                 return
             self.session_csv_path = csv_path
-            with open(csv_path, "w", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(
-                    f, fieldnames=csv_utils.COLLECTION_FIELDNAMES, delimiter=";"
-                )
-                writer.writeheader()
+            _session_csv_writer(self, new=True)
         self.in_scan = True
         CardEditorApp.load_images(self, folder)
 
@@ -5324,11 +6312,13 @@ class CardEditorApp:
             self.setup_editor_ui()
         self.folder_path = folder
         self.folder_name = os.path.basename(folder)
-        self.cards = [
-            os.path.join(folder, f)
-            for f in os.listdir(folder)
-            if f.lower().endswith((".jpg", ".png"))
-        ]
+        with os.scandir(folder) as it:
+            self.cards = [
+                e.path
+                for e in it
+                if os.path.splitext(e.name)[1][1:].lower() in SCAN_EXTENSIONS
+                and e.is_file()
+            ]
         self.cards.sort()
         self.index = 0
         self.output_data = [None] * len(self.cards)
@@ -5368,7 +6358,15 @@ class CardEditorApp:
         if not cache_key:
             cache_key = self._guess_key_from_filename(image_path)
         inv_entry = self.lookup_inventory_entry(cache_key) if cache_key else None
-        image = load_rgba_image(image_path)
+        # the scan was usually decoded on the image pool while earlier cards
+        # were being edited; only a cold start or a jump decodes it here
+        prefetch = getattr(self, "_card_prefetch", None) or {}
+        self._card_prefetch = prefetch
+        future = prefetch.pop(image_path, None)
+        if future is not None:
+            image = future.result()
+        else:
+            image = _decode_card_scan(image_path)
         if image is None:
             print(f"Failed to load image {image_path}", file=sys.stderr)
             if getattr(self, "failed_cards", None) is not None:
@@ -5376,7 +6374,12 @@ class CardEditorApp:
             self.index += 1
             self.show_card()
             return
-        image.thumbnail((400, 560))
+        upcoming = self.cards[self.index + 1 : self.index + 1 + CARD_PREFETCH_AHEAD]
+        for path in [p for p in prefetch if p not in upcoming]:
+            prefetch.pop(path).cancel()
+        for path in upcoming:
+            if path not in prefetch:
+                prefetch[path] = _MAG_IMAGE_POOL.submit(_decode_card_scan, path)
         self.current_card_image = image.copy()
         img = _create_image(image)
         self.image_objects.append(img)
@@ -5393,6 +6396,9 @@ class CardEditorApp:
                     pass
                 self.location_label.configure(text="")
 
+        resetters = getattr(self, "_entry_resetters", None)
+        if resetters is None:
+            resetters = self._entry_resetters = {}
         for key, entry in list(self.entries.items()):
             if hasattr(entry, "winfo_exists"):
                 try:
@@ -5402,25 +6408,13 @@ class CardEditorApp:
                 except tk.TclError:
                     self.entries.pop(key, None)
                     continue
+            cached = resetters.get(key)
+            if cached is None or cached[0] is not entry:
+                cached = resetters[key] = (entry, _entry_resetter(key, entry))
+            if cached[1] is None:
+                continue
             try:
-                tk_entry_cls = getattr(tk, "Entry", None)
-                ctk_entry_cls = getattr(ctk, "CTkEntry", None)
-                entry_types = tuple(
-                    t for t in (tk_entry_cls, ctk_entry_cls) if isinstance(t, type)
-                )
-                if entry_types and isinstance(entry, entry_types):
-                    entry.delete(0, tk.END)
-                elif isinstance(tk.StringVar, type) and isinstance(entry, tk.StringVar):
-                    if key == "język":
-                        entry.set("ENG")
-                    elif key == "stan":
-                        entry.set("NM")
-                    else:
-                        entry.set("")
-                else:
-                    bool_var_cls = getattr(tk, "BooleanVar", None)
-                    if isinstance(bool_var_cls, type) and isinstance(entry, bool_var_cls):
-                        entry.set(False)
+                cached[1]()
             except tk.TclError:
                 self.entries.pop(key, None)
 
@@ -5435,19 +6429,19 @@ class CardEditorApp:
                 entry = self.entries.get(field)
                 if isinstance(entry, (tk.Entry, ctk.CTkEntry)):
                     if field == "numer":
-                        value = sanitize_number(str(value))
+                        value = sanitize_number(value)
                     entry.insert(0, value)
                 elif isinstance(entry, tk.StringVar):
                     entry.set(value)
-            for name, val in cached.get("types", {}).items():
-                if name in self.type_vars:
-                    self.type_vars[name].set(val)
+            types = cached.get("types", {})
+            for type_name in types.keys() & self.type_vars.keys():
+                self.type_vars[type_name].set(types[type_name])
             self.update_set_options()
 
         elif inv_entry:
             self.entries["nazwa"].insert(0, inv_entry.get("nazwa", ""))
             self.entries["numer"].insert(
-                0, sanitize_number(str(inv_entry.get("numer", "")))
+                0, sanitize_number(inv_entry.get("numer", ""))
             )
             self.entries["set"].set(inv_entry.get("set", ""))
             self.entries["era"].set(inv_entry.get("era", ""))
@@ -5462,161 +6456,231 @@ class CardEditorApp:
         folder = os.path.basename(os.path.dirname(image_path))
         progress_cb = getattr(self, "_update_card_progress", None)
 
-        fp_match = None
         if (
             not skip_analysis
             and getattr(self, "hash_db", None)
             and getattr(self, "auto_lookup", False)
         ):
-            try:
-                with Image.open(image_path) as img_fp:
-                    try:
-                        fp = compute_fingerprint(img_fp, use_orb=True)
-                    except TypeError:
-                        fp = compute_fingerprint(img_fp)
-                self.current_fingerprint = fp
-                lookup = getattr(self, "_lookup_fp_candidate", None)
-                if lookup:
-                    fp_match = lookup(fp)
-                else:
-                    fp_match = getattr(self.hash_db, "best_match", lambda *a, **k: None)(
-                        fp, max_distance=HASH_MATCH_THRESHOLD
-                    )
-            except (OSError, UnidentifiedImageError, ValueError) as exc:
-                logger.warning("Fingerprint lookup failed for %s: %s", image_path, exc)
-                fp_match = None
-            if fp_match:
-                meta = fp_match.meta
-                self.selected_candidate_meta = meta
-                csv_row = None
-                code = meta.get("warehouse_code")
-                if code:
-                    csv_row = csv_utils.get_row_by_code(code)
-                    self.current_location = code
-                    if hasattr(self, "location_label"):
-                        self.location_label.configure(text=code)
-                if csv_row:
-                    name = csv_row.get("name", "")
-                    number = sanitize_number(str(csv_row.get("number", "")))
-                    set_name = csv_row.get("set", "")
-                else:
-                    name = meta.get("nazwa", meta.get("name", ""))
-                    number = sanitize_number(
-                        str(meta.get("numer", meta.get("number", "")))
-                    )
-                    set_name = meta.get("set", meta.get("set_name", ""))
-                variant = (
-                    csv_row.get("variant")
-                    if csv_row
-                    else meta.get("wariant") or meta.get("variant")
-                )
-                duplicates = csv_utils.find_duplicates(
-                    name, number, set_name, variant
-                )
-                if duplicates:
-                    codes = ", ".join(
-                        [d.get("warehouse_code", "") for d in duplicates if d.get("warehouse_code")]
-                    )
-                    msg = _(
-                        "Card already exists in magazyn: {codes}. Add anyway?"
-                    ).format(codes=codes)
-                    if not messagebox.askyesno(_("Duplicate"), msg):
-                        logger.info(
-                            "Skipping duplicate card %s #%s in set %s", name, number, set_name
-                        )
-                        fp_match = None
-                        skip_analysis = False
-                    else:
-                        self.current_location = self.next_free_location()
-                        if hasattr(self, "location_label"):
-                            self.location_label.configure(text=self.current_location)
-                        logger.info(
-                            "Assigned storage location %s to duplicate card", self.current_location
-                        )
-                if fp_match:
-                    self.entries["nazwa"].delete(0, tk.END)
-                    self.entries["numer"].delete(0, tk.END)
-                    self.entries["nazwa"].insert(0, name)
-                    self.entries["numer"].insert(0, number)
-                    self.entries["set"].set("")
-                    self.entries["set"].set(set_name)
-                    era_name = get_set_era(set_name)
-                    self.entries["era"].set(era_name)
-                    cena = getattr(
-                        self, "get_price_from_db", lambda *a, **k: None
-                    )(name, number, set_name)
-                    if cena is None:
-                        cena = getattr(
-                            self, "fetch_card_price", lambda *a, **k: None
-                        )(name, number, set_name)
-                    if cena is not None:
-                        self.entries["cena"].delete(0, tk.END)
-                        self.entries["cena"].insert(0, str(cena))
-                        is_rev = getattr(self, "price_reverse_var", None)
-                        price = self.apply_variant_multiplier(
-                            cena, is_reverse=is_rev.get() if is_rev else False
-                        )
-                        try:
-                            self.price_pool_total += float(price)
-                        except (TypeError, ValueError):
-                            pass
-                        if getattr(self, "pool_total_label", None):
-                            self.pool_total_label.config(
-                                text=f"Suma puli: {self.price_pool_total:.2f}"
-                            )
-                    if isinstance(meta.get("typ"), str):
-                        for name in meta["typ"].split(","):
-                            name = name.strip()
-                            if name in self.type_vars:
-                                self.type_vars[name].set(True)
-                    self.update_set_options()
-                    skip_analysis = True
-                    logger.info(
-                        "Skipping analysis for %s: fingerprint match with distance %s",
-                        filename,
-                        fp_match.distance,
-                    )
-                    if progress_cb:
-                        progress_cb(1.0)
-
-        if not skip_analysis:
             if progress_cb:
                 progress_cb(0, show=True)
+            # saving waits for the lookup; _finish_fp_lookup re-enables
+            _set_buttons_state(self, False)
             thread = threading.Thread(
-                target=self._analyze_and_fill,
-                args=(image_path, self.index),
+                target=CardEditorApp._fp_lookup_async,
+                args=(self, image_path, self.index),
                 daemon=True,
             )
             self.current_analysis_thread = thread
-            for btn_name in ("save_button", "next_button"):
-                btn = getattr(self, btn_name, None)
-                if btn is not None:
-                    try:
-                        btn.configure(state=tk.NORMAL)
-                    except Exception:
-                        pass
             thread.start()
             root_after = getattr(getattr(self, "root", None), "after", None)
             if not callable(root_after):
                 join = getattr(thread, "join", None)
                 if callable(join):
                     join()
+        elif not skip_analysis:
+            CardEditorApp._start_analysis(self, image_path, self.index)
 
         if getattr(self, "current_analysis_thread", None) is None:
-            for btn_name in ("save_button", "next_button"):
-                btn = getattr(self, btn_name, None)
-                if btn is not None:
-                    try:
-                        btn.configure(state=tk.NORMAL)
-                    except Exception:
-                        pass
+            _set_buttons_state(self, True)
 
         # focus the name entry so the user can start typing immediately
         self.entries["nazwa"].focus_set()
 
+    def _fp_lookup_async(self, image_path, idx):
+        """Fingerprint ``image_path`` on a worker thread.
+
+        The ORB step takes around a second, so it runs off the Tk thread;
+        the candidate lookup, which may open a dialog, is handed back to the
+        main loop via :meth:`_finish_fp_lookup`.
+        """
+        fp = None
+        try:
+            fp = _cached_fingerprint(image_path)
+        except (OSError, UnidentifiedImageError, ValueError) as exc:
+            logger.warning("Fingerprint lookup failed for %s: %s", image_path, exc)
+        except Exception:
+            # anything else (cv2 errors, decompression bombs) must still hand
+            # control back, or the buttons stay disabled for this card
+            logger.exception("Fingerprint computation failed for %s", image_path)
+        finally:
+            def finish():
+                CardEditorApp._finish_fp_lookup(self, image_path, idx, fp)
+
+            after = getattr(self.root, "after", None)
+            if callable(after):
+                try:
+                    after(0, finish)
+                except (RuntimeError, tk.TclError):
+                    pass  # window closed or main loop gone
+            else:
+                finish()
+
+    def _finish_fp_lookup(self, image_path, idx, fp):
+        if idx != self.index or getattr(self, "current_image_path", None) != image_path:
+            return  # the user already moved to another card
+        if not getattr(self, "in_scan", False) or not _widget_exists(
+            getattr(self, "entries", {}).get("nazwa")
+        ):
+            return  # the editor was closed while the lookup ran
+        self.current_analysis_thread = None
+        fp_match = None
+        if fp is not None:
+            self.current_fingerprint = fp
+            try:
+                lookup = getattr(self, "_lookup_fp_candidate", None)
+                if lookup:
+                    fp_match = lookup(fp)
+                else:
+                    fp_match = getattr(self.hash_db, "best_match", lambda *a, **k: None)(
+                        fp, max_distance=HASH_MATCH_THRESHOLD
+                    )
+            except (OSError, UnidentifiedImageError, ValueError) as exc:
+                logger.warning("Fingerprint lookup failed for %s: %s", image_path, exc)
+                fp_match = None
+        filename = os.path.basename(image_path)
+        if not (fp_match and CardEditorApp._apply_fp_match(self, fp_match, filename)):
+            CardEditorApp._start_analysis(self, image_path, idx)
+        if getattr(self, "current_analysis_thread", None) is None:
+            _set_buttons_state(self, True)
+
+    def _apply_fp_match(self, fp_match, filename) -> bool:
+        """Fill the editor from a fingerprint match; ``False`` if declined."""
+        progress_cb = getattr(self, "_update_card_progress", None)
+        meta = fp_match.meta
+        self.selected_candidate_meta = meta
+        csv_row = None
+        code = meta.get("warehouse_code")
+        if code:
+            csv_row = csv_utils.get_row_by_code(code)
+            self.current_location = code
+            if hasattr(self, "location_label"):
+                self.location_label.configure(text=code)
+        if csv_row:
+            name = csv_row.get("name", "")
+            number = sanitize_number(csv_row.get("number", ""))
+            set_name = csv_row.get("set", "")
+        else:
+            name = meta.get("nazwa", meta.get("name", ""))
+            number = sanitize_number(
+                str(meta.get("numer", meta.get("number", "")))
+            )
+            set_name = meta.get("set", meta.get("set_name", ""))
+        variant = (
+            csv_row.get("variant")
+            if csv_row
+            else meta.get("wariant") or meta.get("variant")
+        )
+        duplicates = csv_utils.find_duplicates(
+            name, number, set_name, variant
+        )
+        if duplicates:
+            codes = ", ".join(
+                [d.get("warehouse_code", "") for d in duplicates if d.get("warehouse_code")]
+            )
+            msg = _(
+                "Card already exists in magazyn: {codes}. Add anyway?"
+            ).format(codes=codes)
+            if not messagebox.askyesno(_("Duplicate"), msg):
+                logger.info(
+                    "Skipping duplicate card %s #%s in set %s", name, number, set_name
+                )
+                return False
+            else:
+                self.current_location = self.next_free_location()
+                if hasattr(self, "location_label"):
+                    self.location_label.configure(text=self.current_location)
+                logger.info(
+                    "Assigned storage location %s to duplicate card", self.current_location
+                )
+        self.entries["nazwa"].delete(0, tk.END)
+        self.entries["numer"].delete(0, tk.END)
+        self.entries["nazwa"].insert(0, name)
+        self.entries["numer"].insert(0, number)
+        self.entries["set"].set("")
+        self.entries["set"].set(set_name)
+        era_name = get_set_era(set_name)
+        self.entries["era"].set(era_name)
+        cena = getattr(
+            self, "get_price_from_db", lambda *a, **k: None
+        )(name, number, set_name)
+        if cena is None:
+            cena = getattr(
+                self, "fetch_card_price", lambda *a, **k: None
+            )(name, number, set_name)
+        # the price is parsed once; the entry shows it as returned
+        price_num = None
+        if cena is not None:
+            self.entries["cena"].delete(0, tk.END)
+            self.entries["cena"].insert(0, str(cena))
+            try:
+                price_num = float(cena)
+            except (TypeError, ValueError):
+                pass
+        if price_num is not None:
+            is_rev = getattr(self, "price_reverse_var", None)
+            self.price_pool_total += self.apply_variant_multiplier(
+                price_num, is_reverse=is_rev.get() if is_rev else False
+            )
+            if getattr(self, "pool_total_label", None):
+                self.pool_total_label.config(
+                    text=f"Suma puli: {self.price_pool_total:.2f}"
+                )
+        if isinstance(meta.get("typ"), str):
+            # a separate loop name keeps ``name`` (the card name) intact
+            types = {t.strip() for t in meta["typ"].split(",")}
+            for type_name in types & self.type_vars.keys():
+                self.type_vars[type_name].set(True)
+        self.update_set_options()
+        logger.info(
+            "Skipping analysis for %s: fingerprint match with distance %s",
+            filename,
+            fp_match.distance,
+        )
+        if progress_cb:
+            progress_cb(1.0)
+        return True
+
+    def _start_analysis(self, image_path, idx):
+        """Run the full card analysis for ``image_path`` on a worker thread."""
+        progress_cb = getattr(self, "_update_card_progress", None)
+        if progress_cb:
+            progress_cb(0, show=True)
+        thread = threading.Thread(
+            target=self._analyze_and_fill,
+            args=(image_path, idx),
+            daemon=True,
+        )
+        self.current_analysis_thread = thread
+        _set_buttons_state(self, True)
+        thread.start()
+        root_after = getattr(getattr(self, "root", None), "after", None)
+        if not callable(root_after):
+            join = getattr(thread, "join", None)
+            if callable(join):
+                join()
+
+    def _collection_result_from_filename(self, path: str, collection: dict):
+        """Return a partial result for a scan named after a catalogued card.
+
+        The ``name_number_set`` file name is turned into a product code for
+        the common variant; a collection row with a warehouse code for it
+        answers the card, otherwise ``None`` is returned.
+        """
+        if not collection:
+            return None
+        key = CardEditorApp._guess_key_from_filename(self, path)
+        if not key:
+            return None
+        _name, number, set_name = key.split("|")[:3]
+        product_code = csv_utils.build_product_code(set_name, number, None)
+        row = collection.get(product_code)
+        if not row or not row.get("warehouse_code"):
+            return None
+        return {"product_code": product_code, "orientation": 0}
+
     def _guess_key_from_filename(self, path: str):
         base = os.path.splitext(os.path.basename(path))[0]
-        parts = re.split(r"[|_-]", base)
+        parts = _KEYSPLIT_RE.split(base)
         if len(parts) >= 3:
             name = parts[0]
             number = parts[1]
@@ -5624,7 +6688,9 @@ class CardEditorApp:
             return f"{name}|{number}|{set_name}|"
         return None
 
-    def _update_card_progress(self, value: float, show: bool = False):
+    def _update_card_progress(
+        self, value: float, show: bool = False, hide: bool = False
+    ):
         """Update the progress bar for analyzing a single card."""
         if not hasattr(self, "progress_bar"):
             return
@@ -5632,9 +6698,44 @@ class CardEditorApp:
             self.progress_bar.set(value)
             if show and hasattr(self, "progress_frame"):
                 self.progress_frame.grid()
+            elif hide and hasattr(self, "progress_frame"):
+                self.progress_frame.grid_remove()
         except tk.TclError:
             pass
 
+    def _post_card_progress(self, value: float, show: bool = False):
+        """Queue a progress update from the analysis thread.
+
+        Updates are applied on the Tk thread once per CARD_PROGRESS_TICK_MS;
+        only the latest value of a batch reaches the progress bar.
+        """
+        queue = getattr(self, "_card_progress_q", None)
+        if queue is None:
+            queue = self._card_progress_q = SimpleQueue()
+        queue.put((value, show))
+        if getattr(self, "_card_progress_scheduled", False):
+            return
+        self._card_progress_scheduled = True
+        self.root.after(
+            CARD_PROGRESS_TICK_MS, lambda: CardEditorApp._drain_card_progress(self)
+        )
+
+    def _drain_card_progress(self):
+        """Apply the newest queued progress value, if any."""
+        self._card_progress_scheduled = False
+        queue = getattr(self, "_card_progress_q", None)
+        latest = None
+        show = False
+        while queue is not None:
+            try:
+                latest, shown = queue.get_nowait()
+            except Empty:
+                break
+            show = show or shown
+        update_progress = getattr(self, "_update_card_progress", None)
+        if latest is not None and update_progress:
+            update_progress(latest, show=show)
+
     def _show_candidates_dialog(self, candidates: list[Candidate]) -> Optional[Candidate]:
         """Present a dialog allowing the user to choose from *candidates*."""
 
@@ -5717,14 +6818,28 @@ class CardEditorApp:
         """Overlay ``rect`` on ``image`` and display it on ``image_label``."""
         if not rect or image is None:
             return
-        try:
-            # determine dimensions of the image used for analysis
-            with Image.open(getattr(self, "current_image_path", "")) as im:
-                orig_w, orig_h = im.size
-        except (OSError, UnidentifiedImageError):
-            orig_w, orig_h = image.size
-
+        path = getattr(self, "current_image_path", "")
         orientation = getattr(self, "_analysis_orientation", 0)
+        drawn = (path, tuple(rect), orientation)
+        # the analysis reports the same area repeatedly; it is already shown
+        if (
+            getattr(self, "_preview_source_image", None) is image
+            and getattr(self, "_preview_drawn", None) == drawn
+        ):
+            return
+        # dimensions of the image used for analysis, read from the file header
+        # once per scan rather than on every redraw
+        cached = getattr(self, "_preview_orig_size", None)
+        if cached is not None and cached[0] == path:
+            orig_w, orig_h = cached[1]
+        else:
+            try:
+                with Image.open(path) as im:
+                    orig_w, orig_h = im.size
+                self._preview_orig_size = (path, (orig_w, orig_h))
+            except (OSError, UnidentifiedImageError):
+                orig_w, orig_h = image.size
+
         if orientation == 90:
             base_w, base_h = orig_h, orig_w
         else:
@@ -5740,16 +6855,20 @@ class CardEditorApp:
             int(rect[3] * scale_y),
         )
 
+        # redraw into one buffer per source image instead of copying it again
         if getattr(self, "_preview_source_image", None) is not image:
             self._preview_source_image = image
-            self._preview_base_image = image.copy()
-        preview = self._preview_base_image.copy()
+            preview = self._preview_buffer = image.copy()
+        else:
+            preview = self._preview_buffer
+            preview.paste(image)
         draw = ImageDraw.Draw(preview)
         draw.rectangle(scaled_rect, outline="red", width=3)
 
         img = _create_image(preview)
         self.current_card_photo = img
         self.image_label.configure(image=img)
+        self._preview_drawn = drawn
 
     def _analyze_and_fill(self, path, idx):
         lang_var = getattr(self, "lang_var", None)
@@ -5761,15 +6880,19 @@ class CardEditorApp:
                 translate = False
         update_progress = getattr(self, "_update_card_progress", None)
         if update_progress:
-            self.root.after(0, lambda: update_progress(0, show=True))
+            CardEditorApp._post_card_progress(self, 0, show=True)
+        collection = getattr(self, "collection_data", None) or {}
+        # a scan named after a catalogued card needs neither the fingerprint
+        # lookup nor the analysis; the collection row fills the form
+        result = CardEditorApp._collection_result_from_filename(self, path, collection)
         fp_match = None
-        if getattr(self, "hash_db", None) and getattr(self, "auto_lookup", False):
+        if (
+            result is None
+            and getattr(self, "hash_db", None)
+            and getattr(self, "auto_lookup", False)
+        ):
             try:
-                with Image.open(path) as img:
-                    try:
-                        fp = compute_fingerprint(img, use_orb=True)
-                    except TypeError:
-                        fp = compute_fingerprint(img)
+                fp = _cached_fingerprint(path)
                 self.current_fingerprint = fp
                 lookup = getattr(self, "_lookup_fp_candidate", None)
                 if lookup:
@@ -5784,9 +6907,11 @@ class CardEditorApp:
                 logger.warning("Fingerprint lookup failed for %s: %s", path, exc)
                 fp_match = None
         if update_progress:
-            self.root.after(0, lambda: update_progress(0.5))
+            CardEditorApp._post_card_progress(self, 0.5)
 
-        if fp_match:
+        if result is not None:
+            pass
+        elif fp_match:
             meta = fp_match.meta
             csv_row = None
             code = meta.get("warehouse_code")
@@ -5795,7 +6920,7 @@ class CardEditorApp:
             if csv_row:
                 result = {
                     "name": csv_row.get("name", ""),
-                    "number": sanitize_number(str(csv_row.get("number", ""))),
+                    "number": sanitize_number(csv_row.get("number", "")),
                     "total": meta.get("total", ""),
                     "set": csv_row.get("set", ""),
                     "set_code": meta.get("set_code", ""),
@@ -5826,13 +6951,13 @@ class CardEditorApp:
                 preview_cb=getattr(self, "update_set_area_preview", None),
                 preview_image=getattr(self, "current_card_image", None),
             )
-        product_code = csv_utils.build_product_code(
+        product_code = result.get("product_code") or csv_utils.build_product_code(
             result.get("set", ""),
             result.get("number", ""),
             result.get("variant"),
         )
         result["product_code"] = product_code
-        collection_row = getattr(self, "collection_data", {}).get(product_code)
+        collection_row = collection.get(product_code)
         if collection_row:
             result.update(collection_row)
             result.setdefault("era", collection_row.get("era", ""))
@@ -5841,7 +6966,7 @@ class CardEditorApp:
             if collection_row.get("estimated_value"):
                 result.setdefault("price", collection_row.get("estimated_value"))
         if update_progress:
-            self.root.after(0, lambda: update_progress(1.0))
+            CardEditorApp._post_card_progress(self, 1.0)
 
         self.root.after(0, lambda: self._apply_analysis_result(result, idx))
 
@@ -5850,19 +6975,21 @@ class CardEditorApp:
             return
         progress_cb = getattr(self, "_update_card_progress", None)
         if progress_cb:
+            # flush queued updates first so a late tick cannot re-show the bar
+            CardEditorApp._drain_card_progress(self)
             progress_cb(0, hide=True)
         if result:
             name = result.get("name", "")
             number = result.get("number", "")
             total = result.get("total") or ""
             if not total and isinstance(number, str):
-                m = re.match(r"(\d+)\s*/\s*(\d+)", number)
+                m = _NUMBER_TOTAL_RE.match(number)
                 if m:
                     number, total = m.group(1), m.group(2)
             set_name = result.get("set", "")
             era_name = result.get("era", "") or get_set_era(set_name)
             price = result.get("price")
-            number = sanitize_number(str(number))
+            number = sanitize_number(number)
             self.entries["nazwa"].delete(0, tk.END)
             self.entries["nazwa"].insert(0, name)
             self.entries["numer"].delete(0, tk.END)
@@ -5914,13 +7041,7 @@ class CardEditorApp:
                     self.update_set_area_preview(rect, self.current_card_image)
                 except Exception:
                     logger.exception("Failed to update set area preview")
-        for btn_name in ("save_button", "next_button"):
-            btn = getattr(self, btn_name, None)
-            if btn is not None:
-                try:
-                    btn.configure(state=tk.NORMAL)
-                except Exception:
-                    pass
+        _set_buttons_state(self, True)
         self.current_analysis_thread = None
         return
 
@@ -5972,31 +7093,87 @@ class CardEditorApp:
         return storage.next_free_location(self)
 
     def load_price_db(self):
+        """Return ``(name, number, set)`` -> price for the rows in PRICE_DB_PATH.
+
+        Keys are normalised the same way :meth:`get_price_from_db` normalises
+        its input; the first row wins when a card is listed twice.
+        """
+        index: dict[tuple[str, str, str], str] = {}
         if not os.path.exists(PRICE_DB_PATH):
-            return []
-        with open(PRICE_DB_PATH, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+            return index
+        with open(PRICE_DB_PATH, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                return index
+            cols = {h: i for i, h in enumerate(header)}
+            if not {"name", "number", "set"} <= cols.keys():
+                return index
+            name_i, number_i, set_i = cols["name"], cols["number"], cols["set"]
+            price_i = cols.get("price")
+            for row in reader:
+                if len(row) <= max(name_i, number_i, set_i):
+                    continue
+                key = (
+                    normalize(row[name_i]),
+                    row[number_i].strip().lower(),
+                    row[set_i].strip().lower(),
+                )
+                if price_i is None:
+                    price = 0
+                else:
+                    price = row[price_i] if price_i < len(row) else None
+                index.setdefault(key, price)
+        return index
 
     def load_set_logos(self):
-        """Load set logos from SET_LOGO_DIR into self.set_logos."""
+        """Index the set logos in SET_LOGO_DIR; they are decoded on first use.
+
+        The directory is rescanned only when its modification time or
+        ``ALLOWED_SET_CODES`` changes.
+        """
+        try:
+            mtime = os.stat(SET_LOGO_DIR).st_mtime_ns
+        except OSError:
+            mtime = None
+        key = (mtime, frozenset(ALLOWED_SET_CODES))
+        if mtime is not None and key == getattr(self, "_set_logo_dir_key", None):
+            return
         self.set_logos.clear()
-        if not os.path.isdir(SET_LOGO_DIR):
+        self._set_logo_paths = {}
+        self._set_logo_dir_key = key
+        if mtime is None or not os.path.isdir(SET_LOGO_DIR):
             return
-        for file in os.listdir(SET_LOGO_DIR):
-            path = os.path.join(SET_LOGO_DIR, file)
-            if not os.path.isfile(path):
-                continue
-            if not file.lower().endswith((".png", ".jpg", ".jpeg", ".gif")):
-                continue
-            code = os.path.splitext(file)[0]
-            if ALLOWED_SET_CODES and code not in ALLOWED_SET_CODES:
-                continue
-            img = load_rgba_image(path)
-            if not img:
-                continue
-            img.thumbnail((40, 40))
-            self.set_logos[code] = _create_image(img)
+        with os.scandir(SET_LOGO_DIR) as entries:
+            for entry in entries:
+                code, ext = os.path.splitext(entry.name)
+                if ext[1:].lower() not in SET_LOGO_EXTENSIONS or not entry.is_file():
+                    continue
+                if ALLOWED_SET_CODES and code not in ALLOWED_SET_CODES:
+                    continue
+                self._set_logo_paths[code] = entry.path
+
+    def get_set_logo(self, code):
+        """Return the logo image for set ``code`` or ``None`` if there is none.
+
+        Decoded logos are kept in ``self.set_logos``, bounded to
+        SET_LOGO_CACHE_SIZE entries with the least recently used dropped.
+        """
+        logos = self.set_logos
+        img = logos.get(code)
+        if img is not None:
+            logos.move_to_end(code)
+            return img
+        path = getattr(self, "_set_logo_paths", {}).get(code)
+        if not path:
+            return None
+        thumb = _cached_thumbnail(path, (40, 40))
+        if not thumb:
+            return None
+        img = logos[code] = _create_image(thumb)
+        while len(logos) > SET_LOGO_CACHE_SIZE:
+            logos.popitem(last=False)
+        return img
 
     def show_loading_screen(self):
         """Display a temporary loading screen during startup."""
@@ -6016,18 +7193,19 @@ class CardEditorApp:
                 ).pack(pady=10)
 
         gif_path = os.path.join(os.path.dirname(__file__), "simple_pokeball.gif")
-        if os.path.exists(gif_path):
+        # the frames are decoded once; showing the screen again reuses them
+        if not getattr(self, "gif_frames", None) and os.path.exists(gif_path):
             from PIL import ImageSequence
             with Image.open(gif_path) as img:
-                img.convert("RGBA")
-                self.gif_frames = []
-                self.gif_durations = []
-                for frame in ImageSequence.Iterator(img):
-                    self.gif_frames.append(
-                        _create_image(frame.convert("RGBA"))
-                    )
-                    self.gif_durations.append(frame.info.get("duration", 100))
-
+                n_frames = getattr(img, "n_frames", 1)
+                frames = [None] * n_frames
+                durations = [100] * n_frames
+                for i, frame in enumerate(ImageSequence.Iterator(img)):
+                    frames[i] = _create_image(frame.convert("RGBA"))
+                    durations[i] = frame.info.get("duration", 100)
+                self.gif_frames = frames
+                self.gif_durations = durations
+        if getattr(self, "gif_frames", None):
             self.gif_label = ctk.CTkLabel(
                 self.loading_frame, text=""
             )
@@ -6085,45 +7263,35 @@ class CardEditorApp:
         self.setup_welcome_screen()
 
     def download_set_symbols(self, sets):
-        """Download logos for the provided set definitions."""
+        """Download logos for the provided set definitions.
+
+        Symbols already present in SET_LOGO_DIR are skipped; the rest are
+        fetched in parallel over the shared keep-alive session.
+        """
         os.makedirs(SET_LOGO_DIR, exist_ok=True)
         total = len(sets)
-        for idx, item in enumerate(sets, start=1):
-            name = item.get("name")
-            code = item.get("code")
-            if self.loading_label is not None:
-                self.loading_label.configure(
-                    text=f"Pobieram {idx}/{total}: {name}"
-                )
-                self.root.update()
-            if not code:
-                continue
-            symbol_url = f"https://images.pokemontcg.io/{code}/symbol.png"
-            try:
-                res = requests.get(symbol_url, timeout=10)
-                if res.status_code == 404:
-                    alt = re.sub(r"(^sv)0(\d$)", r"\1\2", code)
-                    if alt != code:
-                        alt_url = f"https://images.pokemontcg.io/{alt}/symbol.png"
-                        res = requests.get(alt_url, timeout=10)
-                        if res.status_code == 200:
-                            symbol_url = alt_url
-                if res.status_code == 200:
-                    parsed_path = urlparse(symbol_url).path
-                    ext = os.path.splitext(parsed_path)[1] or ".png"
-                    safe = code.replace("/", "_")
-                    path = os.path.join(SET_LOGO_DIR, f"{safe}{ext}")
-                    with open(path, "wb") as fh:
-                        fh.write(res.content)
-                else:
-                    if res.status_code == 404:
-                        print(f"[WARN] Symbol not found for {name}: {symbol_url}")
-                    else:
-                        print(
-                            f"[ERROR] Failed to download symbol for {name} from {symbol_url}: {res.status_code}"
-                        )
-            except requests.RequestException as exc:
-                print(f"[ERROR] {name}: {exc}")
+        pending = [
+            item
+            for item in sets
+            if item.get("code")
+            and not os.path.exists(
+                os.path.join(SET_LOGO_DIR, f"{item['code'].replace('/', '_')}.png")
+            )
+        ]
+        done = total - len(pending)
+        if not pending:
+            return
+        with ThreadPoolExecutor(
+            max_workers=SET_SYMBOL_WORKERS, thread_name_prefix="set-symbol"
+        ) as pool:
+            futures = {pool.submit(_download_set_symbol, item): item for item in pending}
+            for future in as_completed(futures):
+                done += 1
+                if self.loading_label is not None:
+                    self.loading_label.configure(
+                        text=f"Pobieram {done}/{total}: {futures[future].get('name')}"
+                    )
+                    self.root.update()
 
     def update_sets(self):
         """Check remote API for new sets and update local files."""
@@ -6137,21 +7305,17 @@ class CardEditorApp:
 
         timeout = getattr(self, "API_TIMEOUT", 30)
         remote: list[dict] = []
-        last_exc: Optional[Exception] = None
-        for attempt in range(3):
-            try:
-                resp = requests.get(
-                    "https://api.pokemontcg.io/v2/sets", timeout=timeout
-                )
-                resp.raise_for_status()
-                remote = resp.json().get("data", [])
-                break
-            except requests.RequestException as exc:
-                last_exc = exc
-                if attempt < 2:
-                    time.sleep(2**attempt)
-        if not remote and last_exc is not None:
-            self.log(f"[WARN] Using offline sets. Reason: {last_exc}")
+        # fetch on a worker so the loading animation keeps running while the
+        # request (and any retry backoff) is in flight
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sets-update") as pool:
+            future = pool.submit(_fetch_remote_sets, timeout)
+            while not future.done():
+                self.root.update()
+                time.sleep(0.05)
+        try:
+            remote = future.result()
+        except requests.RequestException as exc:
+            self.log(f"[WARN] Using offline sets. Reason: {exc}")
 
         added = 0
         new_items = []
@@ -6206,17 +7370,13 @@ class CardEditorApp:
         number_input = number.strip().lower()
         set_input = set_name.strip().lower()
 
-        for row in self.price_db:
-            if (
-                normalize(row.get("name", "")) == name_input
-                and row.get("number", "").strip().lower() == number_input
-                and row.get("set", "").strip().lower() == set_input
-            ):
-                try:
-                    return float(row.get("price", 0))
-                except (TypeError, ValueError):
-                    return None
-        return None
+        price = self.price_db.get((name_input, number_input, set_input))
+        if price is None:
+            return None
+        try:
+            return float(price)
+        except (TypeError, ValueError):
+            return None
 
     def fetch_card_price(self, name, number, set_name, is_reverse=False, is_holo=False):
         set_input = set_name.strip().lower()
@@ -6664,11 +7824,7 @@ class CardEditorApp:
             and getattr(self, "hash_db", None)
         ):
             try:
-                with Image.open(self.current_image_path) as img:
-                    try:
-                        fp = compute_fingerprint(img, use_orb=True)
-                    except TypeError:
-                        fp = compute_fingerprint(img)
+                fp = _cached_fingerprint(self.current_image_path)
             except (OSError, UnidentifiedImageError, ValueError) as exc:
                 logger.warning(
                     "Failed to compute fingerprint for %s: %s",
@@ -6815,13 +7971,10 @@ class CardEditorApp:
         if key:
             self.collection_data[key] = formatted_entry
         if getattr(self, "session_csv_path", None):
-            with open(self.session_csv_path, "a", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=csv_utils.COLLECTION_FIELDNAMES,
-                    delimiter=";",
-                )
-                writer.writerow(formatted_entry)
+            writer = _session_csv_writer(self)
+            writer.writerow(formatted_entry)
+            # flushed per card so the session file survives a crash
+            self._session_csv[1].flush()
         if hasattr(self, "current_location"):
             self.current_location = ""
 
@@ -6873,7 +8026,9 @@ class CardEditorApp:
             return
         box = int(match.group(1))
         column = int(match.group(2))
-        for row in list(self.output_data):
+        # the loop stops right after changing the list, so it is walked in
+        # place instead of over a copy
+        for i, row in enumerate(self.output_data):
             if not row:
                 continue
             codes = [c.strip() for c in str(row.get("warehouse_code") or "").split(";") if c.strip()]
@@ -6882,7 +8037,7 @@ class CardEditorApp:
                 if codes:
                     row["warehouse_code"] = ";".join(codes)
                 else:
-                    self.output_data.remove(row)
+                    del self.output_data[i]
                 break
         self.repack_column(box, column)
         if hasattr(self, "update_inventory_stats"):
@@ -1,3 +1,9 @@
+import importlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+
 class _Widget:
     def pack(self, *a, **k):
         self.pack_calls = getattr(self, "pack_calls", [])
@@ -14,6 +20,9 @@ class _Widget:
     def destroy(self):
         pass
 
+    def lift(self, *a):
+        return self
+
     def configure(self, **kwargs):
         for k, v in kwargs.items():
             setattr(self, k, v)
@@ -142,6 +151,9 @@ class DummyCanvas(_Widget):
         pass
 
     def delete(self, rid):
+        if rid == "all":
+            self.items.clear()
+            return
         self.items.pop(rid, None)
 
     def itemconfigure(self, rid, **kwargs):
@@ -161,3 +173,18 @@ class DummyCanvas(_Widget):
 
     def height(self):
         return self.height_val
+
+
+def load_ui():
+    """Reload ``kartoteka.ui`` against stub CTkFrame/CTkLabel widgets.
+
+    Each call returns a fresh module, so module-level caches start empty.
+    """
+    sys.modules["customtkinter"] = SimpleNamespace(
+        CTkFrame=DummyCTkFrame,
+        CTkLabel=DummyCTkLabel,
+    )
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+    import kartoteka.ui as ui
+
+    return importlib.reload(ui)
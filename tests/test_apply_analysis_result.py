@@ -83,3 +83,21 @@ def test_apply_analysis_result_duplicate_confirm(monkeypatch):
     dummy.next_free_location.assert_called_once()
     dummy.location_label.configure.assert_called_once_with(text="K1R1P1")
     assert dummy.current_location == "K1R1P1"
+
+
+def test_progress_updates_coalesced_per_tick():
+    pending = []
+    update = MagicMock()
+    dummy = SimpleNamespace(
+        root=SimpleNamespace(after=lambda delay, func: pending.append(func)),
+        _update_card_progress=update,
+    )
+
+    for value, show in ((0, True), (0.5, False), (1.0, False)):
+        ui.CardEditorApp._post_card_progress(dummy, value, show=show)
+    assert len(pending) == 1
+    pending.pop()()
+    update.assert_called_once_with(1.0, show=True)
+
+    ui.CardEditorApp._post_card_progress(dummy, 0.5)
+    assert len(pending) == 1
@@ -28,3 +28,21 @@ def test_back_to_welcome_requires_confirmation():
     dummy.setup_welcome_screen.assert_not_called()
     assert dummy.in_scan
 
+
+def test_back_to_welcome_cancels_pending_set_filter():
+    root = SimpleNamespace(after_cancel=MagicMock())
+    dummy = SimpleNamespace(
+        root=root,
+        pricing_frame=None,
+        frame=None,
+        magazyn_frame=None,
+        location_frame=None,
+        setup_welcome_screen=MagicMock(),
+        in_scan=False,
+        _filter_sets_after_id="after#7",
+    )
+
+    ui.CardEditorApp.back_to_welcome(dummy)
+    root.after_cancel.assert_called_once_with("after#7")
+    assert dummy._filter_sets_after_id is None
+    dummy.setup_welcome_screen.assert_called_once()
@@ -0,0 +1,114 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.modules.setdefault("customtkinter", MagicMock())
+sys.modules.setdefault("openai", MagicMock())
+sys.modules.setdefault("dotenv", MagicMock(load_dotenv=lambda *a, **k: None, set_key=lambda *a, **k: None))
+sys.modules.setdefault("pydantic", MagicMock(BaseModel=object))
+sys.modules.setdefault("pytesseract", MagicMock())
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+import kartoteka.ui as ui  # noqa: E402
+from tests.ctk_mocks import DummyCTkLabel, DummyCTkScrollableFrame  # noqa: E402
+
+
+class TrackingFrame(DummyCTkScrollableFrame):
+    def __init__(self, *a, **k):
+        super().__init__(*a, **k)
+        self.removed = 0
+        self.destroyed = False
+
+    def grid_remove(self):
+        self.removed += 1
+
+    def destroy(self):
+        self.destroyed = True
+
+
+def _make_app(monkeypatch, lang):
+    frames = []
+
+    def make_frame(*a, **k):
+        frame = TrackingFrame(*a, **k)
+        frames.append(frame)
+        return frame
+
+    monkeypatch.setattr(
+        ui,
+        "ctk",
+        SimpleNamespace(CTkScrollableFrame=make_frame, CTkLabel=DummyCTkLabel),
+        raising=False,
+    )
+    monkeypatch.setattr(ui, "tcg_sets_eng_by_era", {"SV": [{"name": "A", "code": "a"}]})
+    monkeypatch.setattr(ui, "tcg_sets_jp_by_era", {"SV": [{"name": "B", "code": "b"}]})
+    app = SimpleNamespace(
+        frame=object(),
+        root=SimpleNamespace(cget=lambda key: "#000"),
+        lang_var=SimpleNamespace(get=lambda: lang[0]),
+        cheat_frame=None,
+        set_logos={},
+        get_set_logo=lambda code: None,
+    )
+    app._build_cheat_frame = lambda *a: ui.CardEditorApp._build_cheat_frame(app, *a)
+    return app, frames
+
+
+def test_language_toggle_reuses_frames(monkeypatch):
+    lang = ["ENG"]
+    app, frames = _make_app(monkeypatch, lang)
+
+    ui.CardEditorApp.create_cheat_frame(app)
+    eng = app.cheat_frame
+    lang[0] = "JP"
+    ui.CardEditorApp.create_cheat_frame(app)
+    jp = app.cheat_frame
+    lang[0] = "ENG"
+    ui.CardEditorApp.create_cheat_frame(app)
+
+    assert len(frames) == 2
+    assert app.cheat_frame is eng
+    assert eng.removed == 1 and jp.removed == 1
+    assert not eng.destroyed and not jp.destroyed
+
+
+def test_frame_rebuilt_when_sets_change(monkeypatch):
+    lang = ["ENG"]
+    app, frames = _make_app(monkeypatch, lang)
+
+    ui.CardEditorApp.create_cheat_frame(app)
+    old = app.cheat_frame
+    monkeypatch.setattr(ui, "tcg_sets_eng_by_era", {"SV": [{"name": "C", "code": "c"}]})
+    ui.CardEditorApp.create_cheat_frame(app)
+
+    assert len(frames) == 2
+    assert old.destroyed
+    assert app.cheat_frame is frames[1]
+
+
+def test_rows_created_in_batches(monkeypatch):
+    lang = ["ENG"]
+    app, frames = _make_app(monkeypatch, lang)
+    sets = [{"name": f"S{i}", "code": f"s{i}"} for i in range(ui.CHEAT_ROW_BATCH * 2)]
+    monkeypatch.setattr(ui, "tcg_sets_eng_by_era", {"SV": sets})
+    created = []
+
+    class CountingLabel(DummyCTkLabel):
+        def __init__(self, *a, **k):
+            super().__init__(*a, **k)
+            created.append(self)
+
+    ui.ctk.CTkLabel = CountingLabel
+    pending = []
+    app.root.after = lambda delay, func: pending.append(func)
+
+    ui.CardEditorApp.create_cheat_frame(app)
+    first = len(created)
+    assert pending and first < 2 * len(sets)
+
+    while pending:
+        pending.pop(0)()
+    texts = [lbl.text for lbl in created if lbl.text]
+    assert texts[0] == "SV"
+    assert len(texts) == len(sets) + 1
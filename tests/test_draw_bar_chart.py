@@ -0,0 +1,27 @@
+import pytest
+
+from ctk_mocks import DummyCanvas, load_ui
+
+
+def test_bars_scaled_to_largest_value():
+    ui = load_ui()
+    canvas = DummyCanvas()
+    ui.draw_bar_chart(
+        canvas, ["a", "b", "c"], [2, 4, 0], "#123456", width=300, height=200
+    )
+    bars = sorted(canvas.items.values(), key=lambda item: item["coords"][0])
+    assert len(bars) == 3
+    assert all(bar["fill"] == "#123456" for bar in bars)
+    heights = [bar["coords"][3] - bar["coords"][1] for bar in bars]
+    assert heights[1] == pytest.approx(2 * heights[0])
+    assert heights[2] == 0
+
+
+def test_redraw_replaces_previous_bars():
+    ui = load_ui()
+    canvas = DummyCanvas()
+    ui.draw_bar_chart(canvas, ["a", "b"], [1, 2], "#fff")
+    ui.draw_bar_chart(canvas, ["a"], [5], "#fff")
+    assert len(canvas.items) == 1
+    ui.draw_bar_chart(canvas, [], [], "#fff")
+    assert canvas.items == {}
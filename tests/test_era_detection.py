@@ -17,3 +17,13 @@ def test_get_set_era_by_code():
 def test_get_set_era_by_name():
     assert ui.get_set_era("Obsidian Flames") == "Scarlet & Violet"
     assert ui.get_set_era("Darkness Ablaze") == "Sword & Shield"
+
+
+def test_get_set_era_cached_until_reload(monkeypatch):
+    ui.reload_sets()
+    assert ui.get_set_era("sv01") == "Scarlet & Violet"
+    monkeypatch.setitem(ui.SET_TO_ERA, "sv01", "Changed")
+    assert ui.get_set_era("sv01") == "Scarlet & Violet"
+    ui.reload_sets()
+    assert ui.get_set_era("sv01") == "Scarlet & Violet"
+    assert "sv01" in ui._SET_ERA_CACHE
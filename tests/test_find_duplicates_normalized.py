@@ -33,3 +33,27 @@ def test_find_duplicates_variant_wildcard(tmp_path):
         matches = csv_utils.find_duplicates("Poke", "1", "Set", variant=None)
 
     assert {m["warehouse_code"] for m in matches} == {"K1", "K2"}
+
+
+def test_find_duplicates_reads_file_once(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant\n"
+        "Poke;001;Set;K1;1;foo.png;holo\n"
+        "Other;2;Set;K2;1;bar.png;\n",
+        encoding="utf-8",
+    )
+
+    with patch.object(csv_utils, "WAREHOUSE_CSV", str(csv_path)), patch.object(
+        csv_utils.csv, "DictReader", wraps=csv_utils.csv.DictReader
+    ) as reader:
+        assert [m["warehouse_code"] for m in csv_utils.find_duplicates("Poke", "1", "Set")] == ["K1"]
+        assert csv_utils.find_duplicates("Poke", "1", "Set", variant="reverse") == []
+        assert [m["warehouse_code"] for m in csv_utils.find_duplicates("other", "2", "set", "common")] == ["K2"]
+        assert csv_utils.get_row_by_code("K2", str(csv_path))["name"] == "Other"
+        assert reader.call_count == 1
+
+        with open(csv_path, "a", encoding="utf-8") as f:
+            f.write("Poke;1;Set;K3;1;baz.png;holo\n")
+        codes = {m["warehouse_code"] for m in csv_utils.find_duplicates("Poke", "1", "Set")}
+        assert codes == {"K1", "K3"}
@@ -4,7 +4,12 @@ from pathlib import Path
 from PIL import Image, ImageDraw
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
-from fingerprint import compute_fingerprint, unpack_ndarray
+from fingerprint import (
+    compute_fingerprint,
+    draft_for_fingerprint,
+    hamming_distance,
+    unpack_ndarray,
+)
 from hash_db import HashDB
 
 
@@ -69,3 +74,88 @@ def test_best_match_returns_inserted_record_for_similar_image(tmp_path):
     fp_query = compute_fingerprint(query_image)
     expected_distance = db._distance(fp, fp_query)
     assert candidate.distance == expected_distance
+
+
+def test_lookups_reuse_loaded_index(tmp_path, monkeypatch):
+    db = HashDB(str(tmp_path / "hashes.sqlite"))
+    img = _create_sample_image(tmp_path / "a.png")
+    db.add_card_from_fp(compute_fingerprint(img), {"name": "A"})
+    fp = compute_fingerprint(img)
+    assert db.best_match(fp).meta == {"name": "A"}
+
+    # later queries and inserts work from the in-memory index
+    monkeypatch.setattr(db, "conn", _NoSelectConn(db.conn))
+    other = Image.new("RGB", (64, 64), "black")
+    db.add_card_from_fp(compute_fingerprint(other), {"name": "B"})
+    found = db.candidates(fp, limit=2)
+    assert [c.meta["name"] for c in found] == ["A", "B"]
+    assert found[0].distance == 0
+
+
+def test_index_picks_up_rows_from_other_connections(tmp_path):
+    path = str(tmp_path / "hashes.sqlite")
+    db = HashDB(path)
+    img = _create_sample_image(tmp_path / "a.png")
+    db.add_card_from_fp(compute_fingerprint(img), {"name": "A"})
+    fp = compute_fingerprint(img)
+    assert [c.meta["name"] for c in db.candidates(fp, limit=5)] == ["A"]
+
+    writer = HashDB(path)
+    writer.add_card_from_fp(compute_fingerprint(Image.new("RGB", (64, 64), "black")), {"name": "B"})
+    writer.conn.close()
+    assert [c.meta["name"] for c in db.candidates(fp, limit=5)] == ["A", "B"]
+
+
+def test_far_rows_pruned_before_orb_matching(tmp_path, monkeypatch):
+    import hash_db
+
+    db = HashDB(str(tmp_path / "hashes.sqlite"))
+    img = _create_sample_image(tmp_path / "a.png")
+    db.add_card_from_fp(compute_fingerprint(Image.new("RGB", (64, 64), "black")), {"name": "far"})
+    db.add_card_from_fp(compute_fingerprint(img), {"name": "near"})
+    calls = []
+    monkeypatch.setattr(hash_db, "match_orb", lambda a, b: calls.append(1) or 0)
+
+    best = db.best_match(compute_fingerprint(img), max_distance=5)
+    assert best.meta == {"name": "near"}
+    assert len(calls) == 1
+
+
+class _NoSelectConn:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def cursor(self):
+        cur = self._conn.cursor()
+        execute = cur.execute
+
+        class Cursor:
+            def execute(self, sql, *args):
+                assert not sql.startswith("SELECT phash, dhash, tile_phash, orb, meta")
+                return execute(sql, *args)
+
+            def __getattr__(self, name):
+                return getattr(cur, name)
+
+        return Cursor()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def test_large_jpeg_fingerprinted_from_draft(tmp_path):
+    path = tmp_path / "scan.jpg"
+    rng = np.random.default_rng(0)
+    noise = rng.integers(0, 256, (32, 24, 3), dtype=np.uint8)
+    img = Image.fromarray(noise).resize((2400, 3200), Image.Resampling.BILINEAR)
+    img.save(path, quality=90)
+
+    with Image.open(path) as full:
+        expected = compute_fingerprint(full)
+    with Image.open(path) as drafted:
+        draft_for_fingerprint(drafted)
+        assert drafted.size == (600, 800)
+        fp = compute_fingerprint(drafted)
+
+    assert hamming_distance(fp["phash"], expected["phash"]) <= 4
+    assert hamming_distance(fp["dhash"], expected["dhash"]) <= 4
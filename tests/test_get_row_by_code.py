@@ -0,0 +1,38 @@
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from kartoteka import csv_utils  # noqa: E402
+
+
+def test_get_row_by_code_indexes_file_once(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;warehouse_code;sold\n"
+        'A;"K1R1P0001;K1R1P0002";\n'
+        "B;K1R1P0003;\n",
+        encoding="utf-8",
+    )
+
+    with patch.object(
+        csv_utils.csv, "DictReader", wraps=csv_utils.csv.DictReader
+    ) as reader:
+        assert csv_utils.get_row_by_code("K1R1P0002", str(csv_path))["name"] == "A"
+        assert csv_utils.get_row_by_code("K1R1P0003", str(csv_path))["name"] == "B"
+        assert csv_utils.get_row_by_code("K9R9P9999", str(csv_path)) is None
+        assert reader.call_count == 1
+
+    # a rewrite that keeps the file size is still picked up
+    csv_utils.set_sold_flag("K1R1P0003", True, str(csv_path))
+    assert csv_utils.get_row_by_code("K1R1P0003", str(csv_path))["sold"] == "1"
+
+
+def test_get_row_by_code_returns_copy(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text("name;warehouse_code\nA;K1R1P0001\n", encoding="utf-8")
+
+    row = csv_utils.get_row_by_code("K1R1P0001", str(csv_path))
+    row["name"] = "changed"
+    assert csv_utils.get_row_by_code("K1R1P0001", str(csv_path))["name"] == "A"
+    assert csv_utils.get_row_by_code("K1R1P0001", str(tmp_path / "missing.csv")) is None
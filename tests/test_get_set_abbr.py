@@ -11,3 +11,12 @@ importlib.reload(ui)
 def test_get_set_abbr_from_json():
     assert ui.get_set_abbr("Paldean Fates") == "PAF"
 
+
+def test_set_lookups_lower_keys_once(monkeypatch):
+    monkeypatch.setattr(ui, "tcg_sets_name_to_abbr", {"Foo Set": "FOO", "No Abbr": ""})
+    monkeypatch.setattr(ui, "tcg_sets_jp_name_to_abbr", {})
+    assert ui.get_set_abbr("foo set") == "FOO"
+    assert ui.get_set_abbr("foo") == "FOO"
+    assert ui.get_set_abbr("NO ABBR") == ""
+    lowered = ui._lowered_keys(ui.tcg_sets_name_to_abbr, include_values=True)
+    assert ui._lowered_keys(ui.tcg_sets_name_to_abbr, include_values=True) is lowered
@@ -79,3 +79,25 @@ def test_get_inventory_stats_force(tmp_path, monkeypatch):
 
     csv_utils.get_inventory_stats(str(csv_path), force=True)
     assert called
+
+
+def test_get_inventory_stats_recomputes_on_size_change(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    _write_csv(
+        csv_path,
+        "name;number;set;warehouse_code;price;image\n" "A;1;S1;K1;10;img\n",
+    )
+    mtime = os.path.getmtime(csv_path)
+
+    first = csv_utils.get_inventory_stats(str(csv_path))
+
+    _write_csv(
+        csv_path,
+        "name;number;set;warehouse_code;price;image\n" "A;1;S1;K1;10;img\n" "B;2;S2;K2;5;img2\n",
+    )
+    # same timestamp as before, e.g. a coarse mtime resolution
+    os.utime(csv_path, (mtime, mtime))
+
+    second = csv_utils.get_inventory_stats(str(csv_path))
+    assert second != first
+    assert second[0] == 2
@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.modules.setdefault("customtkinter", MagicMock())
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+import kartoteka.ui as ui  # noqa: E402
+
+
+def test_load_images_lists_scans_only(tmp_path):
+    for name in ("b.PNG", "a.jpg", "c.jpeg", "notes.txt", "jpg"):
+        (tmp_path / name).write_bytes(b"data")
+    (tmp_path / "sub.jpg").mkdir()
+
+    dummy = SimpleNamespace(
+        start_frame=None,
+        frame=object(),
+        progress_var=SimpleNamespace(set=lambda *a, **k: None),
+        log=lambda *a, **k: None,
+        show_card=lambda *a, **k: None,
+    )
+
+    ui.CardEditorApp.load_images(dummy, str(tmp_path))
+
+    assert dummy.cards == [
+        str(tmp_path / "a.jpg"),
+        str(tmp_path / "b.PNG"),
+        str(tmp_path / "c.jpeg"),
+    ]
+    assert dummy.output_data == [None, None, None]
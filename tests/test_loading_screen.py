@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.modules.setdefault("customtkinter", MagicMock())
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+import kartoteka.ui as ui  # noqa: E402
+
+
+def test_loading_gif_decoded_once(monkeypatch):
+    created = []
+
+    def fake_create(img):
+        created.append(img)
+        return object()
+
+    monkeypatch.setattr(ui, "_create_image", fake_create)
+    monkeypatch.setattr(
+        ui, "ctk", SimpleNamespace(CTkFrame=MagicMock(), CTkLabel=MagicMock()), raising=False
+    )
+    app = SimpleNamespace(
+        root=SimpleNamespace(minsize=lambda *a: None, update=lambda: None),
+        animate_loading_gif=lambda index: None,
+    )
+
+    ui.CardEditorApp.show_loading_screen(app)
+    frames = app.gif_frames
+    assert len(frames) == len(app.gif_durations) > 1
+    assert None not in frames
+    decoded = len(created)
+
+    ui.CardEditorApp.show_loading_screen(app)
+    assert app.gif_frames is frames
+    # only the banner is created again
+    assert len(created) == decoded + 1
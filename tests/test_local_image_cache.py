@@ -0,0 +1,40 @@
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).resolve().parent))
+from ctk_mocks import load_ui  # noqa: E402
+
+
+def test_card_preview_decoded_once_until_modified(tmp_path):
+    ui = load_ui()
+    path = tmp_path / "card.png"
+    ui.Image.new("RGB", (600, 400), "red").save(path)
+
+    with patch.object(ui.Image, "open", wraps=ui.Image.open) as open_mock:
+        mtime_ns = os.stat(path).st_mtime_ns
+        first = ui._load_card_preview(str(path), mtime_ns)
+        second = ui._load_card_preview(str(path), mtime_ns)
+        assert open_mock.call_count == 1
+        # only the scaled preview is kept, not the full decode
+        assert first is second and first.size == (300, 200)
+
+        ui.Image.new("RGB", (300, 600), "blue").save(path)
+        os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        third = ui._load_card_preview(str(path), os.stat(path).st_mtime_ns)
+        assert open_mock.call_count == 2
+        assert third.size == (150, 300)
+
+
+def test_mag_thumbnail_skips_full_size_decode(tmp_path):
+    ui = load_ui()
+    path = tmp_path / "card.jpg"
+    ui.Image.new("RGB", (1600, 2400), "red").save(path)
+    ui._load_mag_thumbnail.cache_clear()
+
+    with patch.object(ui, "load_rgba_image") as full_decode:
+        thumb = ui._load_mag_thumbnail(str(path), 100)
+    full_decode.assert_not_called()
+    assert thumb.size == (100, 150)
+    assert thumb.mode == "RGBA"
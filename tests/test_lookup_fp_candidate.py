@@ -61,3 +61,94 @@ def test_lookup_fp_candidate_threshold(monkeypatch):
     assert calls == []
     assert candidate_calls == []
 
+
+def test_fingerprint_cached_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "card.png"
+    ui.Image.new("RGB", (8, 8), "white").save(path)
+    calls = []
+
+    def fake_fp(img, use_orb=False):
+        calls.append(use_orb)
+        return f"fp{len(calls)}"
+
+    monkeypatch.setattr(ui, "compute_fingerprint", fake_fp)
+    assert ui._cached_fingerprint(str(path)) == "fp1"
+    assert ui._cached_fingerprint(str(path)) == "fp1"
+    assert calls == [True]
+
+    ui.Image.new("RGB", (16, 16), "black").save(path)
+    assert ui._cached_fingerprint(str(path)) == "fp2"
+
+
+def test_stale_fingerprint_result_ignored(monkeypatch):
+    started = []
+    monkeypatch.setattr(
+        ui.CardEditorApp, "_start_analysis", lambda self, path, idx: started.append(path)
+    )
+    app = SimpleNamespace(
+        index=1,
+        current_image_path="b.jpg",
+        current_fingerprint=None,
+        in_scan=True,
+        entries={"nazwa": object()},
+    )
+
+    ui.CardEditorApp._finish_fp_lookup(app, "a.jpg", 0, "fp")
+    assert started == []
+    assert app.current_fingerprint is None
+
+    app.hash_db = SimpleNamespace(best_match=lambda fp, max_distance=None: None)
+    app.current_analysis_thread = object()
+    ui.CardEditorApp._finish_fp_lookup(app, "b.jpg", 1, "fp")
+    assert started == ["b.jpg"]
+    assert app.current_fingerprint == "fp"
+
+
+def test_fingerprint_result_ignored_after_editor_closed(monkeypatch):
+    started = []
+    monkeypatch.setattr(
+        ui.CardEditorApp, "_start_analysis", lambda self, path, idx: started.append(path)
+    )
+    entry = SimpleNamespace(winfo_exists=lambda: False)
+    app = SimpleNamespace(index=0, current_image_path="a.jpg", in_scan=True, entries={"nazwa": entry})
+
+    ui.CardEditorApp._finish_fp_lookup(app, "a.jpg", 0, "fp")
+    app.in_scan = False
+    app.entries = {"nazwa": object()}
+    ui.CardEditorApp._finish_fp_lookup(app, "a.jpg", 0, "fp")
+    assert started == []
+
+
+def test_fingerprint_worker_error_still_finishes(monkeypatch):
+    def fail(path):
+        raise MemoryError
+
+    finished = []
+    monkeypatch.setattr(ui, "_cached_fingerprint", fail)
+    monkeypatch.setattr(
+        ui.CardEditorApp, "_finish_fp_lookup", lambda self, path, idx, fp: finished.append(fp)
+    )
+    app = SimpleNamespace(root=SimpleNamespace(after=lambda delay, func: func()))
+
+    ui.CardEditorApp._fp_lookup_async(app, "a.jpg", 0)
+    assert finished == [None]
+
+
+def test_fingerprint_result_posted_without_tk_loop(monkeypatch):
+    finished = []
+    monkeypatch.setattr(ui, "_cached_fingerprint", lambda path: "fp")
+    monkeypatch.setattr(
+        ui.CardEditorApp, "_finish_fp_lookup", lambda self, path, idx, fp: finished.append(fp)
+    )
+
+    # no ``after``: the result is handed over directly
+    ui.CardEditorApp._fp_lookup_async(SimpleNamespace(root=SimpleNamespace()), "a.jpg", 0)
+    assert finished == ["fp"]
+
+    def closed(delay, func):
+        raise ui.tk.TclError("application has been destroyed")
+
+    # a destroyed root does not raise out of the worker
+    app = SimpleNamespace(root=SimpleNamespace(after=closed))
+    ui.CardEditorApp._fp_lookup_async(app, "a.jpg", 0)
+    assert finished == ["fp"]
@@ -69,3 +69,24 @@ def test_refresh_magazyn_uses_cached_columns(tmp_path, monkeypatch):
     assert bar2.value == 1.0
     assert lbl1.kwargs.get("text") == "50%"
     assert lbl2.kwargs.get("text") == "100%"
+
+    # a second refresh with the same occupancy leaves the bars alone but
+    # still refreshes the inventory stats
+    stats_calls = []
+    app.update_inventory_stats = lambda: stats_calls.append(True)
+    bar1.value = None
+    ui.CardEditorApp.refresh_magazyn(app)
+    assert bar1.value is None
+    assert stats_calls == [True]
+
+    app._mag_column_occ = {(1, 1): 250}
+    ui.CardEditorApp.refresh_magazyn(app)
+    assert bar1.value == 0.25
+    assert bar2.value == 0
+
+    # only the column whose percentage changed is reconfigured
+    lbl2.kwargs = {}
+    app._mag_column_occ = {(1, 1): 750}
+    ui.CardEditorApp.refresh_magazyn(app)
+    assert lbl1.kwargs.get("text") == "75%"
+    assert lbl2.kwargs == {}
@@ -211,3 +211,168 @@ def test_magazyn_grid_expands_with_canvas_width(tmp_path):
     assert all(info["weight"] == 1 for info in grid_cols.values())
     expected_cols = 1000 // (ui.MAX_CARD_THUMB_SIZE + ui.MAG_CARD_GAP * 2)
     assert len(grid_cols) == expected_cols
+
+
+def test_small_width_changes_keep_thumbnail_size(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant\n"
+        "A;1;S;K1;1;foo1.png;common\n",
+        encoding="utf-8",
+    )
+
+    app, ui = _load_app(csv_path, (1, 1.0, 0, 0))
+
+    class DummyParentCanvas(SimpleNamespace):
+        def winfo_width(self):
+            return self.width
+
+        def bbox(self, *a, **k):
+            return (0, 0, 0, 0)
+
+        def configure(self, **k):
+            self.config = k
+
+        def after_idle(self, func):
+            func()
+
+    canvas = DummyParentCanvas(width=150)
+    app.mag_list_frame._parent_canvas = canvas
+    app._relayout_mag_cards()
+    thumb = ui.CARD_THUMB_SIZE
+    assert thumb == 150 - ui.MAG_CARD_GAP * 2
+
+    canvas.width = 150 - ui.MAG_THUMB_SNAP + 1
+    app._relayout_mag_cards()
+    assert ui.CARD_THUMB_SIZE == thumb
+
+    canvas.width = 120
+    app._relayout_mag_cards()
+    assert ui.CARD_THUMB_SIZE == 120 - ui.MAG_CARD_GAP * 2
+
+
+def test_configure_bursts_coalesced_into_one_relayout(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant\n"
+        "A;1;S;K1;1;foo1.png;common\n",
+        encoding="utf-8",
+    )
+
+    app, ui = _load_app(csv_path, (1, 1.0, 0, 0))
+    bindings = {}
+    scheduled = []
+    cancelled = []
+
+    def after(ms, fn):
+        scheduled.append(fn)
+        return len(scheduled)
+
+    app.root.bind = lambda event, fn: bindings.setdefault(event, fn)
+    app.root.after = after
+    app.root.after_cancel = cancelled.append
+    app.mag_sort_var.set("name")
+    app._update_mag_list()
+
+    app.magazyn_frame.winfo_width = lambda: 500
+    for _ in range(3):
+        bindings["<Configure>"](None)
+    assert cancelled == [1, 2]
+    assert app._mag_relayout_after == 3
+
+    scheduled[-1]()
+    assert app._mag_relayout_after is None
+    assert app._mag_last_layout_width == 500
+
+    # same width again (e.g. the window was only moved): nothing to do
+    bindings["<Configure>"](None)
+    assert len(scheduled) == 3
+
+
+def test_scroll_region_measured_only_after_layout_changes(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant\n"
+        "A;1;S;K1;1;foo1.png;common\n",
+        encoding="utf-8",
+    )
+
+    app, ui = _load_app(csv_path, (1, 1.0, 0, 0))
+
+    class CountingCanvas(SimpleNamespace):
+        def winfo_width(self):
+            return self.width
+
+        def bbox(self, *a, **k):
+            self.bbox_calls += 1
+            return (0, 0, 0, 0)
+
+        def configure(self, **k):
+            self.config = k
+
+        def after_idle(self, func):
+            func()
+
+    canvas = CountingCanvas(width=600, bbox_calls=0)
+    app.mag_list_frame._parent_canvas = canvas
+    app._relayout_mag_cards()
+    assert canvas.bbox_calls == 1
+
+    app._relayout_mag_cards()
+    assert canvas.bbox_calls == 1
+
+    canvas.width = 200
+    app._relayout_mag_cards()
+    assert canvas.bbox_calls == 2
+
+
+def test_single_configure_binding_per_view(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant\n"
+        "A;1;S;K1;1;foo1.png;common\n",
+        encoding="utf-8",
+    )
+
+    app, ui = _load_app(csv_path, (1, 1.0, 0, 0))
+    canvas_binds = []
+    root_binds = []
+    app.mag_list_frame._parent_canvas = SimpleNamespace(
+        bind=lambda event, fn: canvas_binds.append(event) or "cid",
+        winfo_width=lambda: 500,
+        bbox=lambda *a: None,
+        configure=lambda **k: None,
+    )
+    app.root.bind = lambda event, fn: root_binds.append(event)
+
+    for sort in ("name", "price"):
+        app.mag_sort_var.set(sort)
+        app._update_mag_list()
+
+    assert canvas_binds == ["<Configure>"]
+    assert root_binds == []
+    assert app._mag_configure_binding == (app.mag_list_frame._parent_canvas, "cid")
+
+
+def test_root_configure_from_children_ignored(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant\n"
+        "A;1;S;K1;1;foo1.png;common\n",
+        encoding="utf-8",
+    )
+
+    app, ui = _load_app(csv_path, (1, 1.0, 0, 0))
+    bindings = {}
+    scheduled = []
+    app.root.bind = lambda event, fn: bindings.setdefault(event, fn)
+    app.root.after = lambda ms, fn: scheduled.append(fn) or len(scheduled)
+    app.root.after_cancel = lambda *_: None
+    app.mag_sort_var.set("name")
+    app._update_mag_list()
+
+    app.magazyn_frame.winfo_width = lambda: 500
+    bindings["<Configure>"](SimpleNamespace(widget=object()))
+    assert scheduled == []
+    bindings["<Configure>"](SimpleNamespace(widget=app.root))
+    assert len(scheduled) == 1
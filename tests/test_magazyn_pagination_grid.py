@@ -16,10 +16,10 @@ from ctk_mocks import (
 )
 
 
-def _load_app(csv_path, stats):
+def _load_app(csv_path, stats, label_cls=DummyCTkLabel):
     sys.modules["customtkinter"] = SimpleNamespace(
         CTkFrame=DummyCTkFrame,
-        CTkLabel=DummyCTkLabel,
+        CTkLabel=label_cls,
         CTkButton=DummyCTkButton,
         CTkScrollableFrame=DummyCTkScrollableFrame,
         CTkEntry=DummyCTkEntry,
@@ -77,6 +77,26 @@ def test_magazyn_page_navigation(tmp_path):
     assert len(app.mag_card_labels) == 20
 
 
+def test_magazyn_page_change_reuses_card_widgets(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    header = "name;number;era;set;warehouse_code;price;image;variant\n"
+    rows = [
+        f"Card{i:02d};{i};E;S;K{i};1;img{i}.png;common\n" for i in range(25)
+    ]
+    csv_path.write_text(header + "".join(rows), encoding="utf-8")
+
+    app = _load_app(csv_path, (25, 25.0, 0, 0))
+    first_page = list(app.mag_card_frames)
+
+    app.mag_next_button.kwargs["command"]()
+    assert app.mag_card_frames == first_page[:5]
+    assert app.mag_card_labels[0].text == "Card20"
+
+    app.mag_prev_button.kwargs["command"]()
+    assert app.mag_card_frames == first_page
+    assert app.mag_card_labels[0].text == "Card00"
+
+
 def test_magazyn_grid_positions(tmp_path):
     class RecordingFrame(DummyCTkFrame):
         def grid(self, **kwargs):
@@ -133,3 +153,109 @@ def test_magazyn_grid_positions(tmp_path):
     assert frames[1].grid_kwargs["row"] == 0
     assert frames[1].grid_kwargs["column"] == 1
 
+
+def test_magazyn_page_change_grids_only_new_frames(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    header = "name;number;era;set;warehouse_code;price;image;variant\n"
+    rows = [
+        f"Card{i:02d};{i};E;S;K{i};1;img{i}.png;common\n" for i in range(25)
+    ]
+    csv_path.write_text(header + "".join(rows), encoding="utf-8")
+
+    app = _load_app(csv_path, (25, 25.0, 0, 0))
+    frames = list(app.mag_card_frames)
+    assert all(len(f.grid_calls) == 1 for f in frames)
+
+    app.mag_next_button.kwargs["command"]()
+    assert all(len(f.grid_calls) == 1 for f in frames)
+
+    app.mag_prev_button.kwargs["command"]()
+    assert [len(f.grid_calls) for f in frames] == [1] * 5 + [2] * 15
+
+
+def test_magazyn_page_change_reuses_filtered_rows(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    header = "name;number;era;set;warehouse_code;price;image;variant\n"
+    rows = [
+        f"Card{i:02d};{i};E;S;K{i};1;img{i}.png;common\n" for i in range(25)
+    ]
+    csv_path.write_text(header + "".join(rows), encoding="utf-8")
+
+    app = _load_app(csv_path, (25, 25.0, 0, 0))
+    ui = sys.modules["kartoteka.ui"]
+
+    with patch.object(ui, "_mag_search_blob", side_effect=AssertionError):
+        app.mag_next_button.kwargs["command"]()
+    assert app.mag_card_labels[0].text == "Card20"
+
+
+def test_magazyn_reused_card_opens_current_row(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    header = "name;number;era;set;warehouse_code;price;image;variant\n"
+    rows = [
+        f"Card{i:02d};{i};E;S;K{i};1;img{i}.png;common\n" for i in range(25)
+    ]
+    csv_path.write_text(header + "".join(rows), encoding="utf-8")
+
+    app = _load_app(csv_path, (25, 25.0, 0, 0))
+    opened = []
+    app.show_card_details = opened.append
+    label = app.mag_card_labels[0]
+    handler = label._bindings["<Button-1>"]
+
+    app.mag_next_button.kwargs["command"]()
+    assert app.mag_card_labels[0] is label
+    # the binding is not replaced; it follows the row now shown
+    assert label._bindings["<Button-1>"] is handler
+    handler(None)
+    assert opened[0]["name"] == "Card20"
+
+
+def test_magazyn_unchanged_cards_not_reconfigured(tmp_path):
+    class CountingLabel(DummyCTkLabel):
+        def configure(self, **kwargs):
+            self.configured = getattr(self, "configured", 0) + 1
+            for key, value in kwargs.items():
+                setattr(self, key, value)
+
+    csv_path = tmp_path / "magazyn.csv"
+    header = "name;number;era;set;warehouse_code;price;image;variant\n"
+    rows = [
+        f"Card{i:02d};{i};E;S;K{i};1;img{i}.png;common\n" for i in range(25)
+    ]
+    csv_path.write_text(header + "".join(rows), encoding="utf-8")
+
+    app = _load_app(csv_path, (25, 25.0, 0, 0), label_cls=CountingLabel)
+    labels = list(app.mag_card_labels) + list(app.mag_card_image_labels[:20])
+    for label in labels:
+        label.configured = 0
+
+    # a search matching every card keeps the same first page on screen
+    app.mag_search_var.set("card")
+    app._update_mag_list()
+    assert all(label.configured == 0 for label in labels)
+
+    app.mag_next_button.kwargs["command"]()
+    assert app.mag_card_labels[0].configured == 1
+    assert app.mag_card_labels[0].text == "Card20"
+
+
+def test_magazyn_labels_follow_thumbnail_size(tmp_path, monkeypatch):
+    csv_path = tmp_path / "magazyn.csv"
+    header = "name;number;era;set;warehouse_code;price;image;variant\n"
+    rows = [
+        f"Card{i:02d};{i};E;S;K{i};1;img{i}.png;common\n" for i in range(25)
+    ]
+    csv_path.write_text(header + "".join(rows), encoding="utf-8")
+
+    app = _load_app(csv_path, (25, 25.0, 0, 0))
+    app.mag_next_button.kwargs["command"]()
+    ui = sys.modules["kartoteka.ui"]
+    monkeypatch.setattr(ui, "CARD_THUMB_SIZE", 120)
+
+    # the pooled labels for Card05-Card19 keep their text across the page
+    # change but were sized for the old thumbnails
+    app.mag_prev_button.kwargs["command"]()
+    assert app.mag_card_labels[19].text == "Card19"
+    assert all(label.width == 120 for label in app.mag_card_labels)
+    assert all(label.wraplength == 120 for label in app.mag_card_labels)
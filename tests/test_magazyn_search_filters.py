@@ -135,6 +135,125 @@ def test_search_multiple_terms_across_fields(tmp_path):
     assert app.mag_card_labels[0].text == "Pikachu"
 
 
+def test_search_blob_precomputed_on_reload(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image\n"
+        "Pikachu;25;Base;K1R1P1;12,50;foo.png\n"
+        "Raichu;26;Base;K1R1P2;3;foo.png\n",
+        encoding="utf-8",
+    )
+    app = _load_app(csv_path, (2, 15.5, 0, 0))
+
+    assert all("_search_blob" in row for row in app.mag_card_rows)
+
+    app.mag_search_var.set("12.50")
+    app._update_mag_list()
+    assert [lbl.text for lbl in app.mag_card_labels] == ["Pikachu"]
+
+
+def test_sort_by_price_and_quantity(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image\n"
+        "A;1;S;K1R1P1;10,50;foo.png\n"
+        "B;2;S;K1R1P2;2;foo.png\n"
+        "B;2;S;K1R1P3;2;foo.png\n"
+        "C;3;S;K1R1P4;abc;foo.png\n",
+        encoding="utf-8",
+    )
+    app = _load_app(csv_path, (4, 14.5, 0, 0))
+
+    app.mag_sort_var.set("price")
+    app._update_mag_list()
+    assert [lbl.text for lbl in app.mag_card_labels] == ["C", "B", "A"]
+
+    app.mag_sort_var.set("quantity")
+    app._update_mag_list()
+    assert app.mag_card_labels[0].text == "B"
+
+
+def test_sort_order_reused_across_searches(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image\n"
+        "Pikachu A;1;S;K1R1P1;30;foo.png\n"
+        "Pikachu B;2;S;K1R1P2;10;foo.png\n"
+        "Raichu;3;S;K1R1P3;20;foo.png\n",
+        encoding="utf-8",
+    )
+    app = _load_app(csv_path, (3, 60.0, 0, 0))
+    ui = sys.modules["kartoteka.ui"]
+
+    with patch.object(ui, "itemgetter", wraps=ui.itemgetter) as getter:
+        app.mag_sort_var.set("price")
+        app._update_mag_list()
+        assert [lbl.text for lbl in app.mag_card_labels] == [
+            "Pikachu B",
+            "Raichu",
+            "Pikachu A",
+        ]
+        for text in ("pika", "pikachu", ""):
+            app.mag_search_var.set(text)
+            app._update_mag_list()
+        assert getter.call_count == 1
+    assert [lbl.text for lbl in app.mag_card_labels] == [
+        "Pikachu B",
+        "Raichu",
+        "Pikachu A",
+    ]
+    app.mag_search_var.set("pika")
+    app._update_mag_list()
+    assert [lbl.text for lbl in app.mag_card_labels] == ["Pikachu B", "Pikachu A"]
+
+
+def test_typing_filters_once_after_pause(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image\n"
+        "Charizard;4;Base;K1R1P1;100;foo.png\n"
+        "Pikachu;25;Base;K1R1P2;5;foo.png\n",
+        encoding="utf-8",
+    )
+    app = _load_app(csv_path, (2, 105.0, 0, 0))
+    scheduled = {}
+    cancelled = []
+
+    def after(ms, fn):
+        scheduled[len(scheduled)] = fn
+        return len(scheduled) - 1
+
+    app.root.after = after
+    app.root.after_cancel = cancelled.append
+
+    for text in ("c", "ch", "cha"):
+        app.mag_search_var.set(text)
+    assert cancelled == [0, 1]
+    assert len(app.mag_card_labels) == 2
+
+    scheduled[2]()
+    assert [lbl.text for lbl in app.mag_card_labels] == ["Charizard"]
+
+
+def test_update_skipped_when_inputs_unchanged(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image\n"
+        "Pikachu;25;Base;K1R1P1;5;foo.png\n",
+        encoding="utf-8",
+    )
+    app = _load_app(csv_path, (1, 5.0, 0, 0))
+    labels = app.mag_card_labels
+
+    app._update_mag_list()
+    assert app.mag_card_labels is labels
+
+    app.mag_search_var.set("pika")
+    app._update_mag_list()
+    assert app.mag_card_labels is not labels
+    assert [lbl.text for lbl in app.mag_card_labels] == ["Pikachu"]
+
+
 def _load_app_with_delay(csv_path, stats):
     sys.modules["customtkinter"] = SimpleNamespace(
         CTkFrame=DummyCTkFrame,
@@ -203,7 +322,7 @@ def test_search_clear_keeps_thumbnails(tmp_path):
         app.mag_search_var.set("")
         app._update_mag_list()
         for t in app._image_threads:
-            t.join()
+            t.result()
         assert app.mag_card_image_labels[0] is not None
         assert app.mag_card_image_labels[0].image is photo
     finally:
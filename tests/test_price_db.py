@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.modules.setdefault("customtkinter", MagicMock())
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+import kartoteka.ui as ui  # noqa: E402
+
+
+def test_price_db_indexed_by_normalised_card(tmp_path, monkeypatch):
+    db = tmp_path / "card_prices.csv"
+    db.write_text(
+        "name,number,set,price\n"
+        "Pikachu,25,Base Set,12.5\n"
+        "Pikachu,25,Base Set,99\n"
+        "Mew,151,Promo,\n"
+        "Short,1\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(ui, "PRICE_DB_PATH", str(db))
+
+    app = SimpleNamespace()
+    app.price_db = ui.CardEditorApp.load_price_db(app)
+
+    assert ui.CardEditorApp.get_price_from_db(app, "PIKACHU", " 25", "base set ") == 12.5
+    assert ui.CardEditorApp.get_price_from_db(app, "Mew", "151", "Promo") is None
+    assert ui.CardEditorApp.get_price_from_db(app, "Short", "1", "") is None
+    assert ui.CardEditorApp.get_price_from_db(app, "Raichu", "26", "Base Set") is None
+
+    monkeypatch.setattr(ui, "PRICE_DB_PATH", str(tmp_path / "missing.csv"))
+    assert ui.CardEditorApp.load_price_db(app) == {}
@@ -31,3 +31,95 @@ def test_add_and_clear_price_pool():
     assert dummy.price_pool_total == 10 + 10 * ui.HOLO_REVERSE_MULTIPLIER
     ui.CardEditorApp.clear_price_pool(dummy)
     assert dummy.price_pool_total == 0.0
+
+
+def test_reverse_toggle_updates_only_pln_labels():
+    labels = [MagicMock() for _ in range(4)]
+    info = {"price_pln": 10, "price_eur": 2.5, "eur_pln_rate": 4.0}
+    dummy = SimpleNamespace(
+        price_labels=labels,
+        _price_label_texts=[
+            "Cena EUR: 2.5",
+            "Kurs EUR→PLN: 4.0",
+            "Cena PLN: 10",
+            "80% ceny PLN: 8.0",
+        ],
+        type_vars={},
+    )
+    dummy.apply_variant_multiplier = ui.CardEditorApp.apply_variant_multiplier.__get__(dummy, ui.CardEditorApp)
+
+    ui.CardEditorApp.display_price_info(dummy, info, True)
+
+    labels[0].config.assert_not_called()
+    labels[1].config.assert_not_called()
+    labels[2].config.assert_called_once()
+    labels[3].config.assert_called_once()
+
+
+def test_reverse_toggle_skips_unchanged_state():
+    shown = []
+    dummy = SimpleNamespace(
+        current_price_info={"price_pln": 10},
+        price_reverse_var=DummyVar(False),
+        _last_reverse_state=False,
+    )
+    dummy.display_price_info = lambda info, rev: shown.append(rev)
+
+    ui.CardEditorApp.on_reverse_toggle(dummy)
+    assert shown == []
+
+    dummy.price_reverse_var = DummyVar(True)
+    ui.CardEditorApp.on_reverse_toggle(dummy)
+    assert shown == [True]
+
+
+def test_fingerprint_match_price_added_to_pool(monkeypatch):
+    monkeypatch.setattr(ui.csv_utils, "find_duplicates", lambda *a: [])
+    # other tests may leave a stubbed ``tk`` module behind
+    monkeypatch.setattr(ui, "tk", SimpleNamespace(END="end"))
+    entries = {
+        "nazwa": MagicMock(),
+        "numer": MagicMock(),
+        "set": MagicMock(),
+        "era": MagicMock(),
+        "cena": MagicMock(),
+    }
+    dummy = SimpleNamespace(
+        entries=entries,
+        price_pool_total=1.0,
+        price_reverse_var=DummyVar(False),
+        pool_total_label=MagicMock(),
+        type_vars={},
+        get_price_from_db=lambda *a: "12.5",
+        update_set_options=lambda: None,
+    )
+    dummy.apply_variant_multiplier = ui.CardEditorApp.apply_variant_multiplier.__get__(
+        dummy, ui.CardEditorApp
+    )
+    match = SimpleNamespace(meta={"name": "Pikachu", "number": "25", "set": "Base"}, distance=0)
+
+    assert ui.CardEditorApp._apply_fp_match(dummy, match, "scan.jpg")
+    entries["cena"].insert.assert_called_with(0, "12.5")
+    assert dummy.price_pool_total == 13.5
+    dummy.pool_total_label.config.assert_called_with(text="Suma puli: 13.50")
+
+    dummy.get_price_from_db = lambda *a: "n/a"
+    assert ui.CardEditorApp._apply_fp_match(dummy, match, "scan.jpg")
+    assert dummy.price_pool_total == 13.5
+
+
+def test_fingerprint_match_sets_listed_types(monkeypatch):
+    monkeypatch.setattr(ui.csv_utils, "find_duplicates", lambda *a: [])
+    monkeypatch.setattr(ui, "tk", SimpleNamespace(END="end"))
+    type_vars = {"Holo": MagicMock(), "Reverse": MagicMock()}
+    dummy = SimpleNamespace(
+        entries={k: MagicMock() for k in ("nazwa", "numer", "set", "era", "cena")},
+        type_vars=type_vars,
+        update_set_options=lambda: None,
+    )
+    meta = {"name": "Pikachu", "number": "25", "set": "Base", "typ": " Holo, Shiny"}
+
+    ui.CardEditorApp._apply_fp_match(dummy, SimpleNamespace(meta=meta, distance=0), "x.jpg")
+
+    type_vars["Holo"].set.assert_called_once_with(True)
+    type_vars["Reverse"].set.assert_not_called()
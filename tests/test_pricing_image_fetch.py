@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent))
+from ctk_mocks import load_ui  # noqa: E402
+
+
+def test_url_bytes_cached_and_failures_retried(monkeypatch):
+    ui = load_ui()
+    ok = MagicMock(content=b"data")
+    session = MagicMock()
+    session.get.return_value = ok
+    monkeypatch.setattr(ui, "_http_session", lambda: session)
+
+    assert ui._fetch_url_bytes("http://x/a.png") == b"data"
+    assert ui._fetch_url_bytes("http://x/a.png") == b"data"
+    assert session.get.call_count == 1
+
+    class Boom(Exception):
+        pass
+
+    bad = MagicMock()
+    bad.raise_for_status.side_effect = Boom("boom")
+    session.get.return_value = bad
+    with pytest.raises(Boom):
+        ui._fetch_url_bytes("http://x/b.png")
+    session.get.return_value = ok
+    assert ui._fetch_url_bytes("http://x/b.png") == b"data"
+    assert session.get.call_count == 3
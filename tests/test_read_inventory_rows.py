@@ -80,3 +80,15 @@ def test_read_inventory_rows_image_and_defaults(tmp_path):
     assert rows[0]["product_code"] == ""
     assert rows[0]["cena_początkowa"] == "0"
 
+
+def test_read_inventory_rows_filter_name_format(tmp_path):
+    csv_path = tmp_path / "inv.csv"
+    csv_path.write_text(
+        "product_code;name;price\n1;A 1;9\n2;B 2;3\n3;C 3;4\n",
+        encoding="utf-8",
+    )
+    dummy = SimpleNamespace()
+    rows = ui.CardEditorApp.read_inventory_rows(dummy, ["2", 3], str(csv_path))
+    assert [r["product_code"] for r in rows] == ["2", "3"]
+    assert rows[0]["nazwa_karty"] == "B"
+    assert rows[1]["cena_początkowa"] == "4"
@@ -0,0 +1,194 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).resolve().parent))
+from ctk_mocks import DummyCTkLabel, load_ui  # noqa: E402
+
+
+def _reload(ui, csv_path):
+    app = SimpleNamespace(root=SimpleNamespace())
+    photo_mock = SimpleNamespace(width=lambda: 10, height=lambda: 10)
+    with patch.object(ui.ImageTk, "PhotoImage", return_value=photo_mock), \
+         patch.object(ui.csv_utils, "WAREHOUSE_CSV", str(csv_path)):
+        ui.CardEditorApp.reload_mag_cards(app)
+    return app
+
+
+def test_column_occupancy_counts_unsold_codes(tmp_path):
+    ui = load_ui()
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant;sold\n"
+        'A;1;S;"K1R1P0001; K1R2P0002";1;;common;\n'
+        "B;2;S;K1R1P0003;1;;common;\n"
+        "C;3;S;K2R1P0001;1;;common;1\n"
+        "D;4;S;bad;1;;common;\n",
+        encoding="utf-8",
+    )
+    app = _reload(ui, csv_path)
+    assert app._mag_column_occ == {(1, 1): 2, (1, 2): 1}
+    assert len(app.mag_card_rows) == 4
+
+
+def test_loaded_thumbnails_applied_in_one_tick(tmp_path):
+    ui = load_ui()
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant;sold\n"
+        "A;1;S;K1R1P0001;1;a.png;common;\n"
+        "B;2;S;K1R1P0002;1;b.png;common;\n",
+        encoding="utf-8",
+    )
+    scheduled = []
+    relayouts = []
+    app = SimpleNamespace(
+        root=SimpleNamespace(after=lambda ms, fn: scheduled.append(fn)),
+        _relayout_mag_cards=lambda: relayouts.append(True),
+    )
+    photo_mock = SimpleNamespace(width=lambda: 10, height=lambda: 10)
+    with patch.object(ui.ImageTk, "PhotoImage", return_value=photo_mock), \
+         patch.object(ui, "_load_image", return_value=ui.Image.new("RGB", (4, 4))), \
+         patch.object(ui.csv_utils, "WAREHOUSE_CSV", str(csv_path)):
+        ui.CardEditorApp.reload_mag_cards(app)
+        app.mag_card_image_labels[:] = [DummyCTkLabel(), DummyCTkLabel()]
+        app._mag_request_thumbnails([0, 1])
+        for job in app._image_threads:
+            job.result()
+        assert len(scheduled) == 1
+        scheduled[0]()
+
+    assert [lbl.image for lbl in app.mag_card_image_labels] == [photo_mock] * 2
+    assert relayouts == [True]
+
+
+def test_shared_artwork_loaded_once(tmp_path):
+    ui = load_ui()
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant;sold\n"
+        "A;1;S;K1R1P0001;1;same.png;common;\n"
+        "A;1;S2;K1R1P0002;1;same.png;common;\n",
+        encoding="utf-8",
+    )
+    app = SimpleNamespace(root=SimpleNamespace())
+    with patch.object(ui.ImageTk, "PhotoImage", side_effect=lambda *a, **k: object()), \
+         patch.object(
+             ui, "_load_image", return_value=ui.Image.new("RGB", (4, 4))
+         ) as load_mock, \
+         patch.object(ui.csv_utils, "WAREHOUSE_CSV", str(csv_path)):
+        ui.CardEditorApp.reload_mag_cards(app)
+        app._mag_request_thumbnails([0, 1])
+        for job in app._image_threads:
+            job.result()
+
+    assert load_mock.call_count == 1
+    first, second = app.mag_card_images
+    assert first is second
+    assert first is not app.mag_placeholder_photo
+
+
+def test_photos_reused_after_csv_change(tmp_path):
+    ui = load_ui()
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant;sold\n"
+        "A;1;S;K1R1P0001;1;a.png;common;\n",
+        encoding="utf-8",
+    )
+    app = SimpleNamespace(root=SimpleNamespace())
+    with patch.object(ui.ImageTk, "PhotoImage", side_effect=lambda *a, **k: object()), \
+         patch.object(ui, "_load_image", return_value=ui.Image.new("RGB", (4, 4))), \
+         patch.object(ui.csv_utils, "WAREHOUSE_CSV", str(csv_path)):
+        ui.CardEditorApp.reload_mag_cards(app)
+        app._mag_request_thumbnails([0])
+        for job in app._image_threads:
+            job.result()
+        photo = app.mag_card_images[0]
+
+        csv_path.write_text(
+            "name;number;set;warehouse_code;price;image;variant;sold\n"
+            "A;1;S;K1R1P0001;1;a.png;common;1\n",
+            encoding="utf-8",
+        )
+        ui.os.utime(csv_path, (0, app._mag_csv_mtime + 1))
+        ui.CardEditorApp.reload_mag_cards(app)
+        app._mag_request_thumbnails([0])
+
+    assert app._image_threads == []
+    assert app.mag_card_images[0] is photo
+
+
+def test_unchanged_csv_is_not_parsed_again(tmp_path):
+    ui = load_ui()
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant;sold\n"
+        "A;1;S;K1R1P0001;1;;common;\n",
+        encoding="utf-8",
+    )
+    app = _reload(ui, csv_path)
+    rows = app.mag_card_rows
+    with patch.object(ui.csv_utils, "WAREHOUSE_CSV", str(csv_path)), \
+         patch.object(ui.csv, "reader") as reader_mock:
+        ui.CardEditorApp.reload_mag_cards(app)
+    reader_mock.assert_not_called()
+    assert app.mag_card_rows is rows
+
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant;sold\n"
+        "A;1;S;K1R1P0001;1;;common;\n"
+        "B;2;S;K1R1P0002;1;;common;\n",
+        encoding="utf-8",
+    )
+    ui.os.utime(csv_path, (0, app._mag_csv_mtime + 1))
+    with patch.object(ui.ImageTk, "PhotoImage", return_value=object()), \
+         patch.object(ui.csv_utils, "WAREHOUSE_CSV", str(csv_path)):
+        ui.CardEditorApp.reload_mag_cards(app)
+    assert len(app.mag_card_rows) == 2
+
+
+def test_grouped_card_keeps_newest_added_at(tmp_path):
+    ui = load_ui()
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant;sold;added_at\n"
+        "A;1;S;K1R1P0001;1;;common;;2024-01-05\n"
+        "A;1;S;K1R1P0002;1;;common;;2024-03-01\n"
+        "A;1;S;K1R1P0003;1;;common;;bad\n",
+        encoding="utf-8",
+    )
+    app = _reload(ui, csv_path)
+    (row,) = app.mag_card_rows
+    assert row["added_at"] == "2024-03-01"
+    assert row["_count"] == 3
+
+
+def test_thumbnails_loaded_only_when_requested(tmp_path):
+    ui = load_ui()
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant;sold\n"
+        "A;1;S;K1R1P0001;1;a.png;common;\n"
+        "B;2;S;K1R1P0002;1;b.png;common;\n",
+        encoding="utf-8",
+    )
+    app = SimpleNamespace(root=SimpleNamespace())
+    with patch.object(ui.ImageTk, "PhotoImage", side_effect=lambda *a, **k: object()), \
+         patch.object(
+             ui, "_load_image", return_value=ui.Image.new("RGB", (4, 4))
+         ) as load_mock, \
+         patch.object(ui.csv_utils, "WAREHOUSE_CSV", str(csv_path)):
+        ui.CardEditorApp.reload_mag_cards(app)
+        assert app._image_threads == []
+
+        app._mag_request_thumbnails([1])
+        app._mag_request_thumbnails([1])
+        for job in app._image_threads:
+            job.result()
+
+    assert len(app._image_threads) == 1
+    assert load_mock.call_args[0][0] == "b.png"
+    assert app.mag_card_images[0] is app.mag_placeholder_photo
+    assert app.mag_card_images[1] is not app.mag_placeholder_photo
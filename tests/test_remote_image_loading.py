@@ -193,7 +193,7 @@ def test_show_magazyn_view_remote_thumbnail(tmp_path):
          patch.object(ui.messagebox, "showinfo", lambda *a, **k: None):
         ui.CardEditorApp.show_magazyn_view(app)
         for t in app._image_threads:
-            t.join()
+            t.result()
 
     assert mock_get.called
     assert app.mag_card_images[0] is photo_mock
@@ -244,7 +244,7 @@ def test_show_magazyn_view_local_thumbnail(tmp_path):
         ui.CardEditorApp.show_magazyn_view(app)
         assert app._image_threads  # ensures a thread was spawned
         for t in app._image_threads:
-            t.join()
+            t.result()
 
     assert app.mag_card_images[0] is photo_mock
 
@@ -289,7 +289,7 @@ def test_show_card_details_remote_uses_cache(tmp_path):
         # first load thumbnails
         ui.CardEditorApp.show_magazyn_view(app)
         for t in app._image_threads:
-            t.join()
+            t.result()
         # then show details which should reuse cache and not trigger new request
         ui.CardEditorApp.show_card_details(app, app.mag_card_rows[0])
 
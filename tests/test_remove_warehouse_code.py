@@ -19,3 +19,16 @@ def test_remove_warehouse_code_updates_stats():
     ui.CardEditorApp.remove_warehouse_code(app, "K1R1P1")
     assert app.output_data == []
     app.update_inventory_stats.assert_called_once()
+
+
+def test_remove_warehouse_code_drops_matching_row_only():
+    first = {"warehouse_code": "K1R1P1;K1R1P2"}
+    second = {"warehouse_code": "K1R1P3"}
+    app = SimpleNamespace(
+        output_data=[None, first, second],
+        repack_column=lambda box, col: None,
+    )
+    ui.CardEditorApp.remove_warehouse_code(app, "K1R1P2")
+    assert first["warehouse_code"] == "K1R1P1"
+    ui.CardEditorApp.remove_warehouse_code(app, "K1R1P3")
+    assert app.output_data == [None, first]
@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.modules.setdefault("customtkinter", MagicMock())
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+import kartoteka.ui as ui  # noqa: E402
+
+
+def test_root_background_read_once():
+    calls = []
+    colour = ["#111"]
+
+    def cget(key):
+        calls.append(key)
+        return colour[0]
+
+    app = SimpleNamespace(root=SimpleNamespace(cget=cget))
+
+    assert ui._root_bg(app) == "#111"
+    assert ui._root_bg(app) == "#111"
+    assert calls == ["background"]
+
+    colour[0] = "#222"
+    assert ui.CardEditorApp._refresh_bg(app) == "#222"
+    assert ui._root_bg(app) == "#222"
+    assert len(calls) == 2
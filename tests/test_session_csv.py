@@ -94,6 +94,29 @@ def test_save_current_appends_session(tmp_path):
         assert rows[0]["variant"] == "Common"
 
 
+def test_session_file_kept_open_between_saves(tmp_path):
+    session_path = tmp_path / "session.csv"
+    dummy = make_dummy()
+    dummy.session_csv_path = str(session_path)
+    ui._session_csv_writer(dummy, new=True)
+
+    with patch("builtins.open", wraps=open) as open_mock:
+        ui.CardEditorApp.save_current_data(dummy)
+        dummy.output_data.append(None)
+        dummy.cards.append("/tmp/char2.jpg")
+        dummy.index = 1
+        ui.CardEditorApp.save_current_data(dummy)
+    opened = [c.args[0] for c in open_mock.call_args_list]
+    assert str(session_path) not in opened
+
+    # rows are flushed as they are saved
+    with open(session_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f, delimiter=";"))
+    assert len(rows) == 2
+    ui._close_session_csv(dummy)
+    assert dummy._session_csv is None
+
+
 def test_export_accumulates_between_sessions(tmp_path, monkeypatch):
     out_path = tmp_path / "collection.csv"
     inv_path = tmp_path / "inv.csv"
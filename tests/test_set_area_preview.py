@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.modules.setdefault("customtkinter", MagicMock())
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+import kartoteka.ui as ui  # noqa: E402
+
+
+def test_preview_reads_size_once_and_reuses_buffer(tmp_path, monkeypatch):
+    scan = tmp_path / "scan.png"
+    ui.Image.new("RGB", (200, 100), "white").save(scan)
+    shown = []
+    monkeypatch.setattr(ui, "_create_image", lambda img: img)
+    app = SimpleNamespace(
+        current_image_path=str(scan),
+        image_label=SimpleNamespace(configure=lambda image: shown.append(image)),
+    )
+    image = ui.Image.new("RGB", (100, 50), "white")
+
+    with patch.object(ui.Image, "open", wraps=ui.Image.open) as opened:
+        ui.CardEditorApp.update_set_area_preview(app, (0, 0, 20, 20), image)
+        ui.CardEditorApp.update_set_area_preview(app, (100, 50, 180, 90), image)
+        assert opened.call_count == 1
+
+    assert shown[0] is shown[1]
+    # the first rectangle is gone and the second is scaled to the preview
+    assert shown[1].getpixel((0, 0)) == (255, 255, 255)
+    assert shown[1].getpixel((50, 25)) == (255, 0, 0)
+    assert image.getpixel((50, 25)) == (255, 255, 255)
+
+
+def test_same_area_not_redrawn(tmp_path, monkeypatch):
+    shown = []
+    monkeypatch.setattr(ui, "_create_image", lambda img: img)
+    app = SimpleNamespace(
+        current_image_path=str(tmp_path / "missing.jpg"),
+        image_label=SimpleNamespace(configure=lambda image: shown.append(image)),
+    )
+    image = ui.Image.new("RGB", (100, 50), "white")
+
+    ui.CardEditorApp.update_set_area_preview(app, (0, 0, 20, 20), image)
+    ui.CardEditorApp.update_set_area_preview(app, [0, 0, 20, 20], image)
+    assert len(shown) == 1
+
+    app._analysis_orientation = 90
+    ui.CardEditorApp.update_set_area_preview(app, (0, 0, 20, 20), image)
+    ui.CardEditorApp.update_set_area_preview(app, (0, 0, 20, 20), image.copy())
+    assert len(shown) == 3
@@ -0,0 +1,137 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.modules.setdefault("customtkinter", MagicMock())
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import kartoteka.ui as ui  # noqa: E402
+
+
+SETS = {
+    "Scarlet & Violet": [
+        {"name": "Paldea Evolved", "code": "sv2", "abbr": "PAL"},
+        {"name": "Obsidian Flames", "code": "sv3", "abbr": "OBF"},
+    ],
+    "XY": [{"name": "Evolutions", "code": "xy12", "abbr": "EVO"}],
+}
+
+
+def _app(typed, era=""):
+    dropdown = SimpleNamespace(values=None)
+    dropdown.configure = lambda values: setattr(dropdown, "values", values)
+    var = SimpleNamespace(value=typed)
+    var.get = lambda: var.value
+    var.set = lambda v: setattr(var, "value", v)
+    return SimpleNamespace(
+        set_var=var,
+        lang_var=SimpleNamespace(get=lambda: "ENG"),
+        era_var=SimpleNamespace(get=lambda: era),
+        set_dropdown=dropdown,
+    )
+
+
+def _use_sets(monkeypatch):
+    monkeypatch.setattr(ui, "tcg_sets_eng_by_era", SETS)
+    monkeypatch.setattr(
+        ui, "tcg_sets_eng", [i["name"] for s in SETS.values() for i in s]
+    )
+    monkeypatch.setattr(
+        ui, "tcg_sets_eng_code_map", {i["code"]: i["name"] for s in SETS.values() for i in s}
+    )
+    monkeypatch.setattr(
+        ui,
+        "tcg_sets_eng_abbr_name_map",
+        {i["abbr"]: i["name"] for s in SETS.values() for i in s},
+    )
+    ui._SET_SEARCH_INDEX.clear()
+
+
+def test_filter_sets_uses_cached_index(monkeypatch):
+    _use_sets(monkeypatch)
+    app = _app("evo")
+    ui.CardEditorApp.filter_sets(app)
+    assert app.set_dropdown.values == ["Paldea Evolved", "Evolutions"]
+    index = ui._set_search_index("ENG", "")
+
+    app.set_var.set("obf")
+    ui.CardEditorApp.filter_sets(app)
+    assert app.set_dropdown.values == ["Obsidian Flames"]
+    assert ui._set_search_index("ENG", "") is index
+
+    era_app = _app("evo", era="XY")
+    ui.CardEditorApp.filter_sets(era_app)
+    assert era_app.set_dropdown.values == ["Evolutions"]
+    ui._SET_SEARCH_INDEX.clear()
+
+
+def test_autocomplete_set_matches_code(monkeypatch):
+    _use_sets(monkeypatch)
+    app = _app("sv2")
+    focus = MagicMock()
+    event = SimpleNamespace(widget=SimpleNamespace(tk_focusNext=lambda: focus))
+    assert ui.CardEditorApp.autocomplete_set(app, event) == "break"
+    assert app.set_var.get() == "Paldea Evolved"
+    focus.focus.assert_called_once()
+    ui._SET_SEARCH_INDEX.clear()
+
+
+def test_filter_sets_falls_back_to_fuzzy_match(monkeypatch):
+    _use_sets(monkeypatch)
+    app = _app("evolutons")
+    ui.CardEditorApp.filter_sets(app)
+    assert app.set_dropdown.values[0] == "Evolutions"
+
+    assert ui._close_set_keys("obsidian flmes", ["obsidian flames", "xy12"], 1) == [
+        "obsidian flames"
+    ]
+    assert ui._close_set_keys("zzz", ["obsidian flames"], 1) == []
+    ui._SET_SEARCH_INDEX.clear()
+
+
+def test_filter_sets_lists_each_set_once(monkeypatch):
+    _use_sets(monkeypatch)
+    # "pal" matches both the name and the abbreviation of Paldea Evolved
+    app = _app("pal")
+    ui.CardEditorApp.filter_sets(app)
+    assert app.set_dropdown.values == ["Paldea Evolved"]
+    ui._SET_SEARCH_INDEX.clear()
+
+
+def test_filter_sets_debounced_while_typing():
+    scheduled = {}
+    cancelled = []
+
+    def after(delay, func):
+        scheduled[len(scheduled)] = func
+        return len(scheduled) - 1
+
+    calls = []
+    app = SimpleNamespace(
+        root=SimpleNamespace(after=after, after_cancel=cancelled.append),
+        filter_sets=lambda event=None: calls.append(event),
+        set_dropdown=SimpleNamespace(winfo_exists=lambda: True),
+    )
+    app._run_filter_sets = lambda: ui.CardEditorApp._run_filter_sets(app)
+
+    for _ in range(3):
+        ui.CardEditorApp._schedule_filter_sets(app, "key")
+    assert cancelled == [0, 1]
+    assert calls == []
+
+    scheduled[2]()
+    assert calls == [None]
+    assert app._filter_sets_after_id is None
+
+
+def test_filter_sets_skipped_after_dropdown_destroyed():
+    calls = []
+    app = SimpleNamespace(
+        _filter_sets_after_id="after#1",
+        filter_sets=lambda event=None: calls.append(event),
+        set_dropdown=SimpleNamespace(winfo_exists=lambda: False),
+    )
+    ui.CardEditorApp._run_filter_sets(app)
+    assert calls == []
+    assert app._filter_sets_after_id is None
@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from kartoteka import csv_utils  # noqa: E402
+
+
+def test_set_sold_flag_updates_only_target_row(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;warehouse_code;sold\n"
+        "A;K1R1P0001;\n"
+        'B;K1R1P0002;\n'
+        '"C; with semicolon";K1R1P0003;1\n',
+        encoding="utf-8",
+    )
+
+    assert csv_utils.set_sold_flag("K1R1P0002", True, str(csv_path)) == "1"
+    lines = csv_path.read_text(encoding="utf-8").splitlines()
+    assert lines[1] == "A;K1R1P0001;"
+    assert lines[2] == "B;K1R1P0002;1"
+    assert lines[3] == '"C; with semicolon";K1R1P0003;1'
+
+    assert csv_utils.set_sold_flag("K1R1P0003", None, str(csv_path)) == ""
+    assert csv_path.read_text(encoding="utf-8").splitlines()[3].endswith(";")
+    assert not (tmp_path / "magazyn.csv.tmp").exists()
+
+
+def test_set_sold_flag_adds_missing_column(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;warehouse_code\nA;K1R1P0001\nB;K1R1P0002\n",
+        encoding="utf-8",
+    )
+
+    assert csv_utils.set_sold_flag("K1R1P0001", True, str(csv_path)) == "1"
+    assert csv_path.read_text(encoding="utf-8").splitlines() == [
+        "name;warehouse_code;sold",
+        "A;K1R1P0001;1",
+        "B;K1R1P0002;",
+    ]
+
+
+def test_set_sold_flag_unknown_code_leaves_file(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    content = "name;warehouse_code;sold\nA;K1R1P0001;\n"
+    csv_path.write_text(content, encoding="utf-8")
+
+    assert csv_utils.set_sold_flag("K9R9P9999", True, str(csv_path)) is None
+    assert csv_path.read_text(encoding="utf-8") == content
+
+
+def test_mark_codes_as_sold_updates_matching_rows(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;warehouse_code;sold\n"
+        'A;"K1R1P0001;K1R1P0002";\n'
+        "B;K1R1P0003;1\n"
+        "C;K1R1P0004\n",
+        encoding="utf-8",
+    )
+
+    assert csv_utils.mark_codes_as_sold(
+        ["K1R1P0002", "K1R1P0003", "K1R1P0004"], str(csv_path)
+    ) == 2
+    assert csv_path.read_text(encoding="utf-8").splitlines() == [
+        "name;warehouse_code;sold",
+        'A;"K1R1P0001;K1R1P0002";1',
+        "B;K1R1P0003;1",
+        "C;K1R1P0004;1",
+    ]
+    assert csv_utils.mark_codes_as_sold(["K1R1P0001"], str(csv_path)) == 0
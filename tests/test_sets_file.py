@@ -66,7 +66,10 @@ def run_update_sets(tmp_path, filename):
         },
         raise_for_status=lambda: None,
     )
-    with patch("requests.get", return_value=resp), patch.object(ui, "reload_sets") as reload_mock:
+    session = SimpleNamespace(get=MagicMock(return_value=resp))
+    with patch.object(ui, "_api_session", return_value=session), patch.object(
+        ui, "reload_sets"
+    ) as reload_mock:
         ui.CardEditorApp.update_sets(dummy)
         reload_mock.assert_called_once()
 
@@ -87,6 +90,30 @@ def test_update_sets_jp(tmp_path):
     run_update_sets(tmp_path, "tcg_sets_jp.json")
 
 
+def test_update_sets_offline_keeps_local_sets(tmp_path, monkeypatch):
+    class Offline(Exception):
+        pass
+
+    # other tests may leave a stubbed ``requests`` module behind
+    monkeypatch.setattr(ui, "requests", SimpleNamespace(RequestException=Offline))
+    sets_file = tmp_path / "tcg_sets.json"
+    sets_file.write_text('{"X": []}', encoding="utf-8")
+    dummy = make_dummy(tmp_path, sets_file)
+    dummy.log = MagicMock()
+
+    def fail(url, timeout=None):
+        raise Offline("offline")
+
+    with patch.object(ui, "_api_session", return_value=SimpleNamespace(get=fail)), patch.object(
+        ui, "reload_sets"
+    ) as reload_mock:
+        ui.CardEditorApp.update_sets(dummy)
+
+    reload_mock.assert_not_called()
+    assert "offline" in dummy.log.call_args[0][0]
+    assert sets_file.read_text(encoding="utf-8") == '{"X": []}'
+
+
 def test_startup_tasks_skips_when_same_month():
     now = datetime.datetime.now()
     dummy = SimpleNamespace(
@@ -119,3 +146,35 @@ def test_startup_tasks_runs_when_old_month():
         dummy.update_sets.assert_called_once()
         save_mock.assert_called_once()
 
+
+def test_download_set_symbols_skips_existing(tmp_path, monkeypatch):
+    monkeypatch.setattr(ui, "SET_LOGO_DIR", str(tmp_path))
+    (tmp_path / "old.png").write_bytes(b"old")
+    requested = []
+
+    def fake_get(url, timeout=None):
+        requested.append(url)
+        if "/sv02/" in url:
+            return SimpleNamespace(status_code=404, content=b"")
+        return SimpleNamespace(status_code=200, content=url.encode())
+
+    monkeypatch.setattr(ui, "_http_session", lambda: SimpleNamespace(get=fake_get))
+    labels = []
+    dummy = SimpleNamespace(
+        loading_label=SimpleNamespace(configure=lambda **k: labels.append(k["text"])),
+        root=SimpleNamespace(update=lambda: None),
+    )
+    sets = [
+        {"name": "Old", "code": "old"},
+        {"name": "New", "code": "new"},
+        {"name": "Alt", "code": "sv02"},
+        {"name": "None", "code": ""},
+    ]
+
+    ui.CardEditorApp.download_set_symbols(dummy, sets)
+
+    assert (tmp_path / "old.png").read_bytes() == b"old"
+    assert (tmp_path / "new.png").read_bytes().endswith(b"/new/symbol.png")
+    assert (tmp_path / "sv02.png").read_bytes().endswith(b"/sv2/symbol.png")
+    assert not any("/old/" in url for url in requested)
+    assert [text.split(":")[0] for text in labels] == ["Pobieram 3/4", "Pobieram 4/4"]
@@ -106,3 +106,68 @@ def test_show_card_handles_destroyed_entries(tmp_path, monkeypatch):
 
     assert "numer" not in dummy.entries
     assert "set" not in dummy.entries
+
+
+def test_entry_resetters_resolved_once(tmp_path, monkeypatch):
+    cards = []
+    for name in ("a.jpg", "b.jpg"):
+        path = tmp_path / name
+        path.write_bytes(b"data")
+        cards.append(str(path))
+
+    tk_mod = SimpleNamespace(
+        Entry=DummyEntry,
+        StringVar=DummyStringVar,
+        BooleanVar=DummyStringVar,
+        END=0,
+        DISABLED="disabled",
+        NORMAL="normal",
+        TclError=tk.TclError,
+    )
+    monkeypatch.setattr(ui, "tk", tk_mod)
+
+    class DummyImage:
+        size = (100, 100)
+
+        def copy(self):
+            return self
+
+    monkeypatch.setattr(ui, "_decode_card_scan", lambda path: DummyImage())
+    monkeypatch.setattr(ui, "_create_image", lambda img: object())
+    resolved = []
+    real_resetter = ui._entry_resetter
+
+    def track(key, entry):
+        resolved.append(key)
+        return real_resetter(key, entry)
+
+    monkeypatch.setattr(ui, "_entry_resetter", track)
+
+    lang = DummyStringVar("JP")
+    stan = DummyStringVar("LP")
+    dummy = SimpleNamespace(
+        cards=cards,
+        index=0,
+        image_objects=[],
+        image_label=SimpleNamespace(configure=lambda *a, **k: None),
+        progress_var=SimpleNamespace(set=lambda *a, **k: None),
+        entries={"nazwa": DummyEntry(), "język": lang, "stan": stan},
+        type_vars={},
+        card_cache={},
+        file_to_key={},
+        _guess_key_from_filename=lambda *a, **k: None,
+        lookup_inventory_entry=lambda *a, **k: None,
+        update_set_options=lambda *a, **k: None,
+        root=SimpleNamespace(after=lambda delay, func: func()),
+        auto_lookup=False,
+        _analyze_and_fill=lambda *a, **k: None,
+    )
+
+    ui.CardEditorApp.show_card(dummy)
+    lang.set("JP")
+    dummy.index = 1
+    ui.CardEditorApp.show_card(dummy)
+
+    assert sorted(resolved) == sorted(["nazwa", "stan", "język"])
+    assert lang.value == "ENG"
+    assert stan.value == "NM"
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+from PIL import Image
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import kartoteka.ui as ui
+from tests.ctk_mocks import DummyCTkFrame, DummyCTkLabel, DummyCTkButton
+
+
+def _show(monkeypatch, loaded):
+    scheduled = []
+    top = SimpleNamespace(
+        title=lambda t: None,
+        geometry=lambda *a, **k: None,
+        minsize=lambda *a, **k: None,
+        after=lambda ms, fn: scheduled.append(fn),
+    )
+    labels = []
+
+    def make_label(*args, **kwargs):
+        label = DummyCTkLabel(*args, **kwargs)
+        labels.append(label)
+        return label
+
+    monkeypatch.setattr(ui.ctk, "CTkToplevel", lambda master: top)
+    monkeypatch.setattr(ui.ctk, "CTkFrame", DummyCTkFrame)
+    monkeypatch.setattr(ui.ctk, "CTkLabel", make_label)
+    monkeypatch.setattr(ui.ctk, "CTkButton", DummyCTkButton)
+    monkeypatch.setattr(ui, "_load_image", lambda path: loaded)
+    monkeypatch.setattr(ui, "_create_image", lambda img: SimpleNamespace(size=img.size))
+    app = SimpleNamespace(root=None, mark_as_sold=lambda *a, **k: None)
+    ui.CardEditorApp.show_card_details(app, {"name": "A", "image": "http://x/a.png"})
+    ui._MAG_IMAGE_POOL.submit(lambda: None).result()
+    return labels[0], scheduled
+
+
+def test_scan_loaded_after_window_opens(monkeypatch):
+    label, scheduled = _show(monkeypatch, Image.new("RGB", (600, 400)))
+    assert label.image.size == (300, 300)
+    assert label.text == ""
+
+    # wait for the worker to hand the scan back to the Tk loop
+    for _ in range(100):
+        if scheduled:
+            break
+        ui.time.sleep(0.01)
+    scheduled[0]()
+    assert label.image.size == (300, 200)
+    assert label.text == ""
+
+
+def test_missing_scan_reported_after_load(monkeypatch):
+    label, scheduled = _show(monkeypatch, None)
+    for _ in range(100):
+        if scheduled:
+            break
+        ui.time.sleep(0.01)
+    scheduled[0]()
+    assert label.text == "Brak skanu"
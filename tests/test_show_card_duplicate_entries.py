@@ -52,6 +52,7 @@ def test_show_card_warns_on_magazyn_duplicate(tmp_path, monkeypatch):
     set_var = SimpleNamespace(set=lambda *a, **k: None)
 
     dummy = SimpleNamespace(
+        in_scan=True,
         cards=[str(img)],
         index=0,
         image_objects=[],
@@ -82,6 +83,17 @@ def test_show_card_warns_on_magazyn_duplicate(tmp_path, monkeypatch):
     monkeypatch.setattr(ui, "load_rgba_image", lambda path: DummyImage())
     monkeypatch.setattr(ui.ctk, "CTkEntry", DummyCTkEntry, raising=False)
 
+    class DummyThread:
+        def __init__(self, target, args=(), kwargs=None, daemon=None):
+            self.target = target
+            self.args = args
+
+        def start(self):
+            self.target(*self.args)
+
+    # the fingerprint lookup runs on a worker thread; run it inline
+    monkeypatch.setattr(ui.threading, "Thread", DummyThread)
+
     dup_rows = [{"warehouse_code": "K1"}]
     find_mock = MagicMock(return_value=dup_rows)
     monkeypatch.setattr(ui.csv_utils, "find_duplicates", find_mock)
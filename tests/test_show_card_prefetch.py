@@ -0,0 +1,140 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+import tkinter as tk
+
+sys.modules.setdefault("customtkinter", MagicMock())
+sys.modules.setdefault("openai", MagicMock())
+sys.modules.setdefault("dotenv", MagicMock(load_dotenv=lambda *a, **k: None, set_key=lambda *a, **k: None))
+sys.modules.setdefault("pydantic", MagicMock(BaseModel=object))
+sys.modules.setdefault("pytesseract", MagicMock())
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+import kartoteka.ui as ui  # noqa: E402
+
+
+class DummyImage:
+    size = (100, 100)
+
+    def thumbnail(self, *a, **k):
+        pass
+
+    def copy(self):
+        return self
+
+
+def test_next_scan_decoded_ahead(tmp_path, monkeypatch):
+    cards = []
+    for name in ("a.jpg", "b.jpg"):
+        path = tmp_path / name
+        path.write_bytes(b"data")
+        cards.append(str(path))
+
+    loaded = []
+
+    def load(path):
+        loaded.append(path)
+        return DummyImage()
+
+    tk_mod = SimpleNamespace(
+        Entry=type("Entry", (), {}),
+        StringVar=type("StringVar", (), {}),
+        BooleanVar=type("BooleanVar", (), {}),
+        END=0,
+        NORMAL="normal",
+        TclError=tk.TclError,
+    )
+    monkeypatch.setattr(ui, "tk", tk_mod)
+    monkeypatch.setattr(ui, "load_rgba_image", load)
+    monkeypatch.setattr(ui, "_create_image", lambda img: object())
+
+    app = SimpleNamespace(
+        cards=cards,
+        index=0,
+        image_objects=[],
+        image_label=SimpleNamespace(configure=lambda *a, **k: None),
+        progress_var=SimpleNamespace(set=lambda *a, **k: None),
+        entries={"nazwa": SimpleNamespace(focus_set=lambda: None)},
+        type_vars={},
+        card_cache={},
+        file_to_key={},
+        _guess_key_from_filename=lambda *a, **k: None,
+        lookup_inventory_entry=lambda *a, **k: None,
+        update_set_options=lambda *a, **k: None,
+        root=SimpleNamespace(after=lambda delay, func: func()),
+        auto_lookup=False,
+        _analyze_and_fill=lambda *a, **k: None,
+    )
+
+    ui.CardEditorApp.show_card(app)
+    assert list(app._card_prefetch) == cards[1:]
+    app._card_prefetch[cards[1]].result()
+    assert loaded == cards
+
+    app.index = 1
+    ui.CardEditorApp.show_card(app)
+    # the second card came from the prefetch; nothing decoded again
+    assert loaded == cards
+    assert app._card_prefetch == {}
+
+
+def test_prefetch_window_follows_jumps(tmp_path, monkeypatch):
+    cards = [str(tmp_path / f"{i}.jpg") for i in range(6)]
+
+    class FakeFuture:
+        def __init__(self, path):
+            self.path = path
+            self.cancelled = False
+
+        def result(self):
+            return DummyImage()
+
+        def cancel(self):
+            self.cancelled = True
+
+    submitted = []
+
+    def submit(fn, path):
+        fut = FakeFuture(path)
+        submitted.append(fut)
+        return fut
+
+    monkeypatch.setattr(ui, "_MAG_IMAGE_POOL", SimpleNamespace(submit=submit))
+    monkeypatch.setattr(ui, "_decode_card_scan", lambda path: DummyImage())
+    monkeypatch.setattr(ui, "_create_image", lambda img: object())
+    monkeypatch.setattr(
+        ui,
+        "tk",
+        SimpleNamespace(
+            END=0,
+            NORMAL="normal",
+            TclError=tk.TclError,
+            StringVar=type("StringVar", (), {}),
+        ),
+    )
+    app = SimpleNamespace(
+        cards=cards,
+        index=0,
+        image_objects=[],
+        image_label=SimpleNamespace(configure=lambda *a, **k: None),
+        progress_var=SimpleNamespace(set=lambda *a, **k: None),
+        entries={"nazwa": SimpleNamespace(focus_set=lambda: None)},
+        type_vars={},
+        card_cache={},
+        file_to_key={},
+        _guess_key_from_filename=lambda *a, **k: None,
+        lookup_inventory_entry=lambda *a, **k: None,
+        update_set_options=lambda *a, **k: None,
+        root=SimpleNamespace(after=lambda delay, func: func()),
+        auto_lookup=False,
+        _analyze_and_fill=lambda *a, **k: None,
+    )
+
+    ui.CardEditorApp.show_card(app)
+    assert list(app._card_prefetch) == cards[1:4]
+
+    app.index = 4
+    ui.CardEditorApp.show_card(app)
+    assert list(app._card_prefetch) == cards[5:]
+    assert [f.path for f in submitted if f.cancelled] == cards[1:4]
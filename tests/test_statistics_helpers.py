@@ -50,3 +50,43 @@ def test_get_statistics_handles_missing_added_at(tmp_path, caplog):
     assert stats["cumulative"]["count"] == 1
     assert stats["daily"][today.isoformat()] == {"added": 1, "sold": 0}
     assert any("Missing added_at" in record.message for record in caplog.records)
+
+
+def test_daily_series_returns_count_arrays():
+    daily = {
+        "2025-09-01": {"added": 2, "sold": 1},
+        "2025-09-02": {"added": 0},
+        "2025-09-03": {"added": 3, "sold": 2},
+    }
+    dates, added, sold = stats_utils.daily_series(daily)
+    assert dates == ["2025-09-01", "2025-09-02", "2025-09-03"]
+    assert added.tolist() == [2, 0, 3]
+    assert sold.tolist() == [1, 0, 2]
+
+
+def test_daily_series_empty():
+    dates, added, sold = stats_utils.daily_series({})
+    assert dates == []
+    assert len(added) == 0 and len(sold) == 0
+
+
+def test_get_statistics_daily_fills_gaps(tmp_path):
+    csv_path = tmp_path / "magazyn.csv"
+    csv_path.write_text(
+        "name;number;set;warehouse_code;price;image;variant;sold;added_at\n"
+        "A;1;Set1;K1R1P0001;10;;common;1;2025-09-03\n"
+        "B;2;Set1;K1R1P0002;5;;common;1;2025-09-03\n"
+        "C;3;Set2;K2R1P0001;8;;common;;2025-09-01\n"
+        "D;4;Set3;K2R1P0002;7;;common;1;2025-10-01\n",
+        encoding="utf-8",
+    )
+    stats = stats_utils.get_statistics(
+        date(2025, 9, 1), date(2025, 9, 4), path=str(csv_path)
+    )
+    assert stats["daily"] == {
+        "2025-09-01": {"added": 1, "sold": 0},
+        "2025-09-02": {"added": 0, "sold": 0},
+        "2025-09-03": {"added": 2, "sold": 2},
+        "2025-09-04": {"added": 0, "sold": 0},
+    }
+    assert stats["max_order"] == 2
@@ -106,3 +106,29 @@ def test_analyze_and_fill_uses_collection_export(monkeypatch, tmp_path):
     ui.CardEditorApp._analyze_and_fill(dummy, "x", 0)
     assert era_var.value == "EraX"
     price_entry.insert.assert_called_with(0, "99")
+
+
+def test_analyze_and_fill_skips_analysis_for_catalogued_filename(monkeypatch, tmp_path):
+    csv_path = tmp_path / "collection.csv"
+    _create_collection_csv(csv_path)
+    applied = []
+    dummy = SimpleNamespace(
+        root=SimpleNamespace(after=lambda delay, func: func()),
+        collection_data=csv_utils.load_collection_export(str(csv_path)),
+        hash_db=MagicMock(),
+        auto_lookup=True,
+        _apply_analysis_result=lambda result, idx: applied.append(result),
+    )
+    monkeypatch.setattr(
+        ui, "analyze_card_image", MagicMock(side_effect=AssertionError("analysed"))
+    )
+    monkeypatch.setattr(
+        ui, "_cached_fingerprint", MagicMock(side_effect=AssertionError("fingerprinted"))
+    )
+    monkeypatch.setattr(csv_utils, "build_product_code", lambda s, n, v: f"PKM-PAL-{n}")
+
+    ui.CardEditorApp._analyze_and_fill(dummy, "scans/Pikachu_1_Paldea Evolved.jpg", 0)
+
+    assert applied[0]["product_code"] == "PKM-PAL-1"
+    assert applied[0]["warehouse_code"] == "K1R1P1"
+    assert applied[0]["price"] == "99"
@@ -0,0 +1,152 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).resolve().parent))
+from ctk_mocks import load_ui  # noqa: E402
+
+
+def test_thumbnail_written_once_and_reused(tmp_path, monkeypatch):
+    ui = load_ui()
+    cache_dir = tmp_path / "thumbs"
+    monkeypatch.setattr(ui, "THUMB_CACHE_DIR", str(cache_dir))
+    src = tmp_path / "sv2.png"
+    ui.Image.new("RGB", (400, 200), "red").save(src)
+
+    first = ui._cached_thumbnail(str(src), (40, 40))
+    assert first.size == (40, 20)
+    assert len(list(cache_dir.glob("*.png"))) == 1
+
+    with patch.object(ui, "load_rgba_image", wraps=ui.load_rgba_image) as load_mock:
+        again = ui._cached_thumbnail(str(src), (40, 40))
+    assert again.size == (40, 20)
+    # only the cached PNG was opened, not the source
+    load_mock.assert_called_once()
+    assert Path(load_mock.call_args[0][0]).parent == cache_dir
+
+    # a different target size gets its own entry
+    ui._cached_thumbnail(str(src), (20, 20))
+    assert len(list(cache_dir.glob("*.png"))) == 2
+
+
+def test_thumbnail_cache_misses_after_late_edit(tmp_path, monkeypatch):
+    ui = load_ui()
+    monkeypatch.setattr(ui, "THUMB_CACHE_DIR", str(tmp_path / "thumbs"))
+    src = tmp_path / "scan.bmp"
+    # uncompressed, so the two images share their first 64 KiB and size
+    top = ui.Image.new("RGB", (200, 400), "red")
+    top.save(src)
+    ui._cached_thumbnail(str(src), (40, 40))
+
+    edited = top.copy()
+    edited.paste("blue", (0, 0, 200, 100))  # BMP rows are stored bottom-up
+    edited.save(src)
+    data = src.read_bytes()
+    assert len(data) > 64 * 1024
+    thumb = ui._cached_thumbnail(str(src), (40, 40))
+    assert thumb.getpixel((10, 2))[:3] == (0, 0, 255)
+
+
+def test_thumbnail_cache_write_failure_ignored(tmp_path, monkeypatch):
+    ui = load_ui()
+    blocker = tmp_path / "file"
+    blocker.write_text("x")
+    monkeypatch.setattr(ui, "THUMB_CACHE_DIR", str(blocker / "thumbs"))
+    src = tmp_path / "logo.png"
+    ui.Image.new("RGB", (80, 80), "blue").save(src)
+
+    assert ui._cached_thumbnail(str(src), (40, 40)).size == (40, 40)
+    assert ui._cached_thumbnail(str(tmp_path / "missing.png"), (40, 40)) is None
+
+
+def test_scaled_image_prefers_libvips(tmp_path, monkeypatch):
+    ui = load_ui()
+    src = tmp_path / "scan.png"
+    ui.Image.new("RGB", (800, 1120), "green").save(src)
+    calls = []
+
+    class FakeThumb:
+        format = "uchar"
+        interpretation = "srgb"
+        bands = 3
+        width = 400
+        height = 560
+
+        def write_to_memory(self):
+            return ui.Image.new("RGB", (400, 560), "green").tobytes()
+
+    def thumbnail(path, width, height, size, no_rotate):
+        # EXIF orientation is left alone, as in the PIL fallback
+        assert no_rotate is True
+        calls.append((path, width, height, size))
+        return FakeThumb()
+
+    fake = SimpleNamespace(
+        Image=SimpleNamespace(thumbnail=thumbnail), Error=RuntimeError
+    )
+    monkeypatch.setattr(ui, "_pyvips", fake)
+    img = ui._decode_card_scan(str(src))
+    assert calls == [(str(src), 400, 560, "down")]
+    assert img.size == (400, 560) and img.mode == "RGBA"
+    assert img.getpixel((0, 0)) == (0, 128, 0, 255)
+
+    monkeypatch.setattr(ui, "_pyvips", None)
+    assert ui._decode_card_scan(str(src)).size == (400, 560)
+
+
+def test_set_logos_decoded_lazily_and_bounded(tmp_path, monkeypatch):
+    ui = load_ui()
+    monkeypatch.setattr(ui, "THUMB_CACHE_DIR", str(tmp_path / "thumbs"))
+    logo_dir = tmp_path / "logos"
+    logo_dir.mkdir()
+    for code in ("a", "b", "c"):
+        ui.Image.new("RGB", (80, 40), "red").save(logo_dir / f"{code}.png")
+    monkeypatch.setattr(ui, "SET_LOGO_DIR", str(logo_dir))
+    monkeypatch.setattr(ui, "ALLOWED_SET_CODES", set())
+    monkeypatch.setattr(ui, "SET_LOGO_CACHE_SIZE", 2)
+    monkeypatch.setattr(ui, "_create_image", lambda img: SimpleNamespace(size=img.size))
+
+    app = SimpleNamespace(set_logos=ui.OrderedDict(), _set_logo_paths={})
+    with patch.object(ui, "_cached_thumbnail", wraps=ui._cached_thumbnail) as thumb:
+        ui.CardEditorApp.load_set_logos(app)
+        thumb.assert_not_called()
+
+        first = ui.CardEditorApp.get_set_logo(app, "a")
+        assert ui.CardEditorApp.get_set_logo(app, "a") is first
+        assert thumb.call_count == 1
+
+        ui.CardEditorApp.get_set_logo(app, "b")
+        ui.CardEditorApp.get_set_logo(app, "c")
+    assert list(app.set_logos) == ["b", "c"]
+    assert ui.CardEditorApp.get_set_logo(app, "zzz") is None
+
+
+def test_set_logo_dir_rescanned_only_when_changed(tmp_path, monkeypatch):
+    ui = load_ui()
+    logo_dir = tmp_path / "logos"
+    logo_dir.mkdir()
+    (logo_dir / "a.png").write_bytes(b"")
+    (logo_dir / "notes.txt").write_text("x")
+    (logo_dir / "b.gif").mkdir()
+    monkeypatch.setattr(ui, "SET_LOGO_DIR", str(logo_dir))
+    monkeypatch.setattr(ui, "ALLOWED_SET_CODES", set())
+
+    app = SimpleNamespace(set_logos=ui.OrderedDict())
+    ui.CardEditorApp.load_set_logos(app)
+    assert list(app._set_logo_paths) == ["a"]
+
+    app.set_logos["a"] = "decoded"
+    with patch.object(ui.os, "scandir", wraps=ui.os.scandir) as scan:
+        ui.CardEditorApp.load_set_logos(app)
+        scan.assert_not_called()
+    assert app.set_logos["a"] == "decoded"
+
+    monkeypatch.setattr(ui, "ALLOWED_SET_CODES", {"c"})
+    ui.CardEditorApp.load_set_logos(app)
+    assert app._set_logo_paths == {} and not app.set_logos
+
+    # updated in place: same object, different codes
+    ui.ALLOWED_SET_CODES.add("a")
+    ui.CardEditorApp.load_set_logos(app)
+    assert list(app._set_logo_paths) == ["a"]
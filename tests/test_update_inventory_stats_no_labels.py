@@ -19,3 +19,24 @@ def test_update_inventory_stats_without_labels(monkeypatch):
     )
     app = SimpleNamespace()
     ui.CardEditorApp.update_inventory_stats(app)
+
+
+def test_update_inventory_stats_skips_unchanged_labels(monkeypatch):
+    stats = [(1, 2.0, 3, 4.0)]
+    monkeypatch.setattr(
+        ui.csv_utils,
+        "get_inventory_stats",
+        lambda path=ui.csv_utils.WAREHOUSE_CSV, force=False: stats[0],
+    )
+    monkeypatch.setattr(ui.csv_utils, "get_daily_additions", lambda: {})
+    label = MagicMock()
+    label.winfo_exists.return_value = True
+    app = SimpleNamespace(mag_inventory_count_label=label)
+
+    ui.CardEditorApp.update_inventory_stats(app)
+    ui.CardEditorApp.update_inventory_stats(app)
+    assert label.configure.call_count == 1
+
+    stats[0] = (2, 2.0, 3, 4.0)
+    ui.CardEditorApp.update_inventory_stats(app)
+    assert label.configure.call_count == 2